@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Compare per-request JWT handling before and after the verified-token cache.
+
+"before" is what get_current_token used to do: validate_jwt (HS256 verify +
+AES-GCM decrypt of the tok claim) followed by get_jwt_meta (a second decode).
+"after" is verify_jwt with a warm cache, i.e. a returning user.
+
+    python scripts/bench_jwt_verify.py --tokens 100 --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MAIN_APP_URL", "http://main-app.invalid")
+os.environ.setdefault("CONNECTOR_API_KEY", "bench")
+os.environ.setdefault("OAUTH_CLIENT_SECRET", "bench")
+os.environ.setdefault("JWT_SECRET", "bench-jwt-secret-that-is-long-enough")
+os.environ.setdefault("ENCRYPTION_KEY", "0" * 64)
+os.environ.setdefault("HMAC_SHARED_SECRET", "bench")
+
+from jose import jwt  # noqa: E402
+
+from src.core.config import get_settings  # noqa: E402
+from src.core.crypto import decrypt  # noqa: E402
+from src.core.jwt import clear_verified_jwt_cache, create_jwt, get_jwt_meta, verify_jwt  # noqa: E402
+
+
+def _uncached(token: str) -> None:
+    secret = get_settings().JWT_SECRET
+    payload = jwt.decode(token, secret, algorithms=["HS256"])
+    decrypt(payload["tok"])
+    get_jwt_meta(token)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    tokens = [create_jwt(user_id, f"sanctum|{user_id}") for user_id in range(1, args.tokens + 1)]
+    stream = [tokens[i % len(tokens)] for i in range(args.requests)]
+
+    started = time.perf_counter()
+    for token in stream:
+        _uncached(token)
+    before = time.perf_counter() - started
+
+    clear_verified_jwt_cache()
+    started = time.perf_counter()
+    for token in stream:
+        verify_jwt(token)
+    after = time.perf_counter() - started
+
+    per_request = 1_000_000 / len(stream)
+    print(f"tokens={len(tokens)} requests={len(stream)}")
+    print(f"decode twice + decrypt  {before * per_request:8.1f} us/request")
+    print(f"verify_jwt (cached)     {after * per_request:8.1f} us/request")
+    print(f"speed-up x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Compare PetNameIndex lookups with the linear name filters.
+
+Builds a synthetic account of N pets (Vietnamese and English names, some with
+diacritics) and times a batch of find_pet-style queries against:
+
+- the filter find_pet used before the index (case-insensitive only),
+- filter_pet_candidates as it is now (accent-folding linear scan, the same
+  matches as the index),
+- PetNameIndex, with and without the fuzzy fallback, and with its build cost
+  spread over 1, 10 and 100 searches (it is rebuilt after every cache expiry
+  or pet write),
+
+and the species-only filter used when no name is given.
+
+    python scripts/bench_pet_name_index.py --pets 10000 --queries 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.pets_normalization import PetNameIndex, filter_pet_candidates  # noqa: E402
+
+_SYLLABLES = [
+    "Bông", "Mít", "Đậu", "Na", "Mây", "Sữa", "Cún", "Miu", "Bơ", "Tôm",
+    "Mi", "Lo", "Ki", "Ra", "Bel", "Max", "Lu", "Coco", "Tiger", "Kem",
+]
+_SPECIES = ["cat", "dog", "rabbit", "bird"]
+
+
+def _previous_filter(pets: list[dict[str, Any]], name: str | None, species: str | None) -> list[dict[str, Any]]:
+    """filter_pet_candidates as it was before the index, verbatim (no accent folding)."""
+    filtered = pets
+    if species:
+        species_lower = species.strip().lower()
+        filtered = [
+            pet for pet in filtered
+            if isinstance(pet.get("species"), str) and pet["species"].strip().lower() == species_lower
+        ]
+    if name:
+        name_lower = name.strip().lower()
+        filtered = [
+            pet for pet in filtered
+            if isinstance(pet.get("name"), str) and name_lower in pet["name"].strip().lower()
+        ]
+        filtered.sort(
+            key=lambda pet: (
+                0 if pet.get("name", "").strip().lower() == name_lower else 1,
+                pet.get("name", "").strip().lower(),
+            )
+        )
+    return filtered
+
+
+def _make_pets(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": pet_id,
+            "name": " ".join(rng.sample(_SYLLABLES, rng.randint(1, 2))) + f" {pet_id}",
+            "species": rng.choice(_SPECIES),
+        }
+        for pet_id in range(1, count + 1)
+    ]
+
+
+def _make_queries(pets: list[dict[str, Any]], count: int, rng: random.Random) -> list[str]:
+    queries = []
+    for _ in range(count):
+        name = rng.choice(pets)["name"]
+        kind = rng.random()
+        if kind < 0.5:
+            queries.append(name)  # exact
+        elif kind < 0.8:
+            start = rng.randint(0, max(0, len(name) - 4))
+            queries.append(name[start : start + 4])  # substring
+        else:
+            queries.append(name[:-1] + "x")  # typo
+    return queries
+
+
+def _time(call: Any) -> float:
+    started = time.perf_counter()
+    call()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pets", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pets = _make_pets(args.pets, rng)
+    queries = _make_queries(pets, args.queries, rng)
+
+    def timed(search: Any) -> float:
+        started = time.perf_counter()
+        for query in queries:
+            search(query)
+        return time.perf_counter() - started
+
+    previous_seconds = timed(lambda query: _previous_filter(pets, query, None))
+
+    # The first folding scan fills the fold memo; later scans reuse it.
+    started = time.perf_counter()
+    filter_pet_candidates(pets, name=queries[0])
+    cold_scan_seconds = time.perf_counter() - started
+    scan_seconds = timed(lambda query: filter_pet_candidates(pets, name=query))
+
+    started = time.perf_counter()
+    index = PetNameIndex((pet["name"], pet["species"]) for pet in pets)
+    build_seconds = time.perf_counter() - started
+
+    index_seconds = timed(lambda query: index.search(name=query))
+    fuzzy_seconds = timed(lambda query: index.search(name=query, fuzzy=True))
+
+    # Without a name only the species filter runs; no index is built for it.
+    species = [rng.choice(_SPECIES) for _ in queries]
+    previous_species_seconds = sum(
+        _time(lambda value=value: _previous_filter(pets, None, value)) for value in species
+    )
+    species_seconds = sum(_time(lambda value=value: filter_pet_candidates(pets, species=value)) for value in species)
+
+    # The index must find exactly what the folding scan finds.
+    for query in queries:
+        expected = {pet["id"] for pet in filter_pet_candidates(pets, name=query)}
+        found = {pets[match.position]["id"] for match in index.search(name=query)}
+        assert found == expected, query
+
+    per_query = 1000 / len(queries)
+    index_per_query = index_seconds * per_query
+    print(f"pets={len(pets)} queries={len(queries)}")
+    print("name queries")
+    print(f"  previous filter          {previous_seconds * per_query:8.3f} ms/query (case-insensitive only)")
+    print(f"  folding scan, cold       {cold_scan_seconds * 1000:8.3f} ms (first call, fills the fold memo)")
+    print(f"  folding scan, warm       {scan_seconds * per_query:8.3f} ms/query (filter_pet_candidates)")
+    print(f"  index build              {build_seconds * 1000:8.3f} ms (per pet-list load, cache TTL or write)")
+    print(f"  index search             {index_per_query:8.3f} ms/query")
+    print(f"  index with fuzzy         {fuzzy_seconds * per_query:8.3f} ms/query")
+    print("name queries, index build included")
+    for searches in (1, 10, 100):
+        total = build_seconds * 1000 / searches + index_per_query
+        print(f"  {searches:>3} searches per build   {total:8.3f} ms/query")
+    print("no name filter (species only)")
+    print(f"  previous filter          {previous_species_seconds * per_query:8.3f} ms/query")
+    print(f"  filter_pet_candidates    {species_seconds * per_query:8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
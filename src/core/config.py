@@ -1,8 +1,26 @@
 from functools import lru_cache
+from typing import Literal, Self
 
-from pydantic import field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+RateLimitAlgorithm = Literal["fixed_window", "token_bucket", "gcra"]
+
+
+class RateLimitRule(BaseModel):
+    """Override of the default rate limit for a route, an identity, or both.
+
+    ``route`` is "METHOD /path/template" (e.g. "POST /pets") or just the template
+    for every method; ``identity`` is "user:<id>" or "ip:<address>".
+    """
+
+    route: str | None = None
+    identity: str | None = None
+    limit: int = Field(gt=0)
+    period_seconds: float = Field(default=60.0, gt=0)
+    algorithm: RateLimitAlgorithm | None = None
+    burst: int | None = Field(default=None, gt=0)
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -18,6 +36,8 @@ class Settings(BaseSettings):
     OAUTH_CLIENT_SECRET: str
     JWT_SECRET: str
     ENCRYPTION_KEY: str  # 32-byte hex for AES-256-GCM
+    ENCRYPTION_KEY_ID: str = "k1"
+    ENCRYPTION_RETIRED_KEYS: str = ""  # "kid:hex,kid:hex" — still accepted for decryption
     HMAC_SHARED_SECRET: str
     REDIS_URL: str = "redis://localhost:6379"
     LOG_LEVEL: str = "info"
@@ -25,6 +45,84 @@ class Settings(BaseSettings):
     ADMIN_ENABLED: bool = False
     ADMIN_PASSWORD: str = ""
     RATE_LIMIT_PER_MINUTE: int = 60
+    RATE_LIMIT_ALGORITHM: RateLimitAlgorithm = "fixed_window"
+    RATE_LIMIT_BURST: int = 0  # token_bucket / gcra burst size; 0 means the per-minute limit
+    RATE_LIMIT_RULES: list[RateLimitRule] = []  # JSON list of RateLimitRule
+
+    # Cache of verified JWTs (entries never outlive the token's exp; 0 disables)
+    JWT_VERIFY_CACHE_SIZE: int = 4096
+    JWT_VERIFY_CACHE_TTL_SECONDS: float = 300.0
+
+    # In-process copy of the JWT blacklist, kept in sync over Redis pub/sub
+    JWT_REVOCATION_LOCAL_FILTER: bool = True
+    JWT_REVOCATION_RESYNC_SECONDS: float = 300.0
+
+    # Shared upstream HTTP client (one connection pool per process)
+    MAIN_APP_TIMEOUT_SECONDS: float = 10.0
+    MAIN_APP_MAX_CONNECTIONS: int = 100
+    MAIN_APP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    MAIN_APP_KEEPALIVE_EXPIRY: float = 30.0
+    MAIN_APP_HTTP2: bool = False
+    MAIN_APP_COALESCE_GETS: bool = True
+
+    # Laravel-paginated upstream lists (remaining pages are fetched concurrently)
+    MAIN_APP_PAGE_CONCURRENCY: int = 4
+    MAIN_APP_MAX_PAGES: int = 50
+
+    # Conditional GETs (ETag / Last-Modified revalidation of cached bodies)
+    MAIN_APP_CONDITIONAL_GETS: bool = True
+    MAIN_APP_VALIDATOR_CACHE_SIZE: int = 2048
+    MAIN_APP_VALIDATOR_CACHE_TTL_SECONDS: float = 3600.0
+
+    # Adaptive (AIMD) concurrency limit for main app calls
+    MAIN_APP_ADAPTIVE_CONCURRENCY: bool = True
+    MAIN_APP_CONCURRENCY_INITIAL: int = 20
+    MAIN_APP_CONCURRENCY_MIN: int = 4
+    MAIN_APP_CONCURRENCY_MAX: int = 100
+    MAIN_APP_LATENCY_TARGET_SECONDS: float = 1.0
+    MAIN_APP_QUEUE_TIMEOUT_SECONDS: float = 5.0
+
+    # Retries for idempotent (GET) main app calls
+    MAIN_APP_RETRY_ATTEMPTS: int = 2
+    MAIN_APP_RETRY_BASE_DELAY: float = 0.2
+    MAIN_APP_RETRY_MAX_DELAY: float = 2.0
+    MAIN_APP_RETRY_BUDGET_RATIO: float = 0.1
+    MAIN_APP_RETRY_BUDGET_MAX_TOKENS: float = 10.0
+
+    # Circuit breaker around main app calls
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = 2
+
+    # pets_overview per-pet health fan-out
+    OVERVIEW_MAX_CONCURRENCY: int = 10
+    OVERVIEW_PET_TIMEOUT_SECONDS: float = 2.0
+    OVERVIEW_LATENCY_BUDGET_SECONDS: float = 2.5
+
+    # Encrypted per-user pets_overview snapshot in Redis, rebuilt in the background
+    OVERVIEW_SNAPSHOT_ENABLED: bool = False
+    OVERVIEW_SNAPSHOT_TTL_SECONDS: int = 900
+    OVERVIEW_SNAPSHOT_REFRESH_SECONDS: float = 300.0
+    OVERVIEW_SNAPSHOT_IDLE_SECONDS: float = 3600.0
+
+    # Pet types table: periodic reload (0 disables) and reload on an unknown species
+    PET_TYPES_REFRESH_SECONDS: float = 3600.0
+    PET_TYPES_REFRESH_JITTER: float = 0.1
+    PET_TYPES_MISS_REFRESH_SECONDS: float = 60.0
+    # Share the table between workers through Redis (versioned blob + pub/sub)
+    PET_TYPES_SHARED_CACHE: bool = True
+
+    # Per-user read-through cache of /api/my-pets (0 disables)
+    PETS_CACHE_TTL_SECONDS: float = 30.0
+    PETS_CACHE_MAX_USERS: int = 1024
+
+    # Per-(user, pet) vaccinations/weights cache for pets_overview (stale-while-revalidate)
+    PET_HEALTH_CACHE_FRESH_SECONDS: float = 60.0
+    PET_HEALTH_CACHE_STALE_SECONDS: float = 600.0
+    PET_HEALTH_CACHE_MAX_ENTRIES: int = 4096
 
     @field_validator("MAIN_APP_URL")
     @classmethod
@@ -50,6 +148,31 @@ class Settings(BaseSettings):
             raise ValueError("ENCRYPTION_KEY must decode to exactly 32 bytes (64 hex chars)")
         return v
 
+    @field_validator("ENCRYPTION_KEY_ID")
+    @classmethod
+    def validate_encryption_key_id(cls, v: str) -> str:
+        if not v or len(v.encode()) > 32 or not v.isascii():
+            raise ValueError("ENCRYPTION_KEY_ID must be 1-32 ASCII characters")
+        return v
+
+    @field_validator("ENCRYPTION_RETIRED_KEYS")
+    @classmethod
+    def validate_retired_keys(cls, v: str) -> str:
+        from src.core.keyring import parse_retired_keys
+
+        for key_id, key_hex in parse_retired_keys(v).items():
+            cls.validate_encryption_key_id(key_id)
+            cls.validate_encryption_key(key_hex)
+        return v
+
+    @model_validator(mode="after")
+    def validate_retired_key_ids(self) -> Self:
+        from src.core.keyring import parse_retired_keys
+
+        if self.ENCRYPTION_KEY_ID in parse_retired_keys(self.ENCRYPTION_RETIRED_KEYS):
+            raise ValueError("ENCRYPTION_RETIRED_KEYS must not reuse ENCRYPTION_KEY_ID")
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
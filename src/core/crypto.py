@@ -1,28 +1,51 @@
 import base64
 import os
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
 
 from src.core.config import get_settings
+from src.core.keyring import get_keyring
 
 _NONCE_SIZE = 12  # 96-bit nonce — standard recommendation for AES-GCM
+# Versioned format: magic || len(kid) || kid || nonce || ciphertext+tag, with the
+# header authenticated as associated data. Values without the magic are the
+# original format, nonce || ciphertext+tag, and are tried against every key.
+_MAGIC = b"\xc7\x01"
 
 
-def _get_key() -> bytes:
-    return bytes.fromhex(get_settings().ENCRYPTION_KEY)
+def _header(key_id: str) -> bytes:
+    kid = key_id.encode()
+    return _MAGIC + bytes([len(kid)]) + kid
 
 
 def encrypt(plaintext: str) -> str:
-    """AES-256-GCM encrypt. Returns URL-safe base64(nonce || ciphertext+tag)."""
-    key = _get_key()
+    """AES-256-GCM encrypt with the primary key. Returns URL-safe base64(header || nonce || ciphertext+tag)."""
+    keyring = get_keyring(get_settings())
+    header = _header(keyring.primary_id)
     nonce = os.urandom(_NONCE_SIZE)
-    ciphertext = AESGCM(key).encrypt(nonce, plaintext.encode(), None)
-    return base64.urlsafe_b64encode(nonce + ciphertext).decode()
+    ciphertext = keyring.primary.encrypt(nonce, plaintext.encode(), header)
+    return base64.urlsafe_b64encode(header + nonce + ciphertext).decode()
 
 
 def decrypt(encrypted: str) -> str:
-    """AES-256-GCM decrypt. Raises InvalidTag on any tampering."""
-    key = _get_key()
+    """AES-256-GCM decrypt with whichever ring key encrypted the value. Raises InvalidTag on any tampering."""
+    keyring = get_keyring(get_settings())
     raw = base64.urlsafe_b64decode(encrypted)
+
+    if raw[: len(_MAGIC)] == _MAGIC and len(raw) > len(_MAGIC):
+        header_end = len(_MAGIC) + 1 + raw[len(_MAGIC)]
+        cipher = keyring.ciphers.get(raw[len(_MAGIC) + 1 : header_end].decode(errors="replace"))
+        if cipher is not None:
+            nonce, ciphertext = raw[header_end : header_end + _NONCE_SIZE], raw[header_end + _NONCE_SIZE :]
+            try:
+                return cipher.decrypt(nonce, ciphertext, raw[:header_end]).decode()
+            except InvalidTag:
+                pass  # may still be an original-format value whose nonce starts with the magic
+
     nonce, ciphertext = raw[:_NONCE_SIZE], raw[_NONCE_SIZE:]
-    return AESGCM(key).decrypt(nonce, ciphertext, None).decode()
+    for cipher in keyring.ciphers.values():
+        try:
+            return cipher.decrypt(nonce, ciphertext, None).decode()
+        except InvalidTag:
+            continue
+    raise InvalidTag()
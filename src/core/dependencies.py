@@ -1,16 +1,26 @@
-from typing import Annotated
-
 from fastapi import Depends, HTTPException, Request, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from src.core import redis as redis_store
+from src.core import revocation
 from src.core.config import Settings, get_settings
-from src.core.jwt import get_jwt_meta, validate_jwt
+from src.core.jwt import VerifiedToken, verify_jwt
 from src.core.rate_limit import check_rate_limit
 
 _bearer = HTTPBearer()
 
 
+def _verify_bearer(request: Request, credentials: HTTPAuthorizationCredentials) -> VerifiedToken:
+    try:
+        verified = verify_jwt(credentials.credentials)
+    except ValueError as exc:
+        raise HTTPException(status_code=401, detail=str(exc)) from exc
+
+    request.state.user_id = verified.user_id
+    request.state.jti = verified.jti
+    request.state.token_exp = verified.exp
+    return verified
+
+
 async def get_current_token(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Security(_bearer),
@@ -21,28 +31,28 @@ async def get_current_token(
     for middleware event logging and revocation handling.
     Raises 401 on expired/invalid/revoked JWT, 403 if Authorization header is absent.
     """
-    try:
-        user_id, sanctum_token = validate_jwt(credentials.credentials)
-    except ValueError as exc:
-        raise HTTPException(status_code=401, detail=str(exc)) from exc
-
-    jti, exp = get_jwt_meta(credentials.credentials)
-
-    if jti and await redis_store.is_jti_blacklisted(jti):
+    verified = _verify_bearer(request, credentials)
+    if verified.jti and await revocation.is_revoked(verified.jti):
         raise HTTPException(status_code=401, detail="Token has been revoked")
-
-    request.state.user_id = user_id
-    request.state.jti = jti
-    request.state.token_exp = exp
-    return user_id, sanctum_token
+    return verified.user_id, verified.sanctum_token
 
 
 async def get_current_token_limited(
     request: Request,
-    current: Annotated[tuple[int, str], Depends(get_current_token)],
+    credentials: HTTPAuthorizationCredentials = Security(_bearer),
     settings: Settings = Depends(get_settings),
 ) -> tuple[int, str]:
-    """Like get_current_token but also enforces per-user rate limiting."""
-    user_id, _ = current
-    await check_rate_limit(f"user:{user_id}", settings.RATE_LIMIT_PER_MINUTE)
-    return current
+    """Like get_current_token but also enforces per-user (and per-route) rate limiting.
+
+    When the in-memory revocation mirror cannot answer, the blacklist check and
+    the rate-limit counter share one Redis round trip.
+    """
+    verified = _verify_bearer(request, credentials)
+    identity = f"user:{verified.user_id}"
+    if verified.jti and not revocation.is_synced():
+        await check_rate_limit(request, identity, settings, unless_revoked_jti=verified.jti)
+    else:
+        if verified.jti and await revocation.is_revoked(verified.jti):
+            raise HTTPException(status_code=401, detail="Token has been revoked")
+        await check_rate_limit(request, identity, settings)
+    return verified.user_id, verified.sanctum_token
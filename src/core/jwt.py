@@ -1,16 +1,47 @@
+import hashlib
+import time
 import uuid as _uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 from jose import JWTError, jwt
 
-from src.core.config import get_settings
+from src.core.cache import TTLCache
+from src.core.config import Settings, get_settings
 from src.core.crypto import decrypt, encrypt
 
 _ALGORITHM = "HS256"
 _LIFETIME_DAYS = 365
 
 
+@dataclass(frozen=True, slots=True)
+class VerifiedToken:
+    user_id: int
+    sanctum_token: str
+    jti: str | None
+    exp: int
+
+
+# Successful verifications keyed by sha256(token); an entry never outlives the token's exp.
+_verified_cache: TTLCache[bytes, VerifiedToken] | None = None
+
+
+def _get_verified_cache(settings: Settings) -> TTLCache[bytes, VerifiedToken]:
+    global _verified_cache
+    if _verified_cache is None:
+        _verified_cache = TTLCache(
+            maxsize=settings.JWT_VERIFY_CACHE_SIZE,
+            ttl=settings.JWT_VERIFY_CACHE_TTL_SECONDS,
+        )
+    return _verified_cache
+
+
+def clear_verified_jwt_cache() -> None:
+    global _verified_cache
+    _verified_cache = None
+
+
 def create_jwt(user_id: int, sanctum_token: str) -> str:
     """Issue a signed JWT embedding an AES-encrypted Sanctum token.
 
@@ -31,17 +62,45 @@ def create_jwt(user_id: int, sanctum_token: str) -> str:
     return cast(str, jwt.encode(payload, settings.JWT_SECRET, algorithm=_ALGORITHM))
 
 
-def validate_jwt(token: str) -> tuple[int, str]:
-    """Decode and verify a JWT. Returns (user_id, sanctum_token).
+def verify_jwt(token: str) -> VerifiedToken:
+    """Verify a JWT once and return all of its claims we use.
 
+    Successful results are cached, so repeat requests with the same token skip
+    the HMAC check and the AES-GCM decrypt. Revocation is not part of the
+    cached result; callers still check the blacklist.
     Raises ValueError on expiry, invalid signature, or any tampering.
     """
     settings = get_settings()
+    cache = _get_verified_cache(settings)
+    key = hashlib.sha256(token.encode()).digest()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[_ALGORITHM])
     except JWTError as exc:
         raise ValueError(f"Invalid token: {exc}") from exc
-    return int(payload["sub"]), decrypt(payload["tok"])
+    verified = VerifiedToken(
+        user_id=int(payload["sub"]),
+        sanctum_token=decrypt(payload["tok"]),
+        jti=payload.get("jti"),
+        exp=int(payload.get("exp") or 0),
+    )
+    ttl = settings.JWT_VERIFY_CACHE_TTL_SECONDS
+    if verified.exp:
+        ttl = min(ttl, verified.exp - time.time())
+    cache.set(key, verified, ttl=ttl)
+    return verified
+
+
+def validate_jwt(token: str) -> tuple[int, str]:
+    """Decode and verify a JWT. Returns (user_id, sanctum_token).
+
+    Raises ValueError on expiry, invalid signature, or any tampering.
+    """
+    verified = verify_jwt(token)
+    return verified.user_id, verified.sanctum_token
 
 
 def get_jwt_meta(token: str) -> tuple[str | None, int]:
@@ -0,0 +1,62 @@
+"""AES-256-GCM key ring for encrypted values (the JWT ``tok`` claim, overview snapshots).
+
+The primary key (``ENCRYPTION_KEY`` / ``ENCRYPTION_KEY_ID``) encrypts; every key
+in the ring can decrypt, so a key can be rotated without forcing users to
+reconnect. One ``AESGCM`` object per key is built once and reused.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from src.core.config import Settings
+
+
+@dataclass(frozen=True)
+class KeyRing:
+    primary_id: str
+    ciphers: Mapping[str, AESGCM]
+
+    @property
+    def primary(self) -> AESGCM:
+        return self.ciphers[self.primary_id]
+
+
+def parse_retired_keys(value: str) -> dict[str, str]:
+    """Parse ``ENCRYPTION_RETIRED_KEYS`` ("kid:hex,kid:hex") into {kid: hex}.
+
+    A key id may appear once; a repeated id would silently drop one of the keys.
+    """
+    keys: dict[str, str] = {}
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key_id, sep, key_hex = entry.partition(":")
+        if not sep:
+            raise ValueError("ENCRYPTION_RETIRED_KEYS entries must look like <key_id>:<64 hex chars>")
+        key_id = key_id.strip()
+        if key_id in keys:
+            raise ValueError(f"ENCRYPTION_RETIRED_KEYS lists key id {key_id!r} more than once")
+        keys[key_id] = key_hex.strip()
+    return keys
+
+
+@lru_cache(maxsize=4)
+def _build(primary_id: str, primary_hex: str, retired: str) -> KeyRing:
+    retired_keys = parse_retired_keys(retired)
+    if primary_id in retired_keys:
+        # The primary would replace the retired key, leaving its values undecryptable.
+        raise ValueError(f"ENCRYPTION_RETIRED_KEYS must not reuse the primary key id {primary_id!r}")
+    ciphers = {key_id: AESGCM(bytes.fromhex(key_hex)) for key_id, key_hex in retired_keys.items()}
+    ciphers[primary_id] = AESGCM(bytes.fromhex(primary_hex))
+    return KeyRing(primary_id=primary_id, ciphers=MappingProxyType(ciphers))
+
+
+def get_keyring(settings: Settings) -> KeyRing:
+    return _build(settings.ENCRYPTION_KEY_ID, settings.ENCRYPTION_KEY, settings.ENCRYPTION_RETIRED_KEYS)
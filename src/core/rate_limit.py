@@ -1,14 +1,210 @@
+"""Redis-backed rate limiting.
+
+Every check is one Lua script, so the decision is atomic across workers and
+costs one round trip. Algorithms (``RATE_LIMIT_ALGORITHM`` or per rule):
+
+- ``fixed_window``: a counter per period. Up to twice the limit can pass around
+  a window boundary.
+- ``token_bucket``: a bucket of ``burst`` tokens refilled at limit/period.
+- ``gcra``: generic cell rate algorithm, a sliding window that spaces requests
+  at period/limit and allows ``burst`` back-to-back; one timestamp per key.
+
+For JWT-authenticated calls the script also checks the blacklist entry for the
+token, so revocation and rate limiting share the round trip. The result is kept
+on ``request.state`` and RateLimitHeadersMiddleware turns it into
+``RateLimit-*`` / ``Retry-After`` response headers.
+"""
+
+import math
 import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.core import redis as redis_store
+from src.core.config import RateLimitAlgorithm, RateLimitRule, Settings
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitPolicy:
+    algorithm: RateLimitAlgorithm
+    limit: int
+    period_seconds: float
+    burst: int
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    allowed: bool
+    revoked: bool
+    limit: int
+    remaining: int
+    reset_after: float  # seconds until the full limit is available again
+    retry_after: float  # seconds until the next request can pass (0 if allowed)
+
+
+# Every script returns {status, remaining, reset_ms, retry_ms}; status is 1 for
+# allowed, 0 for limited and -1 when the optional second key (the JWT blacklist
+# entry) exists, in which case nothing is counted.
+_REVOKED_CHECK = """
+if #KEYS > 1 and redis.call('EXISTS', KEYS[2]) == 1 then
+  return {-1, 0, 0, 0}
+end
+"""
+
+_NOW_MS = """
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+"""
+
+# ARGV: limit, period_ms. INCR and PEXPIRE run together, so a counter can never
+# be left without an expiry.
+_FIXED_WINDOW = _REVOKED_CHECK + """
+local limit = tonumber(ARGV[1])
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if count == 1 or ttl < 0 then
+  ttl = tonumber(ARGV[2])
+  redis.call('PEXPIRE', KEYS[1], ttl)
+end
+if count > limit then
+  return {0, 0, ttl, ttl}
+end
+return {1, limit - count, ttl, 0}
+"""
+
+# ARGV: limit, period_ms, burst (bucket capacity).
+_TOKEN_BUCKET = _REVOKED_CHECK + _NOW_MS + """
+local rate = tonumber(ARGV[1]) / tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local last = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - last) * rate)
+local allowed, retry = 0, 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, math.floor(tokens), math.ceil((capacity - tokens) / rate), retry}
+"""
+
+# ARGV: limit, period_ms, burst. Stores the theoretical arrival time (TAT).
+_GCRA = _REVOKED_CHECK + _NOW_MS + """
+local emission = tonumber(ARGV[2]) / tonumber(ARGV[1])
+local burst_offset = emission * tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+  tat = now
+end
+local new_tat = tat + emission
+local diff = now - (new_tat - burst_offset)
+if diff < 0 then
+  return {0, 0, math.ceil(tat - now), math.ceil(-diff)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor(diff / emission), math.ceil(new_tat - now), 0}
+"""
+
+_SCRIPTS: dict[RateLimitAlgorithm, str] = {
+    "fixed_window": _FIXED_WINDOW,
+    "token_bucket": _TOKEN_BUCKET,
+    "gcra": _GCRA,
+}
 
 
-async def check_rate_limit(key: str, limit: int) -> None:
-    """Redis fixed-window rate limiter. Raises HTTP 429 if the key exceeds *limit* requests/min."""
-    count = await redis_store.incr_with_expiry(f"rl:{key}", ttl=60)
-    if count > limit:
+def _route_of(request: Request) -> str | None:
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return f"{request.method} {path}" if path else None
+
+
+def _matches(rule: RateLimitRule, route: str | None, identity: str) -> bool:
+    if rule.identity is not None and rule.identity != identity:
+        return False
+    if rule.route is None:
+        return True
+    return route is not None and (rule.route == route or rule.route == route.partition(" ")[2])
+
+
+def resolve_policy(settings: Settings, identity: str, route: str | None) -> tuple[RateLimitPolicy, str]:
+    """Pick the most specific rule for this identity and route. Returns (policy, bucket key)."""
+    rule: RateLimitRule | None = None
+    best = -1
+    for candidate in settings.RATE_LIMIT_RULES:
+        score = 2 * (candidate.identity is not None) + (candidate.route is not None)
+        if score > best and _matches(candidate, route, identity):
+            rule, best = candidate, score
+
+    limit = rule.limit if rule is not None else settings.RATE_LIMIT_PER_MINUTE
+    burst = (rule.burst if rule is not None else None) or settings.RATE_LIMIT_BURST or limit
+    policy = RateLimitPolicy(
+        algorithm=(rule.algorithm if rule is not None else None) or settings.RATE_LIMIT_ALGORITHM,
+        limit=limit,
+        period_seconds=rule.period_seconds if rule is not None else 60.0,
+        burst=burst,
+    )
+    # Route rules get their own bucket; the algorithm is part of the key because
+    # each one stores a different Redis type.
+    key = f"rl:{policy.algorithm}:{identity}"
+    if rule is not None and rule.route is not None and route is not None:
+        key = f"{key}:{route}"
+    return policy, key
+
+
+async def hit(policy: RateLimitPolicy, key: str, *, jti: str | None = None) -> RateLimitResult:
+    """Count one request against *key* (and check *jti*'s blacklist entry) in one round trip."""
+    keys = [key] if jti is None else [key, f"jwt:bl:{jti}"]
+    args = [policy.limit, math.ceil(policy.period_seconds * 1000), policy.burst]
+    status, remaining, reset_ms, retry_ms = (
+        int(value) for value in await redis_store.run_script(_SCRIPTS[policy.algorithm], keys, args)
+    )
+    return RateLimitResult(
+        allowed=status == 1,
+        revoked=status == -1,
+        limit=policy.limit,
+        remaining=max(0, remaining),
+        reset_after=reset_ms / 1000,
+        retry_after=retry_ms / 1000,
+    )
+
+
+def rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
+    headers = {
+        "RateLimit-Limit": str(result.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(math.ceil(result.reset_after)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+    return headers
+
+
+async def check_rate_limit(
+    request: Request,
+    identity: str,
+    settings: Settings,
+    *,
+    unless_revoked_jti: str | None = None,
+) -> RateLimitResult:
+    """Apply the rate limit for *identity* ("user:<id>" / "ip:<addr>") on this route.
+
+    Raises HTTP 429 when the limit is exceeded. With *unless_revoked_jti* the JWT
+    blacklist is checked in the same Redis round trip, and HTTP 401 is raised for
+    a revoked token before it is counted.
+    """
+    policy, key = resolve_policy(settings, identity, _route_of(request))
+    result = await hit(policy, key, jti=unless_revoked_jti)
+    if result.revoked:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    request.state.rate_limit = result
+    if not result.allowed:
         raise HTTPException(
             status_code=429,
             detail={
@@ -17,4 +213,19 @@ async def check_rate_limit(key: str, limit: int) -> None:
                 "fields": [],
                 "request_id": f"req_{uuid.uuid4().hex[:12]}",
             },
+            headers=rate_limit_headers(result),
         )
+    return result
+
+
+class RateLimitHeadersMiddleware(BaseHTTPMiddleware):
+    """Add RateLimit-* (and Retry-After) headers to responses of rate-limited routes."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        response = await call_next(request)
+        result: RateLimitResult | None = getattr(request.state, "rate_limit", None)
+        if result is not None:
+            response.headers.update(rate_limit_headers(result))
+        return response
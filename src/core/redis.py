@@ -1,9 +1,25 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from typing import Any
+
 import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from src.core.config import get_settings
+from src.core.logging import get_logger
 
 _client: aioredis.Redis | None = None
 
+# One pub/sub connection per process, shared by every channel subscriber.
+_subscribers: dict[str, list[Callable[[str], None]]] = {}
+_connect_hooks: list[Callable[[], None]] = []
+_listener: asyncio.Task[None] | None = None
+# Bumped on every (re)subscribe; messages published while disconnected are lost,
+# so consumers that mirror Redis state resync when this changes.
+_generation = 0
+_connected = False
+
 
 async def get_redis() -> aioredis.Redis:
     global _client
@@ -42,17 +58,21 @@ async def get_and_delete(key: str) -> str | None:
     return await r.getdel(key)  # type: ignore[no-any-return]
 
 
-async def incr_with_expiry(key: str, ttl: int) -> int:
-    """Increment a counter and set TTL on first increment. Returns the new count.
+# Registered Lua scripts, keyed by source; rebuilt if the client changes.
+_scripts: dict[str, AsyncScript] = {}
+
+
+async def run_script(source: str, keys: list[str], args: list[Any]) -> Any:
+    """Run a Lua script atomically in one round trip.
 
-    Used for fixed-window rate limiting. The TTL is only set when the key is
-    created (count == 1), so the window resets naturally after expiry.
+    Scripts are registered once and sent as EVALSHA; redis-py falls back to EVAL
+    if the server no longer has the script cached.
     """
     r = await get_redis()
-    count = await r.incr(key)
-    if count == 1:
-        await r.expire(key, ttl)
-    return count  # type: ignore[no-any-return]
+    script = _scripts.get(source)
+    if script is None or script.registered_client is not r:
+        script = _scripts[source] = r.register_script(source)
+    return await script(keys=keys, args=args)
 
 
 async def blacklist_jti(jti: str, ttl: int) -> None:
@@ -65,3 +85,103 @@ async def is_jti_blacklisted(jti: str) -> bool:
     """Return True if this JWT ID has been revoked."""
     r = await get_redis()
     return bool(await r.exists(f"jwt:bl:{jti}"))
+
+
+async def incr(key: str) -> int:
+    """Increment a counter (no expiry) and return the new value."""
+    r = await get_redis()
+    return await r.incr(key)  # type: ignore[no-any-return]
+
+
+async def publish(channel: str, message: str) -> None:
+    """Publish a message to a pub/sub channel."""
+    r = await get_redis()
+    await r.publish(channel, message)
+
+
+def subscribe(
+    channel: str,
+    handler: Callable[[str], None],
+    *,
+    on_connect: Callable[[], None] | None = None,
+) -> None:
+    """Register a handler for a pub/sub channel.
+
+    Handlers run on the listener task and must not block; schedule a task for
+    anything that awaits. ``on_connect`` runs after every (re)subscribe, once
+    messages are being received again. Register before start_pubsub_listener().
+    """
+    _subscribers.setdefault(channel, []).append(handler)
+    if on_connect is not None:
+        _connect_hooks.append(on_connect)
+
+
+def pubsub_generation() -> int | None:
+    """Current listener connection generation, or None while not subscribed."""
+    return _generation if _connected else None
+
+
+async def _listen() -> None:
+    global _generation, _connected
+    logger = get_logger("redis")
+    delay = 1.0
+    while True:
+        try:
+            r = await get_redis()
+            async with r.pubsub() as pubsub:
+                await pubsub.subscribe(*_subscribers)
+                _generation += 1
+                _connected = True
+                delay = 1.0
+                for hook in _connect_hooks:
+                    hook()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    for handler in _subscribers.get(message["channel"], ()):
+                        try:
+                            handler(message["data"])
+                        except Exception:
+                            logger.warning("pubsub_handler_failed", channel=message["channel"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            _connected = False
+            # Redis is optional for pub/sub consumers: keep retrying quietly.
+            logger.warning("pubsub_listener_disconnected", retry_in=delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+        finally:
+            _connected = False
+
+
+def start_pubsub_listener() -> None:
+    """Start the shared pub/sub listener if any channel has a subscriber."""
+    global _listener
+    if _listener is None and _subscribers:
+        _listener = asyncio.create_task(_listen())
+
+
+async def stop_pubsub_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _listener
+    _listener = None
+    _subscribers.clear()
+    _connect_hooks.clear()
+
+
+async def scan_keys_with_ttl(pattern: str) -> dict[str, int]:
+    """Return {key: remaining TTL in seconds} for keys matching *pattern* (SCAN, not KEYS)."""
+    r = await get_redis()
+    keys = [key async for key in r.scan_iter(match=pattern, count=1000)]
+    if not keys:
+        return {}
+    async with r.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+    # TTL is -2 for keys that vanished between SCAN and TTL; -1 for keys without expiry.
+    return {key: ttl for key, ttl in zip(keys, ttls, strict=True) if ttl != -2}
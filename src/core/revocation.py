@@ -0,0 +1,129 @@
+"""In-process mirror of the Redis JWT blacklist.
+
+Revocations are rare, so instead of an ``EXISTS`` per authenticated request each
+worker keeps the set of revoked JTIs (with their expiry) in memory. It is loaded
+with SCAN whenever the shared pub/sub listener (re)subscribes and kept current by
+``jwt:revoked`` messages from /oauth/revoke on any worker, and reloaded every
+``JWT_REVOCATION_RESYNC_SECONDS`` in case a message was lost. While the mirror is
+not known to be complete (startup, Redis disconnected, resync due) checks go to
+Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+
+from src.core import redis as redis_store
+from src.core.config import Settings
+from src.core.logging import get_logger
+
+_CHANNEL = "jwt:revoked"
+_KEY_PREFIX = "jwt:bl:"
+
+_revoked: dict[str, float] = {}  # jti -> unix time the blacklist entry expires
+_enabled = False
+_resync_seconds = 300.0
+# Listener generation the mirror was loaded for; stale once the listener reconnects.
+_loaded_generation: int | None = None
+_loaded_at = 0.0
+_reload_task: asyncio.Task[None] | None = None
+
+
+def _remember(jti: str, expires_at: float) -> None:
+    now = time.time()
+    for known, known_expiry in list(_revoked.items()):
+        if known_expiry <= now:
+            del _revoked[known]
+    _revoked[jti] = expires_at
+
+
+def _on_revoked(message: str) -> None:
+    jti, _, expires_at = message.partition(" ")
+    try:
+        _remember(jti, float(expires_at))
+    except ValueError:
+        return
+
+
+async def _reload(generation: int) -> None:
+    global _loaded_generation, _loaded_at
+    try:
+        entries = await redis_store.scan_keys_with_ttl(f"{_KEY_PREFIX}*")
+    except Exception:
+        get_logger("revocation").warning("revocation_reload_failed")
+        return
+    if redis_store.pubsub_generation() != generation:
+        return  # reconnected meanwhile; that connection's reload wins
+    now = time.time()
+    loaded = {
+        key.removeprefix(_KEY_PREFIX): (now + ttl if ttl >= 0 else float("inf"))
+        for key, ttl in entries.items()
+    }
+    # Keep revocations that arrived over pub/sub while the SCAN was running.
+    loaded.update(_revoked)
+    _revoked.clear()
+    _revoked.update(loaded)
+    _loaded_generation = generation
+    _loaded_at = time.monotonic()
+
+
+def _on_connect() -> None:
+    global _reload_task
+    generation = redis_store.pubsub_generation()
+    if generation is not None and (_reload_task is None or _reload_task.done()):
+        _reload_task = asyncio.create_task(_reload(generation))
+
+
+def start_revocation_sync(settings: Settings) -> None:
+    """Mirror the blacklist locally. Call from the lifespan before the pub/sub listener starts."""
+    global _enabled, _resync_seconds
+    if _enabled or not settings.JWT_REVOCATION_LOCAL_FILTER:
+        return
+    _enabled = True
+    _resync_seconds = settings.JWT_REVOCATION_RESYNC_SECONDS
+    redis_store.subscribe(_CHANNEL, _on_revoked, on_connect=_on_connect)
+
+
+async def stop_revocation_sync() -> None:
+    global _enabled, _loaded_generation, _reload_task
+    if _reload_task is not None:
+        _reload_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _reload_task
+    _reload_task = None
+    _enabled = False
+    _loaded_generation = None
+    _revoked.clear()
+
+
+def is_synced() -> bool:
+    if not _enabled or _loaded_generation is None or _loaded_generation != redis_store.pubsub_generation():
+        return False
+    if time.monotonic() - _loaded_at > _resync_seconds:
+        _on_connect()
+        return False
+    return True
+
+
+async def is_revoked(jti: str) -> bool:
+    """Return True if this JWT ID has been revoked; no Redis round trip when the mirror is in sync."""
+    if not is_synced():
+        return await redis_store.is_jti_blacklisted(jti)
+    expires_at = _revoked.get(jti)
+    return expires_at is not None and expires_at > time.time()
+
+
+async def revoke(jti: str, ttl: int) -> None:
+    """Blacklist a JWT ID for *ttl* seconds and tell every worker."""
+    await redis_store.blacklist_jti(jti, ttl=ttl)
+    if not _enabled:
+        return
+    expires_at = time.time() + ttl
+    _remember(jti, expires_at)
+    try:
+        await redis_store.publish(_CHANNEL, f"{jti} {expires_at}")
+    except Exception:
+        # Other workers pick the entry up on their next reload or fall back to Redis.
+        get_logger("revocation").warning("revocation_publish_failed")
@@ -4,21 +4,46 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
+from src.core import redis as redis_store
+from src.core import revocation
 from src.core.config import get_settings
 from src.core.logging import RequestLoggingMiddleware, setup_logging
+from src.core.rate_limit import RateLimitHeadersMiddleware
 from src.routers import admin, health, medical_records, oauth, pets, public, vaccinations, weights
-from src.services.main_app import MainAppError, refresh_pet_types_cache
+from src.services.main_app import (
+    MainAppError,
+    close_http_client,
+    refresh_pet_types_cache,
+    start_http_client,
+    start_pet_types_refresher,
+    stop_pet_types_refresher,
+)
+from src.services.overview_snapshot import start_snapshot_refresher, stop_snapshot_refresher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     setup_logging(settings.LOG_LEVEL)
+    await start_http_client(settings)
+    start_pet_types_refresher(settings)
+    revocation.start_revocation_sync(settings)
+    redis_store.start_pubsub_listener()
     try:
-        await refresh_pet_types_cache(settings)
+        # Cold workers take the table another worker already stored in Redis.
+        await refresh_pet_types_cache(settings, prefer_shared=True)
     except MainAppError:
         pass
-    yield
+    if settings.OVERVIEW_SNAPSHOT_ENABLED:
+        start_snapshot_refresher(settings, pets.build_overview_snapshot)
+    try:
+        yield
+    finally:
+        await stop_snapshot_refresher()
+        await stop_pet_types_refresher()
+        await redis_store.stop_pubsub_listener()
+        await revocation.stop_revocation_sync()
+        await close_http_client()
 
 
 def _openapi_server_url() -> str:
@@ -32,6 +57,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(RateLimitHeadersMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
 app.include_router(health.router)
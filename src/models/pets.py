@@ -5,7 +5,8 @@ from pydantic import BaseModel, Field, field_validator
 
 SexInput = Literal["male", "female", "unknown", "not_specified"]
 BirthdayPrecision = Literal["day", "month", "year", "unknown"]
-DataStatus = Literal["available", "unavailable"]
+DataStatus = Literal["available", "unavailable", "timeout", "skipped"]
+OverviewInclude = Literal["vaccinations", "weights"]
 
 
 class PetTypeItem(BaseModel):
@@ -23,12 +24,17 @@ class PetSummary(BaseModel):
 
 
 class PetFindRequest(BaseModel):
-    name: str | None = Field(default=None, min_length=1, description="Pet name to search for. Case-insensitive partial match.")
+    name: str | None = Field(default=None, min_length=1, description="Pet name to search for. Case- and accent-insensitive partial match ('bong' finds 'Bông').")
     species: str | None = Field(default=None, min_length=1, description="Optional species filter (e.g. 'cat', 'dog').")
 
 
+class PetFindCandidate(PetSummary):
+    match_score: float = Field(description="How well the name matched, from 0 to 1. 1.0 is an exact (accent- and case-insensitive) match.")
+    match_type: Literal["any", "exact", "substring", "fuzzy"] = Field(description="'exact' or 'substring' name match, 'fuzzy' for a likely typo (confirm with the user before acting), 'any' when no name was given.")
+
+
 class PetFindResponse(BaseModel):
-    candidates: list[PetSummary] = Field(description="Matched pets. If 1 result: use it. If 0: tell user no pet was found. If multiple: list them and ask the user to choose.")
+    candidates: list[PetFindCandidate] = Field(description="Matched pets. If 1 result: use it. If 0: tell user no pet was found. If multiple: list them and ask the user to choose.")
 
 
 class PetsOverviewRequest(BaseModel):
@@ -40,7 +46,7 @@ class PetsOverviewRequest(BaseModel):
     name: str | None = Field(
         default=None,
         min_length=1,
-        description="Optional partial pet-name filter (case-insensitive).",
+        description="Optional partial pet-name filter (case- and accent-insensitive).",
     )
     only_with_upcoming_vaccination: bool = Field(
         default=False,
@@ -54,6 +60,21 @@ class PetsOverviewRequest(BaseModel):
         default="asc",
         description="Sort order. Use asc for soonest due first, desc for latest due first.",
     )
+    include: list[OverviewInclude] | None = Field(
+        default=None,
+        description="Per-pet data to load: 'vaccinations', 'weights', both, or [] for none. Omit to load both, except with sort_by=next_birthday_at, which loads neither. Vaccinations are always loaded when sorting or filtering by them. Data not loaded is reported with status 'skipped'.",
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        le=100,
+        description="Optional page size. When set, the response is a page object with items and next_cursor instead of a plain list. Use for accounts with many pets.",
+    )
+    cursor: str | None = Field(
+        default=None,
+        min_length=1,
+        description="Opaque next_cursor value from the previous page. Send it with the same filters and sort to get the next page.",
+    )
 
 
 class PetOverviewItem(PetSummary):
@@ -98,10 +119,10 @@ class PetOverviewItem(PetSummary):
         description="Vaccine name for next_vaccination_due_at, if available.",
     )
     vaccination_data_status: DataStatus = Field(
-        description="Whether vaccination history was successfully loaded for this pet.",
+        description="Whether vaccination history was successfully loaded for this pet. 'timeout' means the main app was too slow for this pet; the other pets are still complete, so answer with what is available and mention the gap. 'skipped' means vaccinations were not requested (see include).",
     )
     weights_data_status: DataStatus = Field(
-        description="Whether weight history was successfully loaded for this pet.",
+        description="Whether weight history was successfully loaded for this pet. 'timeout' means the main app was too slow for this pet. 'skipped' means weights were not requested (see include).",
     )
 
 
@@ -118,6 +139,17 @@ class PetOverviewWeightItem(BaseModel):
     record_date: date | None = Field(default=None, description="Date the weight was recorded (YYYY-MM-DD).")
 
 
+class PetSummaryPage(BaseModel):
+    items: list[PetSummary] = Field(description="Pets on this page.")
+    next_cursor: str | None = Field(default=None, description="Pass as cursor to fetch the next page. Null when this is the last page.")
+
+
+class PetsOverviewPage(BaseModel):
+    items: list[PetOverviewItem] = Field(description="Pets on this page, in the requested sort order.")
+    next_cursor: str | None = Field(default=None, description="Pass as cursor with the same filters and sort to fetch the next page. Null when this is the last page.")
+    snapshot_age_seconds: float | None = Field(default=None, description="Set when the page was served from a precomputed snapshot: how old that data is, in seconds.")
+
+
 class CreatePetRequest(BaseModel):
     name: str = Field(min_length=1, description="Pet's name exactly as the user stated it.")
     species: str = Field(min_length=1, description="Species in plain text (e.g. 'cat', 'dog', 'rabbit'). Will be mapped to an internal ID.")
@@ -9,6 +9,14 @@ from fastapi.templating import Jinja2Templates
 
 from src.core.admin_events import get_active_session_count, get_recent, get_total_event_count
 from src.core.config import Settings, get_settings
+from src.services.main_app import (
+    get_circuit_breaker_stats,
+    get_coalescing_stats,
+    get_concurrency_stats,
+    get_pool_stats,
+    get_retry_stats,
+    get_revalidation_stats,
+)
 
 _TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
@@ -150,5 +158,11 @@ async def admin_stats(request: Request) -> HTMLResponse:
             "error_count": len(recent_errors),
             "successful_logins": len(successful_logins),
             "auth_error_count": len(auth_errors),
+            "upstream_pool": get_pool_stats(),
+            "upstream_coalescing": get_coalescing_stats(),
+            "circuit_breaker": get_circuit_breaker_stats(),
+            "upstream_retries": get_retry_stats(),
+            "upstream_concurrency": get_concurrency_stats(),
+            "upstream_revalidation": get_revalidation_stats(),
         },
     )
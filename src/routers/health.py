@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from src.core.config import Settings, get_settings
+from src.services.main_app import get_circuit_breaker_stats
 
 router = APIRouter()
 
@@ -29,6 +30,7 @@ class HealthResponse(BaseModel):
     status: str
     version: str
     main_app_reachable: bool
+    main_app_circuit: str
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -45,4 +47,5 @@ async def health_check(settings: Settings = Depends(get_settings)) -> HealthResp
         status="ok",
         version=_get_version(),
         main_app_reachable=main_app_reachable,
+        main_app_circuit=get_circuit_breaker_stats()["state"],
     )
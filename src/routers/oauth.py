@@ -10,10 +10,12 @@ from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from src.core import redis as redis_store
+from src.core import revocation
 from src.core.config import Settings, get_settings
 from src.core.dependencies import get_current_token
 from src.core.jwt import create_jwt
 from src.core.rate_limit import check_rate_limit
+from src.services import overview_snapshot
 from src.services.main_app import MainAppError, exchange_code, revoke_token
 
 router = APIRouter(prefix="/oauth", tags=["oauth"])
@@ -32,7 +34,7 @@ async def authorize(
     settings: Settings = Depends(get_settings),
 ) -> Any:
     client_ip = request.client.host if request.client else "unknown"
-    await check_rate_limit(f"ip:{client_ip}", settings.RATE_LIMIT_PER_MINUTE)
+    await check_rate_limit(request, f"ip:{client_ip}", settings)
 
     if client_id != settings.OAUTH_CLIENT_ID:
         raise HTTPException(status_code=400, detail="Invalid client_id")
@@ -127,17 +129,18 @@ async def revoke(
     current: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current
+    user_id, sanctum_token = current
 
     # Blacklist the JWT so it cannot be used again after revocation.
     jti = getattr(request.state, "jti", None)
     token_exp = getattr(request.state, "token_exp", 0)
     if jti:
         remaining_ttl = max(1, token_exp - int(datetime.now(UTC).timestamp()))
-        await redis_store.blacklist_jti(jti, ttl=remaining_ttl)
+        await revocation.revoke(jti, ttl=remaining_ttl)
 
     try:
         await revoke_token(sanctum_token, settings)
     except MainAppError:
         pass  # Best-effort: don't surface main app errors to the caller
+    await overview_snapshot.forget_user(user_id, settings)
     return {"revoked": True}
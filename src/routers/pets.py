@@ -1,43 +1,73 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
+import json
+import time
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Mapping
 from datetime import date
-from typing import Annotated, Any
+from functools import partial
+from typing import Annotated, Any, TypeVar
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.core.config import Settings, get_settings
 from src.core.dependencies import get_current_token_limited as get_current_token
 from src.models.pets import (
     CreatePetRequest,
+    PetFindCandidate,
     PetFindRequest,
     PetFindResponse,
     PetOverviewItem,
+    PetsOverviewPage,
     PetsOverviewRequest,
     PetSummary,
+    PetSummaryPage,
     PetTypeItem,
     UpdatePetRequest,
 )
+from src.services import overview_snapshot
 from src.services.main_app import (
     MainAppError,
     call_main_app,
-    get_pet_types_by_name,
+    ensure_pet_types,
     get_species_name_by_pet_type_id,
-    refresh_pet_types_cache,
+    iter_main_app_list,
+    resolve_pet_type_id,
+)
+from src.services.pet_cache import (
+    HealthResource,
+    get_cached_pet_health,
+    get_cached_pets,
+    get_pet_name_index,
+    invalidate_pets,
+    store_pet_health,
+    store_pet_name_index,
+    store_pets,
 )
 from src.services.pets_normalization import (
+    PetMatch,
+    PetNameIndex,
     filter_pet_candidates,
+    fold_name,
     has_exact_duplicate,
     normalize_birth_fields,
     normalize_sex,
-    normalize_species_to_pet_type_id,
-    to_pet_summary,
+    species_name,
+    to_pet_summaries,
 )
 
 router = APIRouter(tags=["pets"])
 
+_T = TypeVar("_T")
+
+# Background stale-while-revalidate refreshes, keyed by (user_id, pet_id, resource).
+# Holding the tasks here keeps them from being garbage-collected mid-flight.
+_health_refreshes: dict[tuple[int, int, HealthResource], asyncio.Task[None]] = {}
+
 
 def _error_response(status_code: int, error: str, message: str, fields: list[dict[str, str]] | None = None, extra: dict[str, Any] | None = None) -> JSONResponse:
     payload: dict[str, Any] = {
@@ -51,14 +81,6 @@ def _error_response(status_code: int, error: str, message: str, fields: list[dic
     return JSONResponse(status_code=status_code, content=payload)
 
 
-def _extract_list(data: Any) -> list[dict[str, Any]]:
-    if isinstance(data, list):
-        return [item for item in data if isinstance(item, dict)]
-    if isinstance(data, dict) and isinstance(data.get("data"), list):
-        return [item for item in data["data"] if isinstance(item, dict)]
-    return []
-
-
 def _parse_iso_date(raw: Any) -> date | None:
     if not isinstance(raw, str):
         return None
@@ -94,40 +116,153 @@ def _sort_recent_weights(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
     )
 
 
-async def _load_pets(current_token: tuple[int, str], settings: Settings) -> list[dict[str, Any]]:
-    _, sanctum_token = current_token
+async def _fetch_raw_pets(user_id: int, sanctum_token: str, settings: Settings) -> list[dict[str, Any]]:
     # This upstream read depends on the main app's generic PAT contract (`read`),
     # not just on `/api/my-pets` existing.
-    raw = await call_main_app(
-        method="GET",
-        path="/api/my-pets",
-        settings=settings,
-        sanctum_token=sanctum_token,
-    )
+    raw_pets = [
+        item
+        async for item in iter_main_app_list(
+            path="/api/my-pets",
+            settings=settings,
+            sanctum_token=sanctum_token,
+        )
+    ]
+    store_pets(user_id, raw_pets, settings)
+    return raw_pets
+
+
+async def _load_raw_pets(current_token: tuple[int, str], settings: Settings) -> list[dict[str, Any]]:
+    user_id, sanctum_token = current_token
+    raw_pets = get_cached_pets(user_id, settings)
+    if raw_pets is None:
+        raw_pets = await _fetch_raw_pets(user_id, sanctum_token, settings)
+    return raw_pets
+
+
+async def _load_pets(current_token: tuple[int, str], settings: Settings) -> list[dict[str, Any]]:
+    raw_pets = await _load_raw_pets(current_token, settings)
+    return to_pet_summaries(raw_pets, get_species_name_by_pet_type_id(), today=date.today())
+
+
+async def _search_pets(
+    current_token: tuple[int, str],
+    settings: Settings,
+    *,
+    name: str | None,
+    species: str | None,
+    fuzzy: bool = False,
+) -> list[tuple[dict[str, Any], PetMatch]]:
+    """Match the user's pets by name/species through their cached PetNameIndex.
+
+    The index is only built for a name query; without one, pets are filtered by
+    species in list order. Only matched pets are turned into summaries.
+    """
+    user_id, _ = current_token
+    raw_pets = await _load_raw_pets(current_token, settings)
     species_by_type_id = get_species_name_by_pet_type_id()
-    today = date.today()
-    return [to_pet_summary(item, species_by_type_id, today=today) for item in _extract_list(raw)]
+    if not fold_name(name):
+        species_key = species.strip().lower() if species else None
+        matches = [
+            PetMatch(position, 1.0, "any")
+            for position, item in enumerate(raw_pets)
+            if species_key is None or species_name(item, species_by_type_id) == species_key
+        ]
+    else:
+        index = get_pet_name_index(user_id, raw_pets, species_by_type_id, settings)
+        if index is None:
+            index = PetNameIndex((item.get("name"), species_name(item, species_by_type_id)) for item in raw_pets)
+            store_pet_name_index(user_id, raw_pets, species_by_type_id, index, settings)
+        matches = index.search(name=name, species=species, fuzzy=fuzzy)
+
+    summaries = to_pet_summaries(
+        (raw_pets[match.position] for match in matches),
+        species_by_type_id,
+        today=date.today(),
+    )
+    return list(zip(summaries, matches, strict=True))
 
 
-async def _load_pet_next_vaccination_due(
+async def _fetch_pet_health(
+    user_id: int | None,
     pet_id: int,
+    resource: HealthResource,
     sanctum_token: str,
     settings: Settings,
-) -> tuple[date | None, str | None, str, list[dict[str, Any]]]:
-    try:
-        raw = await call_main_app(
-            method="GET",
-            path=f"/api/pets/{pet_id}/vaccinations",
+) -> list[dict[str, Any]]:
+    fetched_at = time.monotonic()
+    records = [
+        item
+        async for item in iter_main_app_list(
+            path=f"/api/pets/{pet_id}/{resource}",
             settings=settings,
             sanctum_token=sanctum_token,
         )
+    ]
+    if user_id is not None:
+        store_pet_health(user_id, pet_id, resource, records, settings, fetched_at=fetched_at)
+    return records
+
+
+def _schedule_health_refresh(
+    user_id: int,
+    pet_id: int,
+    resource: HealthResource,
+    sanctum_token: str,
+    settings: Settings,
+) -> None:
+    key = (user_id, pet_id, resource)
+    if key in _health_refreshes:
+        return
+
+    async def refresh() -> None:
+        try:
+            await _fetch_pet_health(user_id, pet_id, resource, sanctum_token, settings)
+        except MainAppError:
+            # Keep serving the stale copy; the next read past the fresh TTL retries.
+            pass
+        finally:
+            _health_refreshes.pop(key, None)
+
+    _health_refreshes[key] = asyncio.create_task(refresh())
+
+
+async def _read_pet_health(
+    user_id: int | None,
+    pet_id: int,
+    resource: HealthResource,
+    sanctum_token: str,
+    settings: Settings,
+) -> list[dict[str, Any]]:
+    """Return a pet's raw vaccination or weight records, cache-first.
+
+    Fresh entries are returned as is. Stale entries are returned immediately and
+    refreshed in the background. Without a user_id the cache is bypassed.
+    """
+    if user_id is not None:
+        cached = get_cached_pet_health(user_id, pet_id, resource, settings)
+        if cached is not None:
+            records, fresh = cached
+            if not fresh:
+                _schedule_health_refresh(user_id, pet_id, resource, sanctum_token, settings)
+            return records
+    return await _fetch_pet_health(user_id, pet_id, resource, sanctum_token, settings)
+
+
+async def _load_pet_next_vaccination_due(
+    pet_id: int,
+    sanctum_token: str,
+    settings: Settings,
+    user_id: int | None = None,
+) -> tuple[date | None, str | None, str, list[dict[str, Any]]]:
+    try:
+        records = await _read_pet_health(user_id, pet_id, "vaccinations", sanctum_token, settings)
     except MainAppError:
         return None, None, "unavailable", []
 
     today = date.today()
     upcoming: list[tuple[date, str | None]] = []
     active_records: list[dict[str, Any]] = []
-    for item in _extract_list(raw):
+    for item in records:
         if item.get("completed_at") is not None:
             continue
 
@@ -159,19 +294,15 @@ async def _load_pet_recent_weights(
     pet_id: int,
     sanctum_token: str,
     settings: Settings,
+    user_id: int | None = None,
 ) -> tuple[list[dict[str, Any]], str]:
     try:
-        raw = await call_main_app(
-            method="GET",
-            path=f"/api/pets/{pet_id}/weights",
-            settings=settings,
-            sanctum_token=sanctum_token,
-        )
+        records = await _read_pet_health(user_id, pet_id, "weights", sanctum_token, settings)
     except MainAppError:
         return [], "unavailable"
 
     weights: list[dict[str, Any]] = []
-    for item in _extract_list(raw):
+    for item in records:
         try:
             weight_kg = float(item["weight_kg"]) if item.get("weight_kg") is not None else None
         except (TypeError, ValueError):
@@ -187,6 +318,408 @@ async def _load_pet_recent_weights(
     return _sort_recent_weights(weights)[:5], "available"
 
 
+_VaccinationSummary = tuple[date | None, str | None, str, list[dict[str, Any]]]
+_WeightsSummary = tuple[list[dict[str, Any]], str]
+
+
+async def _load_overview_health(
+    pet_ids: list[int],
+    *,
+    sanctum_token: str,
+    settings: Settings,
+    user_id: int | None = None,
+    resources: Collection[HealthResource] = ("vaccinations", "weights"),
+    deadline: float | None = None,
+) -> tuple[dict[int, _VaccinationSummary], dict[int, _WeightsSummary]]:
+    """Fetch vaccinations and weights for every pet in one fan-out phase.
+
+    Both loads for all pets run in a single TaskGroup behind a shared semaphore,
+    so latency is bounded by the slowest call rather than the sum of two rounds.
+    Each pet gets a deadline that starts when its first load gets a slot, and the
+    whole phase stops at OVERVIEW_LATENCY_BUDGET_SECONDS, or at ``deadline`` (a
+    loop time) when a request spends one budget across several calls. Whatever
+    finished is returned; loads that hit either limit are reported with status
+    "timeout". With a user_id, records come from the per-pet
+    stale-while-revalidate cache. Only the listed resources are loaded; the
+    other mapping is returned empty.
+    """
+    semaphore = asyncio.Semaphore(settings.OVERVIEW_MAX_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    deadlines: dict[int, float] = {}
+    vaccinations: dict[int, _VaccinationSummary] = {}
+    weights: dict[int, _WeightsSummary] = {}
+    vaccinations_timeout: _VaccinationSummary = (None, None, "timeout", [])
+    weights_timeout: _WeightsSummary = ([], "timeout")
+
+    async def bounded(
+        pet_id: int,
+        load: Callable[[], Awaitable[_T]],
+        results: dict[int, _T],
+        on_timeout: _T,
+    ) -> None:
+        async with semaphore:
+            deadline = deadlines.setdefault(pet_id, loop.time() + settings.OVERVIEW_PET_TIMEOUT_SECONDS)
+            try:
+                async with asyncio.timeout_at(deadline):
+                    results[pet_id] = await load()
+            except TimeoutError:
+                results[pet_id] = on_timeout
+
+    if deadline is None:
+        deadline = loop.time() + settings.OVERVIEW_LATENCY_BUDGET_SECONDS
+    try:
+        async with asyncio.timeout_at(deadline):
+            async with asyncio.TaskGroup() as group:
+                for pet_id in pet_ids:
+                    if "vaccinations" in resources:
+                        group.create_task(
+                            bounded(
+                                pet_id,
+                                partial(_load_pet_next_vaccination_due, pet_id, sanctum_token, settings, user_id),
+                                vaccinations,
+                                vaccinations_timeout,
+                            )
+                        )
+                    if "weights" in resources:
+                        group.create_task(
+                            bounded(
+                                pet_id,
+                                partial(_load_pet_recent_weights, pet_id, sanctum_token, settings, user_id),
+                                weights,
+                                weights_timeout,
+                            )
+                        )
+    except TimeoutError:
+        for pet_id in pet_ids:
+            if "vaccinations" in resources:
+                vaccinations.setdefault(pet_id, vaccinations_timeout)
+            if "weights" in resources:
+                weights.setdefault(pet_id, weights_timeout)
+
+    return vaccinations, weights
+
+
+async def _stream_overview_health(
+    pet_ids: list[int],
+    *,
+    sanctum_token: str,
+    settings: Settings,
+    user_id: int | None = None,
+    resources: Collection[HealthResource] = ("vaccinations", "weights"),
+) -> AsyncIterator[tuple[int, _VaccinationSummary | None, _WeightsSummary | None]]:
+    """Yield each pet's vaccinations and weights as soon as both are loaded.
+
+    Results arrive in completion order. A fixed pool of OVERVIEW_MAX_CONCURRENCY
+    workers pulls pet IDs and a bounded queue hands results over, so memory stays
+    flat however many pets there are. Each pet keeps its own deadline; there is
+    no overall latency budget because the caller is reading incrementally.
+    Resources not listed in ``resources`` are not fetched and yielded as None.
+    """
+    semaphore = asyncio.Semaphore(settings.OVERVIEW_MAX_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[int, _VaccinationSummary | None, _WeightsSummary | None] | Exception] = (
+        asyncio.Queue(maxsize=settings.OVERVIEW_MAX_CONCURRENCY)
+    )
+    pending = iter(pet_ids)
+
+    vaccinations_timeout: _VaccinationSummary = (None, None, "timeout", [])
+    weights_timeout: _WeightsSummary = ([], "timeout")
+
+    async def within(
+        resource: HealthResource,
+        deadline: float,
+        load: Callable[[], Awaitable[_T]],
+        on_timeout: _T,
+    ) -> _T | None:
+        if resource not in resources:
+            return None
+        async with semaphore:
+            try:
+                async with asyncio.timeout_at(deadline):
+                    return await load()
+            except TimeoutError:
+                return on_timeout
+
+    async def worker() -> None:
+        try:
+            for pet_id in pending:
+                deadline = loop.time() + settings.OVERVIEW_PET_TIMEOUT_SECONDS
+                vaccination, weights = await asyncio.gather(
+                    within(
+                        "vaccinations",
+                        deadline,
+                        partial(_load_pet_next_vaccination_due, pet_id, sanctum_token, settings, user_id),
+                        vaccinations_timeout,
+                    ),
+                    within(
+                        "weights",
+                        deadline,
+                        partial(_load_pet_recent_weights, pet_id, sanctum_token, settings, user_id),
+                        weights_timeout,
+                    ),
+                )
+                await queue.put((pet_id, vaccination, weights))
+        except Exception as exc:
+            await queue.put(exc)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(settings.OVERVIEW_MAX_CONCURRENCY, len(pet_ids)))]
+    try:
+        for _ in pet_ids:
+            result = await queue.get()
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _cursor_query(**params: Any) -> str:
+    """Short digest of the filters and sort a cursor was issued for."""
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _encode_cursor(offset: int, query: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset, "query": query}).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str | None, query: str) -> int:
+    """Return the offset stored in an opaque page cursor (0 when absent).
+
+    A cursor only continues the listing it came from; one issued for other
+    filters or another sort order is rejected rather than paging the wrong list.
+    """
+    if cursor is None:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset, cursor_query = data["offset"], data["query"]
+    except (ValueError, TypeError, KeyError) as exc:
+        raise ValueError("cursor is invalid; request the first page without a cursor") from exc
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("cursor is invalid; request the first page without a cursor")
+    if cursor_query != query:
+        raise ValueError("cursor was issued for different filters or sort; request the first page without a cursor")
+    return offset
+
+
+def _invalid_cursor_response(exc: ValueError) -> JSONResponse:
+    return _error_response(
+        422,
+        "VALIDATION_ERROR",
+        str(exc),
+        fields=[{"name": "cursor", "reason": "invalid_cursor"}],
+    )
+
+
+def _page[T](items: list[T], offset: int, limit: int, query: str) -> tuple[list[T], str | None]:
+    end = offset + limit
+    return items[offset:end], _encode_cursor(end, query) if end < len(items) else None
+
+
+def _overview_cursor_query(payload: PetsOverviewRequest) -> str:
+    return _cursor_query(
+        name=payload.name,
+        species=payload.species,
+        only_with_upcoming_vaccination=payload.only_with_upcoming_vaccination,
+        sort_by=payload.sort_by,
+        sort_order=payload.sort_order,
+    )
+
+
+def _overview_resources(payload: PetsOverviewRequest) -> tuple[HealthResource, ...]:
+    """Work out which per-pet resources an overview request needs.
+
+    An explicit ``include`` wins. Without it, birthday sorting needs nothing and
+    every other request gets both resources. Vaccinations are always added when
+    the filter or sort depends on them.
+    """
+    if payload.include is not None:
+        requested: set[str] = set(payload.include)
+    elif payload.sort_by == "next_birthday_at":
+        requested = set()
+    else:
+        requested = {"vaccinations", "weights"}
+    if payload.only_with_upcoming_vaccination or payload.sort_by == "next_vaccination_due_at":
+        requested.add("vaccinations")
+    return tuple(resource for resource in ("vaccinations", "weights") if resource in requested)
+
+
+def _for_pet[T](summaries: Mapping[int, T], item: dict[str, Any]) -> T | None:
+    """Look up a pet's health summary; pets without an integer id have none."""
+    pet_id = item.get("id")
+    return summaries.get(pet_id) if isinstance(pet_id, int) else None
+
+
+def _overview_item(
+    pet: dict[str, Any],
+    vaccination: _VaccinationSummary | None,
+    weights: _WeightsSummary | None,
+    resources: Collection[HealthResource] = ("vaccinations", "weights"),
+) -> dict[str, Any]:
+    """Merge a pet with its health summaries.
+
+    A missing summary is reported as "unavailable" when the resource was wanted
+    and "skipped" when it was left out of ``resources``.
+    """
+    due_at, vaccination_status = None, "unavailable"
+    active_vaccinations: list[dict[str, Any]] = []
+    vaccine_name: str | None = None
+    if vaccination is not None:
+        due_at, vaccine_name, vaccination_status, active_vaccinations = vaccination
+    elif "vaccinations" not in resources:
+        vaccination_status = "skipped"
+    recent_weights, weights_status = weights or ([], "unavailable" if "weights" in resources else "skipped")
+    return {
+        **pet,
+        "active_vaccinations": active_vaccinations,
+        "recent_weights": recent_weights,
+        "next_vaccination_due_at": due_at,
+        "next_vaccination_name": vaccine_name,
+        "vaccination_data_status": vaccination_status,
+        "weights_data_status": weights_status,
+    }
+
+
+def _order_overview_items(items: list[dict[str, Any]], payload: PetsOverviewRequest) -> list[dict[str, Any]]:
+    if payload.only_with_upcoming_vaccination:
+        items = [item for item in items if item["next_vaccination_due_at"] is not None]
+    _sort_overview_items(items, payload.sort_by, payload.sort_order)
+    return items
+
+
+def _sort_overview_items(items: list[dict[str, Any]], sort_by: str, sort_order: str) -> None:
+    if sort_by in ("next_vaccination_due_at", "next_birthday_at"):
+        if sort_order == "asc":
+            items.sort(
+                key=lambda item: (
+                    item[sort_by] is None,
+                    item[sort_by] or date.max,
+                    str(item.get("name", "")).lower(),
+                )
+            )
+        else:
+            items.sort(
+                key=lambda item: (
+                    item[sort_by] is not None,
+                    item[sort_by] or date.min,
+                    str(item.get("name", "")).lower(),
+                ),
+                reverse=True,
+            )
+    else:
+        items.sort(key=lambda item: str(item.get("name", "")).lower(), reverse=sort_order == "desc")
+
+
+async def build_overview_snapshot(user_id: int, sanctum_token: str, settings: Settings) -> list[dict[str, Any]]:
+    """Build the full overview (all pets, both resources) as JSON-ready dicts.
+
+    Everything is read from the main app, past the per-user caches, and without
+    the latency budget of the interactive path: a snapshot is served for minutes,
+    so it must not be built from stale copies or keep a timeout in place.
+    """
+    raw_pets = await _fetch_raw_pets(user_id, sanctum_token, settings)
+    pets = to_pet_summaries(raw_pets, get_species_name_by_pet_type_id(), today=date.today())
+    pet_ids = [int(pet["id"]) for pet in pets if pet.get("id") is not None]
+    semaphore = asyncio.Semaphore(settings.OVERVIEW_MAX_CONCURRENCY)
+
+    async def bounded(load: Callable[[], Awaitable[_T]]) -> _T:
+        async with semaphore:
+            return await load()
+
+    vaccinations, weights = await asyncio.gather(
+        asyncio.gather(
+            *(bounded(partial(_load_pet_next_vaccination_due, pet_id, sanctum_token, settings)) for pet_id in pet_ids)
+        ),
+        asyncio.gather(
+            *(bounded(partial(_load_pet_recent_weights, pet_id, sanctum_token, settings)) for pet_id in pet_ids)
+        ),
+    )
+    vaccinations_by_id = dict(zip(pet_ids, vaccinations, strict=True))
+    weights_by_id = dict(zip(pet_ids, weights, strict=True))
+    return [
+        PetOverviewItem.model_validate(
+            _overview_item(pet, _for_pet(vaccinations_by_id, pet), _for_pet(weights_by_id, pet))
+        ).model_dump(mode="json")
+        for pet in pets
+    ]
+
+
+async def _overview_from_snapshot(
+    payload: PetsOverviewRequest,
+    request: Request,
+    response: Response,
+    user_id: int,
+    sanctum_token: str,
+    offset: int,
+) -> Any | None:
+    """Answer pets_overview from the user's Redis snapshot, or None if there is none."""
+    overview_snapshot.note_active(user_id, sanctum_token, getattr(request.state, "token_exp", 0))
+    snapshot = await overview_snapshot.load_snapshot(user_id)
+    if snapshot is None:
+        overview_snapshot.request_refresh(user_id)
+        return None
+
+    age = round(snapshot.age_seconds, 1)
+    response.headers["X-Overview-Snapshot-Age"] = str(int(age))
+    items = [PetOverviewItem.model_validate(item).model_dump() for item in snapshot.items]
+    items = _order_overview_items(
+        filter_pet_candidates(items, name=payload.name, species=payload.species),
+        payload,
+    )
+    if payload.limit is None:
+        return items
+    page, next_cursor = _page(items, offset, payload.limit, _overview_cursor_query(payload))
+    return {"items": page, "next_cursor": next_cursor, "snapshot_age_seconds": age}
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return "application/x-ndjson" in request.headers.get("accept", "")
+
+
+async def _overview_ndjson(
+    filtered: list[dict[str, Any]],
+    payload: PetsOverviewRequest,
+    *,
+    sanctum_token: str,
+    settings: Settings,
+    user_id: int,
+) -> AsyncIterator[str]:
+    by_id = {pet["id"]: pet for pet in filtered if isinstance(pet.get("id"), int)}
+    counts = {"pets": len(filtered), "emitted": 0, "timeout": 0, "unavailable": 0}
+
+    def line(item: dict[str, Any]) -> str:
+        counts["emitted"] += 1
+        statuses = {item["vaccination_data_status"], item["weights_data_status"]}
+        if "timeout" in statuses:
+            counts["timeout"] += 1
+        elif "unavailable" in statuses:
+            counts["unavailable"] += 1
+        return PetOverviewItem.model_validate(item).model_dump_json() + "\n"
+
+    resources = _overview_resources(payload)
+    for pet in filtered:
+        if pet.get("id") not in by_id and not payload.only_with_upcoming_vaccination:
+            yield line(_overview_item(pet, None, None, resources))
+
+    async for pet_id, vaccination, weights in _stream_overview_health(
+        list(by_id),
+        sanctum_token=sanctum_token,
+        settings=settings,
+        user_id=user_id,
+        resources=resources,
+    ):
+        item = _overview_item(by_id[pet_id], vaccination, weights, resources)
+        if payload.only_with_upcoming_vaccination and item["next_vaccination_due_at"] is None:
+            continue
+        yield line(item)
+
+    yield json.dumps({"summary": counts}) + "\n"
+
+
 @router.get(
     "/pet-types",
     operation_id="list_pet_types",
@@ -194,162 +727,159 @@ async def _load_pet_recent_weights(
     description="Retrieve all available species/pet types. Call this before create_pet if you are unsure which species names are supported.",
 )
 async def get_pet_types(settings: Settings = Depends(get_settings)) -> Any:
-    pet_types = get_pet_types_by_name()
-    if not pet_types:
-        try:
-            await refresh_pet_types_cache(settings)
-        except MainAppError as exc:
-            return JSONResponse(status_code=exc.status_code, content=exc.payload)
-        pet_types = get_pet_types_by_name()
+    try:
+        pet_types = await ensure_pet_types(settings)
+    except MainAppError as exc:
+        return JSONResponse(status_code=exc.status_code, content=exc.payload)
 
-    return [PetTypeItem(id=pet_type_id, name=name) for name, pet_type_id in sorted(pet_types.items())]
+    return [PetTypeItem(id=pet_type_id, name=name) for name, pet_type_id in sorted(pet_types.by_name.items())]
 
 
 @router.get(
     "/pets",
     operation_id="list_pets",
-    response_model=list[PetSummary],
-    description="Return all pets belonging to the authenticated user. Use find_pet instead when the user refers to a pet by name — only call list_pets when the user explicitly wants to see all their pets.",
+    response_model=list[PetSummary] | PetSummaryPage,
+    description="Return all pets belonging to the authenticated user. Use find_pet instead when the user refers to a pet by name — only call list_pets when the user explicitly wants to see all their pets. Pass limit (and then next_cursor as cursor) to page through large accounts.",
 )
 async def list_pets(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
     name: str | None = Query(default=None),
     species: str | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=100),
+    cursor: str | None = Query(default=None, min_length=1),
 ) -> Any:
+    cursor_query = _cursor_query(name=name, species=species)
     try:
-        pets = await _load_pets(current_token, settings)
+        offset = _decode_cursor(cursor, cursor_query)
+    except ValueError as exc:
+        return _invalid_cursor_response(exc)
+
+    try:
+        matches = await _search_pets(current_token, settings, name=name, species=species)
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
 
-    return filter_pet_candidates(pets, name=name, species=species)
+    candidates = [pet for pet, _ in matches]
+    if limit is None:
+        return candidates
+    items, next_cursor = _page(candidates, offset, limit, cursor_query)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.post(
     "/pets/overview",
     operation_id="pets_overview",
-    response_model=list[PetOverviewItem],
+    response_model=list[PetOverviewItem] | PetsOverviewPage,
     description=(
         "Return many pets with next vaccination due dates, active vaccination records, recent weights, birthday context, and age in one call. "
-        "Use for cross-pet comparisons or summaries. Do not call per-pet vaccination or weight tools when this overview is enough."
+        "Use for cross-pet comparisons or summaries. Do not call per-pet vaccination or weight tools when this overview is enough. "
+        "For accounts with many pets, pass limit and then next_cursor as cursor to page through the results."
     ),
 )
 async def pets_overview(
     payload: PetsOverviewRequest,
+    request: Request,
+    response: Response,
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
-    if payload.species and not get_species_name_by_pet_type_id():
+    user_id, sanctum_token = current_token
+    streaming = _wants_ndjson(request)
+    if streaming and (payload.limit is not None or payload.cursor is not None):
+        return _error_response(
+            422,
+            "VALIDATION_ERROR",
+            "limit and cursor cannot be combined with a streaming (application/x-ndjson) overview",
+            fields=[{"name": "limit", "reason": "not_supported_when_streaming"}],
+        )
+    try:
+        offset = _decode_cursor(payload.cursor, _overview_cursor_query(payload))
+    except ValueError as exc:
+        return _invalid_cursor_response(exc)
+
+    if settings.OVERVIEW_SNAPSHOT_ENABLED and not streaming:
+        cached = await _overview_from_snapshot(payload, request, response, user_id, sanctum_token, offset)
+        if cached is not None:
+            return cached
+
+    if payload.species:
         try:
-            await refresh_pet_types_cache(settings)
+            await ensure_pet_types(settings)
         except MainAppError as exc:
             return JSONResponse(status_code=exc.status_code, content=exc.payload)
 
     try:
-        pets = await _load_pets(current_token, settings)
+        matches = await _search_pets(current_token, settings, name=payload.name, species=payload.species)
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
 
-    filtered = filter_pet_candidates(pets, name=payload.name, species=payload.species)
-    pets_with_ids = [pet for pet in filtered if pet.get("id") is not None]
-    vaccination_items = await asyncio.gather(
-        *[
-            _load_pet_next_vaccination_due(
-                pet_id=int(pet["id"]),
+    filtered = [pet for pet, _ in matches]
+    if streaming:
+        return StreamingResponse(
+            _overview_ndjson(
+                filtered,
+                payload,
                 sanctum_token=sanctum_token,
                 settings=settings,
-            )
-            for pet in pets_with_ids
-        ]
-    )
-    weight_items = await asyncio.gather(
-        *[
-            _load_pet_recent_weights(
-                pet_id=int(pet["id"]),
-                sanctum_token=sanctum_token,
-                settings=settings,
-            )
-            for pet in pets_with_ids
-        ]
+                user_id=user_id,
+            ),
+            media_type="application/x-ndjson",
+            # Ask nginx not to buffer, so each line reaches the client as it is produced.
+            headers={"X-Accel-Buffering": "no"},
+        )
+
+    # One latency budget for the whole request, even when health is loaded in
+    # two steps (the sort/filter resource first, the rest for the page).
+    load_health = partial(
+        _load_overview_health,
+        sanctum_token=sanctum_token,
+        settings=settings,
+        user_id=user_id,
+        deadline=asyncio.get_running_loop().time() + settings.OVERVIEW_LATENCY_BUDGET_SECONDS,
     )
 
-    by_pet_id: dict[int, tuple[date | None, str | None, str, list[dict[str, Any]]]] = {}
-    for pet, summary in zip(pets_with_ids, vaccination_items, strict=False):
-        by_pet_id[int(pet["id"])] = summary
-    weights_by_pet_id: dict[int, tuple[list[dict[str, Any]], str]] = {}
-    for pet, summary in zip(pets_with_ids, weight_items, strict=False):
-        weights_by_pet_id[int(pet["id"])] = summary
+    # Only the resources the answer needs are fetched. Without a limit they are
+    # loaded in one phase. With a limit, health data is fetched for the returned
+    # page only, except vaccinations when the filter or sort depends on them;
+    # those are loaded for every pet before paging.
+    resources = _overview_resources(payload)
+    vaccinations_order = payload.only_with_upcoming_vaccination or payload.sort_by == "next_vaccination_due_at"
+    if payload.limit is None:
+        preload: tuple[HealthResource, ...] = resources
+    elif vaccinations_order:
+        preload = ("vaccinations",)
+    else:
+        preload = ()
 
-    items: list[dict[str, Any]] = []
-    for pet in filtered:
-        pet_id = pet.get("id")
-        due_at: date | None = None
-        vaccine_name: str | None = None
-        vaccination_status = "unavailable"
-        active_vaccinations: list[dict[str, Any]] = []
-        recent_weights: list[dict[str, Any]] = []
-        weights_status = "unavailable"
-        if isinstance(pet_id, int):
-            due_at, vaccine_name, vaccination_status, active_vaccinations = by_pet_id.get(
-                pet_id, (None, None, "unavailable", [])
-            )
-            recent_weights, weights_status = weights_by_pet_id.get(pet_id, ([], "unavailable"))
-
-        item = {
-            **pet,
-            "active_vaccinations": active_vaccinations,
-            "recent_weights": recent_weights,
-            "next_vaccination_due_at": due_at,
-            "next_vaccination_name": vaccine_name,
-            "vaccination_data_status": vaccination_status,
-            "weights_data_status": weights_status,
-        }
-        items.append(item)
+    by_pet_id: dict[int, _VaccinationSummary] = {}
+    weights_by_pet_id: dict[int, _WeightsSummary] = {}
+    if preload:
+        by_pet_id, weights_by_pet_id = await load_health(
+            [int(pet["id"]) for pet in filtered if pet.get("id") is not None],
+            resources=preload,
+        )
 
-    if payload.only_with_upcoming_vaccination:
-        items = [item for item in items if item["next_vaccination_due_at"] is not None]
+    items = [
+        _overview_item(pet, _for_pet(by_pet_id, pet), _for_pet(weights_by_pet_id, pet), resources)
+        for pet in filtered
+    ]
 
-    if payload.sort_by == "next_vaccination_due_at":
-        if payload.sort_order == "asc":
-            items.sort(
-                key=lambda item: (
-                    item["next_vaccination_due_at"] is None,
-                    item["next_vaccination_due_at"] or date.max,
-                    str(item.get("name", "")).lower(),
-                )
-            )
-        else:
-            items.sort(
-                key=lambda item: (
-                    item["next_vaccination_due_at"] is not None,
-                    item["next_vaccination_due_at"] or date.min,
-                    str(item.get("name", "")).lower(),
-                ),
-                reverse=True,
-            )
-    elif payload.sort_by == "next_birthday_at":
-        if payload.sort_order == "asc":
-            items.sort(
-                key=lambda item: (
-                    item["next_birthday_at"] is None,
-                    item["next_birthday_at"] or date.max,
-                    str(item.get("name", "")).lower(),
-                )
-            )
-        else:
-            items.sort(
-                key=lambda item: (
-                    item["next_birthday_at"] is not None,
-                    item["next_birthday_at"] or date.min,
-                    str(item.get("name", "")).lower(),
-                ),
-                reverse=True,
-            )
-    else:
-        items.sort(key=lambda item: str(item.get("name", "")).lower(), reverse=payload.sort_order == "desc")
+    items = _order_overview_items(items, payload)
+    if payload.limit is None:
+        return items
 
-    return items
+    page, next_cursor = _page(items, offset, payload.limit, _overview_cursor_query(payload))
+    remaining = tuple(resource for resource in resources if resource not in preload)
+    page_ids = [item["id"] for item in page if isinstance(item.get("id"), int)]
+    if remaining and page_ids:
+        page_vaccinations, page_weights = await load_health(page_ids, resources=remaining)
+        by_pet_id.update(page_vaccinations)
+        page = [
+            _overview_item(item, _for_pet(by_pet_id, item), _for_pet(page_weights, item), resources)
+            for item in page
+        ]
+    return {"items": page, "next_cursor": next_cursor}
 
 
 @router.get(
@@ -386,12 +916,22 @@ async def find_pets(
     settings: Settings = Depends(get_settings),
 ) -> Any:
     try:
-        pets = await _load_pets(current_token, settings)
+        matches = await _search_pets(
+            current_token,
+            settings,
+            name=payload.name,
+            species=payload.species,
+            fuzzy=True,
+        )
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
 
-    candidates = filter_pet_candidates(pets, name=payload.name, species=payload.species)
-    return PetFindResponse(candidates=[PetSummary(**item) for item in candidates])
+    return PetFindResponse(
+        candidates=[
+            PetFindCandidate(**pet, match_score=match.score, match_type=match.kind)
+            for pet, match in matches
+        ]
+    )
 
 
 @router.post(
@@ -404,17 +944,11 @@ async def create_pet(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
-    pet_types = get_pet_types_by_name()
-    if not pet_types:
-        try:
-            await refresh_pet_types_cache(settings)
-        except MainAppError as exc:
-            return JSONResponse(status_code=exc.status_code, content=exc.payload)
-        pet_types = get_pet_types_by_name()
-
+    user_id, sanctum_token = current_token
     try:
-        pet_type_id = normalize_species_to_pet_type_id(payload.species, pet_types)
+        pet_type_id = await resolve_pet_type_id(payload.species, settings)
+    except MainAppError as exc:
+        return JSONResponse(status_code=exc.status_code, content=exc.payload)
     except ValueError as exc:
         return _error_response(
             422,
@@ -476,6 +1010,8 @@ async def create_pet(
             json_data=upstream_payload,
             return_status=True,
         )
+        invalidate_pets(user_id)
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
         return JSONResponse(status_code=status_code, content=body)
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
@@ -492,7 +1028,7 @@ async def update_pet(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
+    user_id, sanctum_token = current_token
     upstream_payload: dict[str, Any] = {}
 
     if payload.name is not None:
@@ -503,16 +1039,10 @@ async def update_pet(
         upstream_payload["sex"] = normalize_sex(payload.sex)
 
     if payload.species is not None:
-        pet_types = get_pet_types_by_name()
-        if not pet_types:
-            try:
-                await refresh_pet_types_cache(settings)
-            except MainAppError as exc:
-                return JSONResponse(status_code=exc.status_code, content=exc.payload)
-            pet_types = get_pet_types_by_name()
-
         try:
-            upstream_payload["pet_type_id"] = normalize_species_to_pet_type_id(payload.species, pet_types)
+            upstream_payload["pet_type_id"] = await resolve_pet_type_id(payload.species, settings)
+        except MainAppError as exc:
+            return JSONResponse(status_code=exc.status_code, content=exc.payload)
         except ValueError as exc:
             return _error_response(
                 422,
@@ -539,12 +1069,15 @@ async def update_pet(
 
     try:
         # This upstream update depends on the main app's generic PAT contract (`update`).
-        return await call_main_app(
+        body = await call_main_app(
             method="PUT",
             path=f"/api/pets/{pet_id}",
             settings=settings,
             sanctum_token=sanctum_token,
             json_data=upstream_payload,
         )
+        invalidate_pets(user_id)
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
+        return body
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
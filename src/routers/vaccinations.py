@@ -8,7 +8,9 @@ from fastapi.responses import JSONResponse
 from src.core.config import Settings, get_settings
 from src.core.dependencies import get_current_token_limited as get_current_token
 from src.models.health import CreateVaccinationRequest, UpdateVaccinationRequest
+from src.services import overview_snapshot
 from src.services.main_app import MainAppError, call_main_app
+from src.services.pet_cache import invalidate_pet_health
 
 router = APIRouter(tags=["vaccinations"])
 
@@ -46,7 +48,7 @@ async def create_vaccination(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
+    user_id, sanctum_token = current_token
     upstream: dict[str, Any] = {
         "vaccine_name": payload.vaccine_name,
         "administered_at": payload.administered_at.isoformat(),
@@ -65,6 +67,8 @@ async def create_vaccination(
             json_data=upstream,
             return_status=True,
         )
+        invalidate_pet_health(user_id, pet_id, "vaccinations")
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
         return JSONResponse(status_code=status_code, content=body)
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
@@ -82,7 +86,7 @@ async def update_vaccination(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
+    user_id, sanctum_token = current_token
     upstream: dict[str, Any] = {}
     if payload.vaccine_name is not None:
         upstream["vaccine_name"] = payload.vaccine_name
@@ -94,12 +98,15 @@ async def update_vaccination(
         upstream["notes"] = payload.notes
 
     try:
-        return await call_main_app(
+        body = await call_main_app(
             method="PUT",
             path=f"/api/pets/{pet_id}/vaccinations/{vaccination_id}",
             settings=settings,
             sanctum_token=sanctum_token,
             json_data=upstream,
         )
+        invalidate_pet_health(user_id, pet_id, "vaccinations")
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
+        return body
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
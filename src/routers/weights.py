@@ -9,7 +9,9 @@ from fastapi.responses import JSONResponse
 from src.core.config import Settings, get_settings
 from src.core.dependencies import get_current_token_limited as get_current_token
 from src.models.health import CreateWeightRequest, UpdateWeightRequest
+from src.services import overview_snapshot
 from src.services.main_app import MainAppError, call_main_app
+from src.services.pet_cache import invalidate_pet_health
 
 router = APIRouter(tags=["weights"])
 
@@ -47,7 +49,7 @@ async def create_weight(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
+    user_id, sanctum_token = current_token
     record_date = payload.measured_at if payload.measured_at is not None else date.today()
     upstream: dict[str, Any] = {
         "weight_kg": payload.weight_kg,
@@ -63,6 +65,8 @@ async def create_weight(
             json_data=upstream,
             return_status=True,
         )
+        invalidate_pet_health(user_id, pet_id, "weights")
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
         return JSONResponse(status_code=status_code, content=body)
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
@@ -80,7 +84,7 @@ async def update_weight(
     current_token: Annotated[tuple[int, str], Depends(get_current_token)],
     settings: Settings = Depends(get_settings),
 ) -> Any:
-    _, sanctum_token = current_token
+    user_id, sanctum_token = current_token
     upstream: dict[str, Any] = {}
     if payload.weight_kg is not None:
         upstream["weight_kg"] = payload.weight_kg
@@ -88,12 +92,15 @@ async def update_weight(
         upstream["record_date"] = payload.measured_at.isoformat()
 
     try:
-        return await call_main_app(
+        body = await call_main_app(
             method="PUT",
             path=f"/api/pets/{pet_id}/weights/{weight_id}",
             settings=settings,
             sanctum_token=sanctum_token,
             json_data=upstream,
         )
+        invalidate_pet_health(user_id, pet_id, "weights")
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
+        return body
     except MainAppError as exc:
         return JSONResponse(status_code=exc.status_code, content=exc.payload)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker over a count-based sliding window.
+
+    closed    — calls flow; outcomes are recorded in the window. Once at least
+                ``min_calls`` outcomes are recorded and the failure rate reaches
+                ``failure_rate_threshold`` the breaker opens.
+    open      — calls are rejected without touching the upstream until
+                ``open_seconds`` have elapsed.
+    half_open — up to ``half_open_max_calls`` trial calls are let through. If all
+                of them succeed the breaker closes; any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float,
+        window_size: int,
+        min_calls: int,
+        open_seconds: float,
+        half_open_max_calls: int,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._window: deque[bool] = deque(maxlen=window_size)
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._trial_permits = 0
+        self._trial_successes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = "half_open"
+            self._trial_permits = 0
+            self._trial_successes = 0
+        return self._state
+
+    def failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return self._window.count(False) / len(self._window)
+
+    def try_acquire(self) -> bool:
+        """Return True if a call may proceed. Every granted call must be followed
+        by exactly one of record_success(), record_failure() or release()."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._trial_permits < self.half_open_max_calls:
+            self._trial_permits += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state == "open":
+            return
+        if self._state == "half_open":
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_max_calls:
+                self._close()
+            return
+        self._window.append(True)
+
+    def record_failure(self) -> None:
+        if self._state == "open":
+            return
+        if self._state == "half_open":
+            self._open()
+            return
+        self._window.append(False)
+        if len(self._window) >= self.min_calls and self.failure_rate() >= self.failure_rate_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give back a permit whose call ended without an outcome (e.g. cancelled)."""
+        if self._state == "half_open" and self._trial_permits > 0:
+            self._trial_permits -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 2),
+            "window_calls": len(self._window),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        self._state = "closed"
+        self._window.clear()
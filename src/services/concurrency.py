@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any
+
+
+class LimiterTimeout(Exception):
+    """Raised when a caller waits longer than its deadline for a concurrency slot."""
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for calls to a single upstream.
+
+    The limit grows by one per window of ``limit`` calls that succeed within
+    ``latency_target`` while the limit is actually being used (at least half the
+    slots busy), so growth is additive per round trip rather than per call. It
+    shrinks multiplicatively by ``backoff_ratio`` on a failure or a slow call.
+    Callers over the limit wait FIFO and give up after their deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        backoff_ratio: float = 0.9,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, timeout: float) -> None:
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                waiter.cancel()
+            if isinstance(exc, TimeoutError):
+                self.rejected += 1
+                raise LimiterTimeout() from exc
+            raise
+
+    def release(self, *, latency: float, ok: bool) -> None:
+        if not ok or latency > self.latency_target:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+            self._successes = 0
+        elif self._in_flight * 2 >= self._limit:
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._limit = min(float(self.max_limit), self._limit + 1.0)
+                self._successes = 0
+        self._in_flight -= 1
+        self._wake()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "rejected": self.rejected,
+        }
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
@@ -1,22 +1,240 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
+import random
+import time
 import uuid
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 
+from src.core import redis as redis_store
+from src.core.cache import TTLCache
 from src.core.config import Settings
+from src.core.logging import get_logger
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.concurrency import AdaptiveLimiter, LimiterTimeout
+from src.services.pets_normalization import normalize_species_to_pet_type_id
+from src.services.retry import RetryBudget, backoff_delay, parse_retry_after
+from src.services.singleflight import SingleFlight
 
 
 class MainAppError(Exception):
-    def __init__(self, status_code: int, payload: dict[str, Any]):
+    def __init__(
+        self,
+        status_code: int,
+        payload: dict[str, Any],
+        *,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ):
         self.status_code = status_code
         self.payload = payload
+        self.retryable = retryable
+        self.retry_after = retry_after
         super().__init__(payload.get("message", "Main app error"))
 
 
-_PET_TYPES_BY_NAME: dict[str, int] = {}
-_PET_TYPES_BY_ID: dict[int, str] = {}
+@dataclass(frozen=True)
+class PetTypesSnapshot:
+    """Read-only pet types table. Replaced as a whole on refresh, never mutated."""
+
+    version: int
+    by_name: Mapping[str, int]
+    by_id: Mapping[int, str]
+
+    def __bool__(self) -> bool:
+        return bool(self.by_id)
+
+
+_EMPTY_PET_TYPES = PetTypesSnapshot(version=0, by_name=MappingProxyType({}), by_id=MappingProxyType({}))
+_pet_types: PetTypesSnapshot = _EMPTY_PET_TYPES
+# Concurrent reloads (empty table, unknown species, the refresher) share one request.
+_pet_types_reload: SingleFlight[PetTypesSnapshot] = SingleFlight()
+_pet_types_last_miss_refresh = float("-inf")
+_pet_types_refresher: asyncio.Task[None] | None = None
+# Cross-worker copy in Redis; other workers are told about new versions over pub/sub.
+_PET_TYPES_SHARED_KEY = "pet_types:table"
+_PET_TYPES_VERSION_KEY = "pet_types:version"
+_PET_TYPES_CHANNEL = "pet_types:updated"
+_PET_TYPES_SHARED_TTL_SECONDS = 7 * 24 * 3600
+# An unreachable Redis must not hold up startup; fall back to the main app quickly.
+_PET_TYPES_SHARED_TIMEOUT_SECONDS = 1.0
+_pet_types_shared_version = 0
+
+_get_coalescer: SingleFlight[tuple[int, Any]] = SingleFlight()
+_circuit_breaker: CircuitBreaker | None = None
+_retry_budget: RetryBudget | None = None
+_limiter: AdaptiveLimiter | None = None
+
+
+@dataclass(frozen=True)
+class _ValidatedResponse:
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+
+
+_validator_cache: TTLCache[tuple[Any, ...], _ValidatedResponse] | None = None
+_revalidation_stats: dict[str, int] = {"not_modified": 0, "modified": 0}
+
+_RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+_http_client: httpx.AsyncClient | None = None
+_pool_max_connections = 0
+_pool_stats: dict[str, int] = {
+    "in_flight": 0,
+    "peak_in_flight": 0,
+    "requests": 0,
+    "pool_timeouts": 0,
+}
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Build the pooled upstream client. Per-call timeouts are passed on each request."""
+    limits = httpx.Limits(
+        max_connections=settings.MAIN_APP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.MAIN_APP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.MAIN_APP_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(limits=limits, http2=settings.MAIN_APP_HTTP2)
+
+
+async def start_http_client(settings: Settings) -> None:
+    """Open the process-wide upstream client. Called once from the app lifespan."""
+    global _http_client, _pool_max_connections
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = create_http_client(settings)
+    _pool_max_connections = settings.MAIN_APP_MAX_CONNECTIONS
+
+
+async def close_http_client() -> None:
+    """Close the process-wide upstream client and release pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_pool_stats() -> dict[str, Any]:
+    """Snapshot of upstream pool usage for the admin dashboard.
+
+    ``saturation`` is in-flight requests over the connection limit; values near
+    1.0 (or a growing ``pool_timeouts`` count) mean callers are queueing for a
+    connection rather than waiting on the main app itself.
+    """
+    in_flight = _pool_stats["in_flight"]
+    return {
+        **_pool_stats,
+        "max_connections": _pool_max_connections,
+        "saturation": round(in_flight / _pool_max_connections, 2) if _pool_max_connections else 0.0,
+        "shared_client": _http_client is not None,
+    }
+
+
+def get_coalescing_stats() -> dict[str, int]:
+    """Counters for GET coalescing: upstream requests made vs. callers that piggybacked."""
+    return {
+        "leaders": _get_coalescer.leaders,
+        "coalesced": _get_coalescer.coalesced,
+        "in_flight": _get_coalescer.in_flight,
+    }
+
+
+def _get_circuit_breaker(settings: Settings) -> CircuitBreaker:
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            window_size=settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+        )
+    return _circuit_breaker
+
+
+def get_circuit_breaker_stats() -> dict[str, Any]:
+    """State of the main app circuit breaker for /health and the admin dashboard."""
+    if _circuit_breaker is None:
+        return {"state": "closed", "failure_rate": 0.0, "window_calls": 0, "rejected": 0, "times_opened": 0}
+    return _circuit_breaker.snapshot()
+
+
+def _get_retry_budget(settings: Settings) -> RetryBudget:
+    global _retry_budget
+    if _retry_budget is None:
+        _retry_budget = RetryBudget(
+            ratio=settings.MAIN_APP_RETRY_BUDGET_RATIO,
+            max_tokens=settings.MAIN_APP_RETRY_BUDGET_MAX_TOKENS,
+        )
+    return _retry_budget
+
+
+def get_retry_stats() -> dict[str, Any]:
+    if _retry_budget is None:
+        return {"retries": 0, "exhausted": 0, "tokens": None}
+    return {
+        "retries": _retry_budget.retries,
+        "exhausted": _retry_budget.exhausted,
+        "tokens": round(_retry_budget.tokens, 2),
+    }
+
+
+def _get_limiter(settings: Settings) -> AdaptiveLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = AdaptiveLimiter(
+            initial_limit=settings.MAIN_APP_CONCURRENCY_INITIAL,
+            min_limit=settings.MAIN_APP_CONCURRENCY_MIN,
+            max_limit=settings.MAIN_APP_CONCURRENCY_MAX,
+            latency_target=settings.MAIN_APP_LATENCY_TARGET_SECONDS,
+        )
+    return _limiter
+
+
+def get_concurrency_stats() -> dict[str, Any]:
+    """Current adaptive limit, in-flight calls, queued callers and deadline rejections."""
+    if _limiter is None:
+        return {"limit": None, "in_flight": 0, "queue_depth": 0, "rejected": 0}
+    return _limiter.snapshot()
+
+
+def _get_validator_cache(settings: Settings) -> TTLCache[tuple[Any, ...], _ValidatedResponse]:
+    global _validator_cache
+    if _validator_cache is None:
+        _validator_cache = TTLCache(
+            maxsize=settings.MAIN_APP_VALIDATOR_CACHE_SIZE,
+            ttl=settings.MAIN_APP_VALIDATOR_CACHE_TTL_SECONDS,
+        )
+    return _validator_cache
+
+
+def get_revalidation_stats() -> dict[str, int]:
+    """How many conditional GETs were answered 304 (served from cache) vs. re-downloaded."""
+    return {
+        **_revalidation_stats,
+        "entries": len(_validator_cache) if _validator_cache is not None else 0,
+    }
+
+
+def clear_validator_cache() -> None:
+    if _validator_cache is not None:
+        _validator_cache.clear()
+
+
+def reset_resilience_state() -> None:
+    """Forget breaker, retry-budget and limiter state (tests, or after reconfiguration)."""
+    global _circuit_breaker, _retry_budget, _limiter
+    _circuit_breaker = None
+    _retry_budget = None
+    _limiter = None
 
 
 def _request_id() -> str:
@@ -140,34 +358,120 @@ def _normalize_http_error(status_code: int, upstream_data: Any) -> tuple[int, di
     }
 
 
-async def call_main_app(
+async def _send(
     *,
     method: str,
-    path: str,
+    url: str,
+    headers: dict[str, str],
+    json_data: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+    timeout: float,
+) -> httpx.Response:
+    client = _http_client
+    _pool_stats["requests"] += 1
+    _pool_stats["in_flight"] += 1
+    _pool_stats["peak_in_flight"] = max(_pool_stats["peak_in_flight"], _pool_stats["in_flight"])
+    try:
+        if client is None:
+            # No lifespan (scripts, direct unit tests): fall back to a one-off client.
+            async with httpx.AsyncClient(timeout=timeout) as one_off:
+                return await one_off.request(
+                    method=method, url=url, headers=headers, json=json_data, params=params
+                )
+        return await client.request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=json_data,
+            params=params,
+            timeout=timeout,
+        )
+    except httpx.PoolTimeout:
+        _pool_stats["pool_timeouts"] += 1
+        raise
+    finally:
+        _pool_stats["in_flight"] -= 1
+
+
+async def _send_limited(
+    *,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    json_data: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+    timeout: float,
     settings: Settings,
-    sanctum_token: str | None = None,
-    use_connector_api_key: bool = False,
-    json_data: dict[str, Any] | None = None,
-    params: dict[str, Any] | None = None,
-    timeout: float = 10.0,
-    return_status: bool = False,
-) -> Any:
-    headers: dict[str, str] = {}
-    if sanctum_token:
-        headers["Authorization"] = f"Bearer {sanctum_token}"
-    elif use_connector_api_key:
-        headers["Authorization"] = f"Bearer {settings.CONNECTOR_API_KEY}"
+) -> httpx.Response:
+    limiter = _get_limiter(settings) if settings.MAIN_APP_ADAPTIVE_CONCURRENCY else None
+    if limiter is not None:
+        try:
+            await limiter.acquire(settings.MAIN_APP_QUEUE_TIMEOUT_SECONDS)
+        except LimiterTimeout as exc:
+            _, payload = _normalize_http_error(
+                503, {"message": "Main app is busy. Please try again shortly."}
+            )
+            raise MainAppError(status_code=503, payload=payload) from exc
 
+    started = time.perf_counter()
+    ok = False
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.request(
-                method=method,
-                url=f"{settings.MAIN_APP_URL}{path}",
-                headers=headers,
-                json=json_data,
-                params=params,
-            )
+        resp = await _send(
+            method=method,
+            url=url,
+            headers=headers,
+            json_data=json_data,
+            params=params,
+            timeout=timeout,
+        )
+        ok = resp.status_code < 500
+        return resp
+    finally:
+        if limiter is not None:
+            limiter.release(latency=time.perf_counter() - started, ok=ok)
+
+
+async def _request(
+    *,
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    json_data: dict[str, Any] | None,
+    params: dict[str, Any] | None,
+    timeout: float,
+    settings: Settings,
+    validator_key: tuple[Any, ...] | None = None,
+) -> tuple[int, Any]:
+    cached: _ValidatedResponse | None = None
+    if validator_key is not None:
+        cached = _get_validator_cache(settings).get(validator_key)
+        if cached is not None:
+            headers = dict(headers)
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+    breaker = _get_circuit_breaker(settings) if settings.CIRCUIT_BREAKER_ENABLED else None
+    if breaker is not None and not breaker.try_acquire():
+        # Fail fast while the main app is known to be unhealthy instead of
+        # holding the worker for a full timeout.
+        _, payload = _normalize_http_error(503, None)
+        raise MainAppError(status_code=503, payload=payload)
+
+    try:
+        resp = await _send_limited(
+            method=method,
+            url=url,
+            headers=headers,
+            json_data=json_data,
+            params=params,
+            timeout=timeout,
+            settings=settings,
+        )
     except httpx.RequestError as exc:
+        if breaker is not None:
+            breaker.record_failure()
         raise MainAppError(
             status_code=502,
             payload={
@@ -176,17 +480,35 @@ async def call_main_app(
                 "fields": [],
                 "request_id": _request_id(),
             },
+            retryable=True,
         ) from exc
+    except BaseException:
+        if breaker is not None:
+            breaker.release()
+        raise
+
+    if breaker is not None:
+        if resp.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    if resp.status_code == 304 and cached is not None:
+        _revalidation_stats["not_modified"] += 1
+        return 200, cached.payload
 
     if 200 <= resp.status_code < 300:
-        if not resp.content:
-            payload: Any = {}
-            return (resp.status_code, payload) if return_status else payload
-        try:
-            payload = resp.json()
-        except ValueError:
-            payload = {}
-        return (resp.status_code, payload) if return_status else payload
+        payload = {}
+        if resp.content:
+            try:
+                payload = resp.json()
+            except ValueError:
+                payload = {}
+        if validator_key is not None:
+            _store_validated(validator_key, resp, payload, settings)
+            if cached is not None:
+                _revalidation_stats["modified"] += 1
+        return resp.status_code, payload
 
     try:
         upstream_data = resp.json()
@@ -194,10 +516,253 @@ async def call_main_app(
         upstream_data = {"message": resp.text}
 
     normalized_status, payload = _normalize_http_error(resp.status_code, upstream_data)
-    raise MainAppError(status_code=normalized_status, payload=payload)
+    retry_after = parse_retry_after(_extract_retry_after(upstream_data))
+    raise MainAppError(
+        status_code=normalized_status,
+        payload=payload,
+        retryable=resp.status_code in _RETRYABLE_STATUSES
+        or (resp.status_code == 429 and retry_after is not None),
+        retry_after=retry_after,
+    )
+
+
+def _store_validated(
+    validator_key: tuple[Any, ...], resp: httpx.Response, payload: Any, settings: Settings
+) -> None:
+    cache = _get_validator_cache(settings)
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.set(validator_key, _ValidatedResponse(etag, last_modified, payload))
+    else:
+        cache.pop(validator_key)
+
+
+async def _request_with_retry(settings: Settings, **kwargs: Any) -> tuple[int, Any]:
+    """Run an idempotent request, retrying transient failures within the retry budget.
+
+    Delays use exponential backoff with full jitter. An upstream ``retry_after``
+    hint raises the delay to at least that long; if the hint exceeds
+    MAIN_APP_RETRY_MAX_DELAY the error is returned instead of waiting.
+    """
+    budget = _get_retry_budget(settings)
+    budget.deposit()
+    attempt = 0
+    while True:
+        try:
+            return await _request(settings=settings, **kwargs)
+        except MainAppError as exc:
+            if not exc.retryable or attempt >= settings.MAIN_APP_RETRY_ATTEMPTS:
+                raise
+            delay = backoff_delay(
+                attempt,
+                base=settings.MAIN_APP_RETRY_BASE_DELAY,
+                cap=settings.MAIN_APP_RETRY_MAX_DELAY,
+            )
+            if exc.retry_after is not None:
+                if exc.retry_after > settings.MAIN_APP_RETRY_MAX_DELAY:
+                    raise
+                delay = max(delay, exc.retry_after)
+            if not budget.try_withdraw():
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _params_key(params: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    if not params:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in params.items()))
+
+
+async def call_main_app(
+    *,
+    method: str,
+    path: str,
+    settings: Settings,
+    sanctum_token: str | None = None,
+    use_connector_api_key: bool = False,
+    json_data: dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+    timeout: float | None = None,
+    return_status: bool = False,
+) -> Any:
+    headers: dict[str, str] = {}
+    if sanctum_token:
+        headers["Authorization"] = f"Bearer {sanctum_token}"
+    elif use_connector_api_key:
+        headers["Authorization"] = f"Bearer {settings.CONNECTOR_API_KEY}"
+
+    is_get = method.upper() == "GET"
+    request_kwargs: dict[str, Any] = {
+        "method": method,
+        "url": f"{settings.MAIN_APP_URL}{path}",
+        "headers": headers,
+        "json_data": json_data,
+        "params": params,
+        "timeout": timeout if timeout is not None else settings.MAIN_APP_TIMEOUT_SECONDS,
+        "settings": settings,
+    }
+
+    async def send() -> tuple[int, Any]:
+        # Only GETs are retried: the main app gives no idempotency guarantees for writes.
+        if not is_get:
+            return await _request(**request_kwargs)
+        # Reads remember ETag/Last-Modified per (caller, path, params) and
+        # revalidate on later calls, so an unchanged list costs a bodiless 304.
+        validator_key = (
+            (headers.get("Authorization"), path, _params_key(params))
+            if settings.MAIN_APP_CONDITIONAL_GETS
+            else None
+        )
+        return await _request_with_retry(**request_kwargs, validator_key=validator_key)
+
+    if is_get and settings.MAIN_APP_COALESCE_GETS:
+        # Identical concurrent reads (parallel GPT actions, client retries) share
+        # one upstream request. The key includes the bearer token, so responses
+        # are never shared across users.
+        key = (headers.get("Authorization"), "GET", path, _params_key(params))
+        status_code, payload = await _get_coalescer.do(key, send)
+    else:
+        status_code, payload = await send()
+
+    return (status_code, payload) if return_status else payload
+
+
+def _page_items(body: Any) -> list[dict[str, Any]]:
+    """Return the dict items of a list response, bare or wrapped in ``data``."""
+    if isinstance(body, list):
+        return [item for item in body if isinstance(item, dict)]
+    if isinstance(body, dict) and isinstance(body.get("data"), list):
+        return [item for item in body["data"] if isinstance(item, dict)]
+    return []
+
+
+def _pagination(body: Any) -> tuple[int, int | None, bool] | None:
+    """Read a Laravel paginator envelope as ``(current_page, last_page, has_next)``.
+
+    Handles both the resource-collection shape (``meta`` + ``links``) and the flat
+    ``paginate()`` shape. ``last_page`` is None for ``simplePaginate()`` responses,
+    which only say whether a next page exists. Returns None for unpaginated bodies.
+    """
+    if not isinstance(body, dict) or not isinstance(body.get("data"), list):
+        return None
+    meta = body.get("meta")
+    if not isinstance(meta, dict):
+        meta = body
+    links = body.get("links")
+    if not isinstance(links, dict):
+        links = {}
+    current_page = meta.get("current_page")
+    if not isinstance(current_page, int):
+        return None
+    last_page = meta.get("last_page")
+    has_next = bool(links.get("next") or meta.get("next_page_url"))
+    return current_page, last_page if isinstance(last_page, int) else None, has_next
+
+
+def _log_truncated_pagination(path: str, pages: int, max_pages: int) -> None:
+    get_logger("main_app").warning(
+        "upstream_pagination_truncated",
+        path=path,
+        pages=pages,
+        max_pages=max_pages,
+    )
+
+
+async def iter_main_app_list(
+    *,
+    path: str,
+    settings: Settings,
+    sanctum_token: str | None = None,
+    params: dict[str, Any] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield every item of a main app list endpoint, following Laravel pagination.
+
+    The first page is fetched on its own. If its envelope reports ``last_page``,
+    the remaining pages are fetched concurrently (at most
+    MAIN_APP_PAGE_CONCURRENCY at once) and yielded in page order as they
+    complete. Without ``last_page`` (simple pagination), ``next`` links are
+    followed one page at a time. At most MAIN_APP_MAX_PAGES pages are read.
+    """
+
+    async def fetch(page: int | None) -> Any:
+        page_params = dict(params or {})
+        if page is not None:
+            page_params["page"] = page
+        return await call_main_app(
+            method="GET",
+            path=path,
+            settings=settings,
+            sanctum_token=sanctum_token,
+            params=page_params or None,
+        )
+
+    body = await fetch(None)
+    for item in _page_items(body):
+        yield item
+
+    pagination = _pagination(body)
+    if pagination is None:
+        return
+    current_page, last_page, has_next = pagination
+    max_page = settings.MAIN_APP_MAX_PAGES
+
+    if last_page is None:
+        while has_next and current_page < max_page:
+            body = await fetch(current_page + 1)
+            for item in _page_items(body):
+                yield item
+            pagination = _pagination(body)
+            if pagination is None:
+                return
+            current_page, _, has_next = pagination
+        if has_next:
+            _log_truncated_pagination(path, current_page + 1, max_page)
+        return
+
+    if last_page > max_page:
+        _log_truncated_pagination(path, last_page, max_page)
+
+    semaphore = asyncio.Semaphore(settings.MAIN_APP_PAGE_CONCURRENCY)
+
+    async def bounded_fetch(page: int) -> Any:
+        async with semaphore:
+            return await fetch(page)
+
+    tasks = [
+        asyncio.create_task(bounded_fetch(page))
+        for page in range(current_page + 1, min(last_page, max_page) + 1)
+    ]
+    try:
+        for task in tasks:
+            for item in _page_items(await task):
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def refresh_pet_types_cache(settings: Settings, *, prefer_shared: bool = False) -> PetTypesSnapshot:
+    """Reload pet types. Concurrent callers share one reload.
+
+    With ``prefer_shared`` the table another worker stored in Redis is used when
+    available, and the main app is only asked if Redis has nothing (or is down).
+    """
+    if prefer_shared and settings.PET_TYPES_SHARED_CACHE:
+        return await _pet_types_reload.do("shared", lambda: _load_shared_or_upstream_pet_types(settings))
+    return await _pet_types_reload.do("upstream", lambda: _load_pet_types(settings))
 
 
-async def refresh_pet_types_cache(settings: Settings) -> None:
+async def _load_shared_or_upstream_pet_types(settings: Settings) -> PetTypesSnapshot:
+    snapshot = await _load_shared_pet_types()
+    if snapshot is not None:
+        return snapshot
+    return await _pet_types_reload.do("upstream", lambda: _load_pet_types(settings))
+
+
+async def _load_pet_types(settings: Settings) -> PetTypesSnapshot:
     data = await call_main_app(
         method="GET",
         path="/api/pet-types",
@@ -205,7 +770,22 @@ async def refresh_pet_types_cache(settings: Settings) -> None:
         timeout=8.0,
     )
 
-    items = data if isinstance(data, list) else data.get("data", [])
+    items = data if isinstance(data, list) else data.get("data", []) if isinstance(data, dict) else []
+    by_name, by_id = _parse_pet_types(items)
+    if not by_id and _pet_types:
+        # An empty or malformed answer would make every species unknown; keep
+        # the table we have until the main app returns a usable one.
+        get_logger("main_app").warning("pet_types_refresh_empty")
+        return _pet_types
+    previous = _pet_types
+    snapshot = _set_pet_types(by_name, by_id)
+    # Only a changed table is worth a new shared version and a notification.
+    if settings.PET_TYPES_SHARED_CACHE and snapshot is not previous:
+        await _store_shared_pet_types(by_id)
+    return snapshot
+
+
+def _parse_pet_types(items: Any) -> tuple[dict[str, int], dict[int, str]]:
     by_name: dict[str, int] = {}
     by_id: dict[int, str] = {}
 
@@ -227,18 +807,166 @@ async def refresh_pet_types_cache(settings: Settings) -> None:
             by_name[normalized_name] = pet_type_id
             by_id[pet_type_id] = normalized_name
 
-    _PET_TYPES_BY_NAME.clear()
-    _PET_TYPES_BY_NAME.update(by_name)
-    _PET_TYPES_BY_ID.clear()
-    _PET_TYPES_BY_ID.update(by_id)
+    return by_name, by_id
+
 
+async def _store_shared_pet_types(by_id: Mapping[int, str]) -> None:
+    """Store the table in Redis under a new version and tell the other workers. Best-effort."""
+    if not by_id:
+        return
 
-def get_pet_types_by_name() -> dict[str, int]:
-    return dict(_PET_TYPES_BY_NAME)
+    async def store() -> None:
+        global _pet_types_shared_version
+        version = await redis_store.incr(_PET_TYPES_VERSION_KEY)
+        blob = {"version": version, "items": [{"id": pet_type_id, "name": name} for pet_type_id, name in by_id.items()]}
+        await redis_store.set_with_ttl(_PET_TYPES_SHARED_KEY, json.dumps(blob), _PET_TYPES_SHARED_TTL_SECONDS)
+        # Set before publishing so this worker ignores its own notification.
+        _pet_types_shared_version = version
+        await redis_store.publish(_PET_TYPES_CHANNEL, str(version))
+
+    try:
+        await asyncio.wait_for(store(), _PET_TYPES_SHARED_TIMEOUT_SECONDS)
+    except Exception:
+        get_logger("main_app").warning("pet_types_shared_store_failed")
 
 
-def get_species_name_by_pet_type_id() -> dict[int, str]:
-    return dict(_PET_TYPES_BY_ID)
+async def _load_shared_pet_types() -> PetTypesSnapshot | None:
+    """Adopt the table stored in Redis. None if missing, unreadable or Redis is down."""
+    global _pet_types_shared_version
+    try:
+        raw = await asyncio.wait_for(redis_store.get(_PET_TYPES_SHARED_KEY), _PET_TYPES_SHARED_TIMEOUT_SECONDS)
+        if raw is None:
+            return None
+        blob = json.loads(raw)
+        version = int(blob["version"])
+        by_name, by_id = _parse_pet_types(blob["items"])
+    except Exception:
+        return None
+    if not by_id:
+        return None
+    if version <= _pet_types_shared_version and _pet_types:
+        return _pet_types
+    _pet_types_shared_version = version
+    return _set_pet_types(by_name, by_id)
+
+
+def _on_pet_types_published(message: str) -> None:
+    try:
+        version = int(message)
+    except ValueError:
+        return
+    if version > _pet_types_shared_version:
+        # Adopt from Redis only. Going to the main app here would store and
+        # publish yet another version, and the workers would wake each other up.
+        task = asyncio.create_task(_load_shared_pet_types())
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
+def _set_pet_types(by_name: dict[str, int], by_id: dict[int, str]) -> PetTypesSnapshot:
+    # Build the complete snapshot first and publish it with a single rebinding,
+    # so readers see either the old table or the new one, never a partial one.
+    # An unchanged table keeps its snapshot, so anything keyed on it stays valid.
+    global _pet_types
+    if _pet_types and by_id == _pet_types.by_id and by_name == _pet_types.by_name:
+        return _pet_types
+    snapshot = PetTypesSnapshot(
+        version=_pet_types.version + 1,
+        by_name=MappingProxyType(by_name),
+        by_id=MappingProxyType(by_id),
+    )
+    _pet_types = snapshot
+    return snapshot
+
+
+def clear_pet_types_cache() -> None:
+    global _pet_types, _pet_types_last_miss_refresh, _pet_types_shared_version
+    _pet_types = _EMPTY_PET_TYPES
+    _pet_types_last_miss_refresh = float("-inf")
+    _pet_types_shared_version = 0
+    _pet_types_reload.reset()
+
+
+def get_pet_types() -> PetTypesSnapshot:
+    return _pet_types
+
+
+def get_pet_types_by_name() -> Mapping[str, int]:
+    return _pet_types.by_name
+
+
+def get_species_name_by_pet_type_id() -> Mapping[int, str]:
+    return _pet_types.by_id
+
+
+async def ensure_pet_types(settings: Settings) -> PetTypesSnapshot:
+    """Return the pet types table, loading it first if it is still empty."""
+    if _pet_types:
+        return _pet_types
+    return await refresh_pet_types_cache(settings, prefer_shared=True)
+
+
+async def resolve_pet_type_id(species: str, settings: Settings) -> int:
+    """Map a species name to its pet_type_id.
+
+    An unknown name triggers one reload (at most once per
+    ``PET_TYPES_MISS_REFRESH_SECONDS``) in case the type was added upstream
+    since the last refresh. Raises ValueError if it is still unknown.
+    """
+    global _pet_types_last_miss_refresh
+    pet_types = await ensure_pet_types(settings)
+    try:
+        return normalize_species_to_pet_type_id(species, pet_types.by_name)
+    except ValueError:
+        now = time.monotonic()
+        if now - _pet_types_last_miss_refresh < settings.PET_TYPES_MISS_REFRESH_SECONDS:
+            raise
+        _pet_types_last_miss_refresh = now
+
+    try:
+        pet_types = await refresh_pet_types_cache(settings)
+    except MainAppError:
+        pet_types = _pet_types
+    return normalize_species_to_pet_type_id(species, pet_types.by_name)
+
+
+async def _run_pet_types_refresher(settings: Settings) -> None:
+    interval = settings.PET_TYPES_REFRESH_SECONDS
+    while True:
+        # Jitter spreads reloads from several workers started at the same time.
+        jitter = random.uniform(-1.0, 1.0) * settings.PET_TYPES_REFRESH_JITTER * interval
+        await asyncio.sleep(max(0.0, interval + jitter))
+        try:
+            await refresh_pet_types_cache(settings)
+        except MainAppError as exc:
+            get_logger("main_app").warning("pet_types_refresh_failed", status_code=exc.status_code)
+        except Exception as exc:
+            # Anything else must not end the loop; the next tick tries again.
+            get_logger("main_app").error("pet_types_refresh_failed", error=repr(exc))
+
+
+def start_pet_types_refresher(settings: Settings) -> None:
+    """Start the periodic pet types reload. Call once from the app lifespan.
+
+    With the shared cache enabled this also subscribes to reloads done by other
+    workers; the caller starts the Redis pub/sub listener afterwards.
+    """
+    global _pet_types_refresher
+    if _pet_types_refresher is not None:
+        return
+    if settings.PET_TYPES_SHARED_CACHE:
+        redis_store.subscribe(_PET_TYPES_CHANNEL, _on_pet_types_published)
+    if settings.PET_TYPES_REFRESH_SECONDS <= 0:
+        return
+    _pet_types_refresher = asyncio.create_task(_run_pet_types_refresher(settings))
+
+
+async def stop_pet_types_refresher() -> None:
+    global _pet_types_refresher
+    if _pet_types_refresher is not None:
+        _pet_types_refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _pet_types_refresher
+    _pet_types_refresher = None
 
 
 async def exchange_code(code: str, settings: Settings) -> dict[str, Any]:
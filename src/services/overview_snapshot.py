@@ -0,0 +1,257 @@
+"""Materialised per-user pets_overview snapshots kept in Redis.
+
+A snapshot is the full, unfiltered overview (every pet with vaccinations and
+weights), encrypted with the connector's AES-GCM key so pet data is never stored
+in Redis in clear text. A background refresher rebuilds snapshots for users seen
+recently whose JWT has not expired, on a schedule and shortly after writes.
+
+Each write bumps a per-user generation in Redis. A rebuild reads it before it
+starts and is only stored if it has not moved, so a build that was already
+running when the write happened cannot put pre-write data back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography.exceptions import InvalidTag
+
+from src.core import redis as redis_store
+from src.core.config import Settings
+from src.core.crypto import decrypt, encrypt
+from src.core.logging import get_logger
+from src.services.main_app import MainAppError
+
+SnapshotBuilder = Callable[[int, str, Settings], Awaitable[list[dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class OverviewSnapshot:
+    items: list[dict[str, Any]]
+    built_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.built_at)
+
+
+@dataclass
+class _ActiveUser:
+    sanctum_token: str
+    token_exp: int
+    last_seen: float
+
+
+_active_users: dict[int, _ActiveUser] = {}
+_pending: set[int] = set()
+# Users whose last build was incomplete: (consecutive incomplete builds, monotonic
+# time before which they are not rebuilt). Kept apart from _active_users because
+# note_active replaces that entry on every request.
+_backoff: dict[int, tuple[int, float]] = {}
+_INCOMPLETE_BACKOFF_SECONDS = 30.0
+_wakeup: asyncio.Event | None = None
+_refresher: asyncio.Task[None] | None = None
+
+
+# Outlives any build, so a generation cannot expire back to its start value mid-build.
+_GENERATION_TTL_SECONDS = 24 * 3600
+
+# KEYS: snapshot, generation. ARGV: body, ttl, generation read before the build.
+_SAVE_IF_CURRENT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[3] then
+  return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+# KEYS: snapshot, generation. ARGV: generation ttl.
+_INVALIDATE = """
+redis.call('DEL', KEYS[1])
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+
+
+def _key(user_id: int) -> str:
+    return f"overview:snapshot:{user_id}"
+
+
+def _generation_key(user_id: int) -> str:
+    return f"overview:snapshot:{user_id}:generation"
+
+
+async def load_snapshot(user_id: int) -> OverviewSnapshot | None:
+    """Return the user's snapshot, or None if missing, unreadable or Redis is down."""
+    try:
+        raw = await redis_store.get(_key(user_id))
+    except Exception:
+        return None
+    if raw is None:
+        return None
+    try:
+        data = json.loads(decrypt(raw))
+        return OverviewSnapshot(items=data["items"], built_at=float(data["built_at"]))
+    except (InvalidTag, ValueError, KeyError, TypeError):
+        return None
+
+
+async def current_generation(user_id: int) -> str:
+    """Return the user's snapshot generation; read it before building a snapshot."""
+    return await redis_store.get(_generation_key(user_id)) or "0"
+
+
+async def save_snapshot(
+    user_id: int,
+    items: list[dict[str, Any]],
+    settings: Settings,
+    *,
+    generation: str | None = None,
+) -> bool:
+    """Encrypt and store a snapshot. ``items`` must be JSON-serialisable.
+
+    With ``generation`` the snapshot is only stored if no write invalidated it
+    since that generation was read. Returns whether it was stored.
+    """
+    body = encrypt(json.dumps({"items": items, "built_at": time.time()}))
+    if generation is None:
+        await redis_store.set_with_ttl(_key(user_id), body, settings.OVERVIEW_SNAPSHOT_TTL_SECONDS)
+        return True
+    stored = await redis_store.run_script(
+        _SAVE_IF_CURRENT,
+        [_key(user_id), _generation_key(user_id)],
+        [body, settings.OVERVIEW_SNAPSHOT_TTL_SECONDS, generation],
+    )
+    return bool(stored)
+
+
+async def _invalidate(user_id: int) -> None:
+    await redis_store.run_script(_INVALIDATE, [_key(user_id), _generation_key(user_id)], [_GENERATION_TTL_SECONDS])
+
+
+def note_active(user_id: int, sanctum_token: str, token_exp: int) -> None:
+    """Record that the user is using the overview, keeping their snapshot warm."""
+    _active_users[user_id] = _ActiveUser(sanctum_token, token_exp, time.monotonic())
+
+
+def request_refresh(user_id: int) -> None:
+    """Ask the refresher to rebuild this user's snapshot as soon as possible."""
+    if user_id not in _active_users:
+        return
+    _pending.add(user_id)
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def invalidate_snapshot(user_id: int, settings: Settings) -> None:
+    """Drop the user's snapshot after a write and schedule a rebuild. Best-effort."""
+    if not settings.OVERVIEW_SNAPSHOT_ENABLED:
+        return
+    with contextlib.suppress(Exception):
+        await _invalidate(user_id)
+    request_refresh(user_id)
+
+
+async def forget_user(user_id: int, settings: Settings) -> None:
+    """Stop refreshing the user and delete their snapshot (e.g. on token revocation)."""
+    _active_users.pop(user_id, None)
+    _pending.discard(user_id)
+    _backoff.pop(user_id, None)
+    if not settings.OVERVIEW_SNAPSHOT_ENABLED:
+        return
+    with contextlib.suppress(Exception):
+        await _invalidate(user_id)
+
+
+def _due_users(settings: Settings, *, scheduled: bool) -> list[tuple[int, str]]:
+    now = time.time()
+    idle_cutoff = time.monotonic() - settings.OVERVIEW_SNAPSHOT_IDLE_SECONDS
+    for user_id, user in list(_active_users.items()):
+        if (user.token_exp and user.token_exp <= now) or user.last_seen < idle_cutoff:
+            del _active_users[user_id]
+            _pending.discard(user_id)
+            _backoff.pop(user_id, None)
+
+    user_ids = set(_active_users) if scheduled else set(_pending)
+    # Users backing off after an incomplete build stay pending until it ends.
+    backing_off = {user_id for user_id in user_ids if _backoff.get(user_id, (0, 0.0))[1] > time.monotonic()}
+    _pending.intersection_update(backing_off)
+    return [
+        (user_id, _active_users[user_id].sanctum_token)
+        for user_id in user_ids - backing_off
+        if user_id in _active_users
+    ]
+
+
+async def _refresh_user(user_id: int, sanctum_token: str, settings: Settings, build: SnapshotBuilder) -> None:
+    try:
+        generation = await current_generation(user_id)
+        items = await build(user_id, sanctum_token, settings)
+        incomplete = sum(
+            1
+            for item in items
+            if item.get("vaccination_data_status") != "available" or item.get("weights_data_status") != "available"
+        )
+        if incomplete:
+            # Keep the last complete snapshot (or none) rather than serving gaps for
+            # minutes, and back off so a flaky upstream is not asked for every pet's
+            # health on every miss and every cycle.
+            failures = _backoff.get(user_id, (0, 0.0))[0] + 1
+            delay = min(settings.OVERVIEW_SNAPSHOT_REFRESH_SECONDS, _INCOMPLETE_BACKOFF_SECONDS * 2 ** (failures - 1))
+            _backoff[user_id] = (failures, time.monotonic() + delay)
+            get_logger("overview_snapshot").warning(
+                "overview_snapshot_incomplete", user_id=user_id, incomplete_pets=incomplete, retry_in=delay
+            )
+            return
+        _backoff.pop(user_id, None)
+        # False if a write invalidated the snapshot mid-build; that write already queued a rebuild.
+        await save_snapshot(user_id, items, settings, generation=generation)
+    except MainAppError as exc:
+        if exc.status_code in (401, 403):
+            # The Sanctum token no longer works; stop refreshing for this user.
+            _active_users.pop(user_id, None)
+    except Exception:
+        get_logger("overview_snapshot").warning("overview_snapshot_refresh_failed", user_id=user_id)
+
+
+async def _run_refresher(settings: Settings, build: SnapshotBuilder) -> None:
+    assert _wakeup is not None
+    next_scheduled = time.monotonic() + settings.OVERVIEW_SNAPSHOT_REFRESH_SECONDS
+    while True:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(_wakeup.wait(), timeout=max(0.0, next_scheduled - time.monotonic()))
+        _wakeup.clear()
+        scheduled = time.monotonic() >= next_scheduled
+        if scheduled:
+            next_scheduled = time.monotonic() + settings.OVERVIEW_SNAPSHOT_REFRESH_SECONDS
+        for user_id, sanctum_token in _due_users(settings, scheduled=scheduled):
+            await _refresh_user(user_id, sanctum_token, settings, build)
+
+
+def start_snapshot_refresher(settings: Settings, build: SnapshotBuilder) -> None:
+    """Start the background refresher. Call once from the app lifespan."""
+    global _wakeup, _refresher
+    if _refresher is not None:
+        return
+    _wakeup = asyncio.Event()
+    _refresher = asyncio.create_task(_run_refresher(settings, build))
+
+
+async def stop_snapshot_refresher() -> None:
+    global _wakeup, _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _refresher
+    _refresher = None
+    _wakeup = None
+    _active_users.clear()
+    _pending.clear()
+    _backoff.clear()
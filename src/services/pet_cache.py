@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from typing import Any, Literal
+
+from src.core.cache import TTLCache
+from src.core.config import Settings
+from src.services.pets_normalization import PetNameIndex
+
+HealthResource = Literal["vaccinations", "weights"]
+_HealthKey = tuple[int, int, HealthResource]
+
+_pets_cache: TTLCache[int, list[dict[str, Any]]] | None = None
+# Name index per user, valid only for the exact cached pet list (and species map)
+# it was built from.
+_index_cache: TTLCache[int, tuple[list[dict[str, Any]], Mapping[int, str], PetNameIndex]] | None = None
+# Entries live for the stale TTL; the fresh/stale split is decided from stored_at.
+_health_cache: TTLCache[_HealthKey, tuple[float, list[dict[str, Any]]]] | None = None
+# Last invalidation per key, so a fetch that started before a write cannot
+# repopulate the cache with pre-write data.
+_health_invalidated: TTLCache[_HealthKey, float] | None = None
+
+
+def _get_pets_cache(settings: Settings) -> TTLCache[int, list[dict[str, Any]]]:
+    global _pets_cache
+    if _pets_cache is None:
+        _pets_cache = TTLCache(
+            maxsize=settings.PETS_CACHE_MAX_USERS,
+            ttl=settings.PETS_CACHE_TTL_SECONDS,
+        )
+    return _pets_cache
+
+
+def _get_index_cache(settings: Settings) -> TTLCache[int, tuple[list[dict[str, Any]], Mapping[int, str], PetNameIndex]]:
+    global _index_cache
+    if _index_cache is None:
+        _index_cache = TTLCache(
+            maxsize=settings.PETS_CACHE_MAX_USERS,
+            ttl=settings.PETS_CACHE_TTL_SECONDS,
+        )
+    return _index_cache
+
+
+def _get_health_caches(
+    settings: Settings,
+) -> tuple[TTLCache[_HealthKey, tuple[float, list[dict[str, Any]]]], TTLCache[_HealthKey, float]]:
+    global _health_cache, _health_invalidated
+    if _health_cache is None or _health_invalidated is None:
+        _health_cache = TTLCache(
+            maxsize=settings.PET_HEALTH_CACHE_MAX_ENTRIES,
+            ttl=settings.PET_HEALTH_CACHE_STALE_SECONDS,
+        )
+        _health_invalidated = TTLCache(
+            maxsize=settings.PET_HEALTH_CACHE_MAX_ENTRIES,
+            ttl=settings.PET_HEALTH_CACHE_STALE_SECONDS,
+        )
+    return _health_cache, _health_invalidated
+
+
+def get_cached_pets(user_id: int, settings: Settings) -> list[dict[str, Any]] | None:
+    """Return the user's raw upstream pet list if a fresh copy is cached."""
+    return _get_pets_cache(settings).get(user_id)
+
+
+def store_pets(user_id: int, pets: list[dict[str, Any]], settings: Settings) -> None:
+    _get_pets_cache(settings).set(user_id, pets, ttl=settings.PETS_CACHE_TTL_SECONDS)
+
+
+def invalidate_pets(user_id: int) -> None:
+    """Drop the user's cached pet list. Call after any successful pet write."""
+    if _pets_cache is not None:
+        _pets_cache.pop(user_id)
+    if _index_cache is not None:
+        _index_cache.pop(user_id)
+
+
+def get_pet_name_index(
+    user_id: int,
+    raw_pets: list[dict[str, Any]],
+    species_by_type_id: Mapping[int, str],
+    settings: Settings,
+) -> PetNameIndex | None:
+    """Return the index built from this very pet list, if one is cached."""
+    entry = _get_index_cache(settings).get(user_id)
+    if entry is None:
+        return None
+    indexed_pets, indexed_species, index = entry
+    # The pet types table is an immutable snapshot, so identity means "unchanged".
+    if indexed_pets is not raw_pets or indexed_species is not species_by_type_id:
+        return None
+    return index
+
+
+def store_pet_name_index(
+    user_id: int,
+    raw_pets: list[dict[str, Any]],
+    species_by_type_id: Mapping[int, str],
+    index: PetNameIndex,
+    settings: Settings,
+) -> None:
+    _get_index_cache(settings).set(user_id, (raw_pets, species_by_type_id, index))
+
+
+def get_cached_pet_health(
+    user_id: int,
+    pet_id: int,
+    resource: HealthResource,
+    settings: Settings,
+) -> tuple[list[dict[str, Any]], bool] | None:
+    """Return ``(records, fresh)`` for a cached pet resource, or None on a miss.
+
+    ``fresh`` is False once the entry is older than PET_HEALTH_CACHE_FRESH_SECONDS;
+    such entries may still be served while the caller refreshes them.
+    """
+    cache, _ = _get_health_caches(settings)
+    entry = cache.get((user_id, pet_id, resource))
+    if entry is None:
+        return None
+    stored_at, records = entry
+    fresh = time.monotonic() - stored_at < settings.PET_HEALTH_CACHE_FRESH_SECONDS
+    return records, fresh
+
+
+def store_pet_health(
+    user_id: int,
+    pet_id: int,
+    resource: HealthResource,
+    records: list[dict[str, Any]],
+    settings: Settings,
+    *,
+    fetched_at: float,
+) -> None:
+    """Cache records fetched at ``fetched_at`` (a ``time.monotonic()`` value).
+
+    The store is skipped when the key was invalidated after the fetch started.
+    """
+    cache, invalidated = _get_health_caches(settings)
+    key = (user_id, pet_id, resource)
+    invalidated_at = invalidated.get(key)
+    if invalidated_at is not None and invalidated_at >= fetched_at:
+        return
+    cache.set(key, (time.monotonic(), records))
+
+
+def invalidate_pet_health(user_id: int, pet_id: int, resource: HealthResource) -> None:
+    """Drop a cached pet resource. Call after a successful write to that resource."""
+    if _health_cache is None or _health_invalidated is None:
+        return
+    key = (user_id, pet_id, resource)
+    _health_cache.pop(key)
+    _health_invalidated.set(key, time.monotonic())
+
+
+def clear_pet_caches() -> None:
+    if _pets_cache is not None:
+        _pets_cache.clear()
+    if _index_cache is not None:
+        _index_cache.clear()
+    if _health_cache is not None:
+        _health_cache.clear()
+    if _health_invalidated is not None:
+        _health_invalidated.clear()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import unicodedata
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from typing import Any, Literal
 
 
 _BIRTHDAY_PRECISIONS = {"day", "month", "year", "unknown"}
@@ -56,8 +59,32 @@ def _build_birthday_date(year: int | None, month: int | None, day: int | None) -
         return None
 
 
-def build_pet_time_context(raw: dict[str, Any], *, today: date | None = None) -> dict[str, Any]:
-    ref = today or date.today()
+class _DayContext:
+    """Per-day lookups shared by every pet in a batch: today's ordinal and the
+    next occurrence of each (month, day)."""
+
+    def __init__(self, today: date):
+        self.today = today
+        self.ordinal = today.toordinal()
+        self._next_by_month_day: dict[tuple[int, int], date | None] = {}
+
+    def next_occurrence(self, month: int, day: int) -> date | None:
+        key = (month, day)
+        if key not in self._next_by_month_day:
+            found: date | None = None
+            for candidate_year in (self.today.year, self.today.year + 1):
+                try:
+                    candidate = date(candidate_year, month, day)
+                except ValueError:
+                    continue
+                if candidate >= self.today:
+                    found = candidate
+                    break
+            self._next_by_month_day[key] = found
+        return self._next_by_month_day[key]
+
+
+def _time_context(raw: dict[str, Any], day: _DayContext) -> dict[str, Any]:
     precision = _normalize_birthday_precision(raw.get("birthday_precision"))
     birthday_year = _coerce_int(raw.get("birthday_year"))
     birthday_month = _coerce_int(raw.get("birthday_month"))
@@ -70,20 +97,14 @@ def build_pet_time_context(raw: dict[str, Any], *, today: date | None = None) ->
     if age is None and precision == "day":
         birthdate = _build_birthday_date(birthday_year, birthday_month, birthday_day)
         if birthdate is not None:
-            age = _format_age_from_birthdate(birthdate, today=ref)
+            age = _format_age_from_birthdate(birthdate, today=day.today)
 
     next_birthday_at: date | None = None
     days_until_next_birthday: int | None = None
     if precision == "day" and birthday_month is not None and birthday_day is not None:
-        for candidate_year in (ref.year, ref.year + 1):
-            try:
-                candidate = date(candidate_year, birthday_month, birthday_day)
-            except ValueError:
-                continue
-            if candidate >= ref:
-                next_birthday_at = candidate
-                days_until_next_birthday = (candidate - ref).days
-                break
+        next_birthday_at = day.next_occurrence(birthday_month, birthday_day)
+        if next_birthday_at is not None:
+            days_until_next_birthday = next_birthday_at.toordinal() - day.ordinal
 
     return {
         "age": age,
@@ -96,7 +117,25 @@ def build_pet_time_context(raw: dict[str, Any], *, today: date | None = None) ->
     }
 
 
-def normalize_species_to_pet_type_id(species: str, pet_types_by_name: dict[str, int]) -> int:
+def build_pet_time_context(raw: dict[str, Any], *, today: date | None = None) -> dict[str, Any]:
+    return _time_context(raw, _DayContext(today or date.today()))
+
+
+_TIME_CONTEXT_FIELDS = ("birthday_precision", "birthday_year", "birthday_month", "birthday_day", "age")
+_TIME_CONTEXT_MEMO_MAX = 50_000
+# Time contexts for the current day, keyed by (pet id, birthday/age fields).
+# Reset whenever the day changes, so it never holds more than one day's entries.
+_time_context_memo: dict[tuple[Any, ...], dict[str, Any]] = {}
+_time_context_memo_day: date | None = None
+
+
+def clear_time_context_memo() -> None:
+    global _time_context_memo_day
+    _time_context_memo.clear()
+    _time_context_memo_day = None
+
+
+def normalize_species_to_pet_type_id(species: str, pet_types_by_name: Mapping[str, int]) -> int:
     normalized = species.strip().lower()
     pet_type_id = pet_types_by_name.get(normalized)
     if pet_type_id is None:
@@ -155,31 +194,228 @@ def normalize_birth_fields(
     return {}
 
 
-def to_pet_summary(
-    raw: dict[str, Any],
-    species_by_type_id: dict[int, str],
-    *,
-    today: date | None = None,
-) -> dict[str, Any]:
+def species_name(raw: dict[str, Any], species_by_type_id: Mapping[int, str]) -> str | None:
     pet_type_id = raw.get("pet_type_id")
-    species = None
     try:
         if pet_type_id is not None:
-            species = species_by_type_id.get(int(pet_type_id))
+            return species_by_type_id.get(int(pet_type_id))
     except (TypeError, ValueError):
-        species = None
+        pass
+    return None
+
 
+def _summary(raw: dict[str, Any], species_by_type_id: Mapping[int, str], context: dict[str, Any]) -> dict[str, Any]:
     return {
         "id": raw.get("id"),
         "name": raw.get("name"),
-        "species": species,
+        "species": species_name(raw, species_by_type_id),
         "sex": raw.get("sex"),
         "photo_url": raw.get("photo_url"),
-        **build_pet_time_context(raw, today=today),
+        **context,
     }
 
 
+def to_pet_summary(
+    raw: dict[str, Any],
+    species_by_type_id: Mapping[int, str],
+    *,
+    today: date | None = None,
+) -> dict[str, Any]:
+    return _summary(raw, species_by_type_id, build_pet_time_context(raw, today=today))
+
+
+def to_pet_summaries(
+    raws: Iterable[dict[str, Any]],
+    species_by_type_id: Mapping[int, str],
+    *,
+    today: date | None = None,
+) -> list[dict[str, Any]]:
+    """Batch ``to_pet_summary``: one day context for the whole list, plus a memo.
+
+    Time contexts are memoised by (pet id, birthday/age fields) for the current
+    day, so reloading the same pets later that day skips the date arithmetic.
+    """
+    global _time_context_memo_day
+    ref = today or date.today()
+    if _time_context_memo_day != ref or len(_time_context_memo) > _TIME_CONTEXT_MEMO_MAX:
+        _time_context_memo.clear()
+        _time_context_memo_day = ref
+
+    day = _DayContext(ref)
+    summaries = []
+    for raw in raws:
+        key: tuple[Any, ...] | None = None
+        context: dict[str, Any] | None = None
+        candidate = (raw.get("id"), *(raw.get(field) for field in _TIME_CONTEXT_FIELDS))
+        try:
+            context = _time_context_memo.get(candidate)
+            key = candidate
+        except TypeError:  # unhashable upstream value; compute without memoising
+            pass
+        if context is None:
+            context = _time_context(raw, day)
+            if key is not None:
+                _time_context_memo[key] = context
+        summaries.append(_summary(raw, species_by_type_id, context))
+    return summaries
+
+
+_FOLDED_NAMES_MAX = 50_000
+# Folded keys by raw name, shared by PetNameIndex builds and filter_pet_candidates,
+# so each distinct name is normalised once rather than on every lookup.
+_folded_names: dict[str, str] = {}
+
+
+def fold_name(value: Any) -> str:
+    """Normalise a name for matching: casefold, drop diacritics, collapse spaces.
+
+    Vietnamese "đ" has no combining-mark decomposition, so it is mapped to "d"
+    explicitly; "Bông" and "bong", "Đậu" and "dau" fold to the same key.
+    """
+    if not isinstance(value, str):
+        return ""
+    folded = _folded_names.get(value)
+    if folded is None:
+        decomposed = unicodedata.normalize("NFKD", value.replace("đ", "d").replace("Đ", "D"))
+        stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+        folded = " ".join(stripped.casefold().split())
+        if len(_folded_names) >= _FOLDED_NAMES_MAX:
+            _folded_names.clear()
+        _folded_names[value] = folded
+    return folded
+
+
+def _trigrams(folded: str) -> set[str]:
+    """Word trigrams padded like pg_trgm: two leading spaces, one trailing."""
+    grams: set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+MatchKind = Literal["any", "exact", "substring", "fuzzy"]
+
+
+@dataclass(frozen=True, slots=True)
+class PetMatch:
+    position: int  # index into the sequence the PetNameIndex was built from
+    score: float  # 1.0 for exact matches, trigram similarity otherwise
+    kind: MatchKind
+
+
+class PetNameIndex:
+    """Name/species lookup over one user's pet list, built once per list load.
+
+    Names are folded with ``fold_name`` and every trigram maps to the positions
+    that contain it. Substring queries use the posting lists to narrow the
+    candidates before the substring check; when nothing contains the query, a
+    fuzzy pass ranks names by trigram similarity so typos still find the pet.
+    """
+
+    def __init__(self, entries: Iterable[tuple[Any, Any]]):
+        self._names: list[str] = []
+        self._species: list[str | None] = []
+        self._postings: dict[str, list[int]] = {}
+        self._grams: list[set[str]] = []
+        for position, (name, species) in enumerate(entries):
+            folded = fold_name(name)
+            grams = _trigrams(folded)
+            self._names.append(folded)
+            self._species.append(species.strip().lower() if isinstance(species, str) else None)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(
+        self,
+        name: str | None = None,
+        species: str | None = None,
+        *,
+        fuzzy: bool = False,
+        min_similarity: float = 0.3,
+    ) -> list[PetMatch]:
+        """Return matching positions, best first.
+
+        Without ``name`` every pet of the species is returned in list order.
+        Substring hits are ordered exact first, then names where the query starts
+        a word before those where it is inside one, then by similarity and name.
+        Fuzzy hits (only when ``fuzzy`` is set and there are no substring hits)
+        are ordered by similarity and must reach ``min_similarity``.
+        """
+        species_key = species.strip().lower() if species else None
+
+        def species_ok(position: int) -> bool:
+            return species_key is None or self._species[position] == species_key
+
+        query = fold_name(name) if name else ""
+        if not query:
+            return [PetMatch(position, 1.0, "any") for position in range(len(self._names)) if species_ok(position)]
+
+        query_grams = _trigrams(query)
+        matches = []
+        for position in self._substring_candidates(query):
+            if not species_ok(position) or query not in self._names[position]:
+                continue
+            if self._names[position] == query:
+                matches.append(PetMatch(position, 1.0, "exact"))
+            else:
+                matches.append(PetMatch(position, self._similarity(query_grams, position), "substring"))
+        if matches or not fuzzy:
+            word_start = f" {query}"
+            matches.sort(
+                key=lambda match: (
+                    match.kind != "exact",
+                    word_start not in f" {self._names[match.position]}",
+                    -match.score,
+                    self._names[match.position],
+                )
+            )
+            return matches
+
+        shared: dict[int, int] = {}
+        for gram in query_grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        fuzzy_matches = []
+        for position, count in shared.items():
+            score = count / len(query_grams | self._grams[position])
+            if score >= min_similarity and species_ok(position):
+                fuzzy_matches.append(PetMatch(position, round(score, 3), "fuzzy"))
+        fuzzy_matches.sort(key=lambda match: (-match.score, self._names[match.position]))
+        return fuzzy_matches
+
+    def _substring_candidates(self, query: str) -> Iterable[int]:
+        # Every 3-character window of the query (spaces included) is a trigram of
+        # any name containing it, provided the window is inside a single word.
+        windows = [query[i : i + 3] for i in range(len(query) - 2) if " " not in query[i : i + 3]]
+        if not windows:
+            return range(len(self._names))
+        postings = sorted((self._postings.get(window, []) for window in set(windows)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return candidates
+
+    def _similarity(self, query_grams: set[str], position: int) -> float:
+        union = query_grams | self._grams[position]
+        return round(len(query_grams & self._grams[position]) / len(union), 3) if union else 0.0
+
+
 def filter_pet_candidates(pets: list[dict[str, Any]], name: str | None = None, species: str | None = None) -> list[dict[str, Any]]:
+    """One-off substring filter (accent- and case-insensitive), exact matches first.
+
+    Names are compared after ``fold_name``, the same folding ``PetNameIndex`` and
+    find_pet use, so "bong" also keeps "Bông"; the filter used to only ignore
+    case. Folded keys are memoised across calls, so a repeated scan costs about
+    as much as the old case-only one. For many lookups over the same list, build
+    a ``PetNameIndex`` instead.
+    """
     filtered = pets
 
     if species:
@@ -189,19 +425,11 @@ def filter_pet_candidates(pets: list[dict[str, Any]], name: str | None = None, s
             if isinstance(pet.get("species"), str) and pet["species"].strip().lower() == species_lower
         ]
 
-    if name:
-        name_lower = name.strip().lower()
-        filtered = [
-            pet for pet in filtered
-            if isinstance(pet.get("name"), str) and name_lower in pet["name"].strip().lower()
-        ]
-
-        filtered.sort(
-            key=lambda pet: (
-                0 if pet.get("name", "").strip().lower() == name_lower else 1,
-                pet.get("name", "").strip().lower(),
-            )
-        )
+    query = fold_name(name) if name else ""
+    if query:
+        keyed = [(key, pet) for pet in filtered if query in (key := fold_name(pet.get("name")))]
+        keyed.sort(key=lambda entry: (entry[0] != query, entry[0]))
+        filtered = [pet for _, pet in keyed]
 
     return filtered
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+
+
+class RetryBudget:
+    """Process-wide token bucket that caps retries to a fraction of traffic.
+
+    Every first attempt deposits ``ratio`` tokens (up to ``max_tokens``) and every
+    retry withdraws one. With ratio=0.1, retries add at most ~10% load on top of
+    normal traffic once the initial reserve is spent, so a failing upstream is
+    not hit with a multiple of the usual request rate.
+    """
+
+    def __init__(self, *, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+def backoff_delay(attempt: int, *, base: float, cap: float) -> float:
+    """Exponential backoff with full jitter: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0.0, min(cap, base * (2**attempt)))
+
+
+def parse_retry_after(value: int | str | None) -> float | None:
+    """Interpret an upstream ``retry_after`` hint given in seconds."""
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return max(seconds, 0.0)
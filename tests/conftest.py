@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch
 from fastapi.testclient import TestClient
 
 from src.core.config import Settings, get_settings
+from src.core.rate_limit import RateLimitResult
 
 TEST_SETTINGS = Settings(
     MAIN_APP_URL="http://test-main-app",
@@ -15,36 +16,86 @@ TEST_SETTINGS = Settings(
     REDIS_URL="redis://localhost:6379",
     LOG_LEVEL="debug",
     ENVIRONMENT="test",
+    MAIN_APP_RETRY_BASE_DELAY=0.0,
+    PET_TYPES_SHARED_CACHE=False,
+    JWT_REVOCATION_LOCAL_FILTER=False,
 )
 
+ALLOWED = RateLimitResult(allowed=True, revoked=False, limit=60, remaining=59, reset_after=60.0, retry_after=0.0)
+LIMITED = RateLimitResult(allowed=False, revoked=False, limit=60, remaining=0, reset_after=30.0, retry_after=30.0)
+REVOKED = RateLimitResult(allowed=False, revoked=True, limit=60, remaining=0, reset_after=0.0, retry_after=0.0)
+
 
 @pytest.fixture(autouse=True)
 def _clear_pet_types_cache():
     """Reset the module-level pet types cache before each test to prevent bleed-over."""
     import src.services.main_app as _svc
 
-    _svc._PET_TYPES_BY_NAME.clear()
-    _svc._PET_TYPES_BY_ID.clear()
+    _svc.clear_pet_types_cache()
     yield
-    _svc._PET_TYPES_BY_NAME.clear()
-    _svc._PET_TYPES_BY_ID.clear()
+    _svc.clear_pet_types_cache()
 
 
 @pytest.fixture(autouse=True)
-def _mock_redis_hardening():
+def _clear_caches():
+    """Reset in-process caches so cached upstream reads don't leak between tests."""
+    from src.core.jwt import clear_verified_jwt_cache
+    from src.services.main_app import clear_validator_cache
+    from src.services.pet_cache import clear_pet_caches
+
+    clear_pet_caches()
+    clear_validator_cache()
+    clear_verified_jwt_cache()
+    yield
+    clear_pet_caches()
+    clear_validator_cache()
+    clear_verified_jwt_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_upstream_resilience():
+    """Start every test with a closed breaker and a full retry budget."""
+    from src.services.main_app import reset_resilience_state
+
+    reset_resilience_state()
+    yield
+    reset_resilience_state()
+
+
+@pytest.fixture(autouse=True)
+def _mock_redis_hardening(request):
     """Mock rate-limit and blacklist Redis calls so tests don't need a live Redis.
 
     By default: tokens are never blacklisted, requests are never rate-limited.
-    Override these in specific tests that exercise those code paths.
+    Override these in specific tests that exercise those code paths. Tests that
+    use the ``redis_client`` fixture run the real calls against it instead.
     """
+    if "redis_client" in request.fixturenames:
+        yield
+        return
     with (
         patch("src.core.redis.is_jti_blacklisted", new=AsyncMock(return_value=False)),
-        patch("src.core.redis.incr_with_expiry", new=AsyncMock(return_value=1)),
+        patch("src.core.rate_limit.hit", new=AsyncMock(return_value=ALLOWED)),
         patch("src.core.redis.blacklist_jti", new=AsyncMock()),
     ):
         yield
 
 
+@pytest.fixture
+async def redis_client():
+    """An in-memory Redis (with Lua scripting) behind src.core.redis."""
+    import fakeredis
+
+    import src.core.redis as redis_module
+
+    fake = fakeredis.FakeAsyncRedis(decode_responses=True)
+    previous = redis_module._client
+    redis_module._client = fake
+    yield fake
+    redis_module._client = previous
+    await fake.aclose()
+
+
 @pytest.fixture
 def client():
     from src.main import app
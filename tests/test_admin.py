@@ -22,6 +22,7 @@ def _make_admin_settings(**overrides) -> Settings:
         ENVIRONMENT="test",
         ADMIN_ENABLED=True,
         ADMIN_PASSWORD="testpass",
+        MAIN_APP_RETRY_BASE_DELAY=0.0,
     )
     base.update(overrides)
     return Settings(**base)
@@ -144,6 +145,8 @@ def test_admin_stats_partial(admin_client):
     assert resp.status_code == 200
     assert "42" in resp.text
     assert "3" in resp.text
+    assert "Upstream" in resp.text
+    assert "Collapsed GETs" in resp.text
 
 
 # ── admin_events unit tests ───────────────────────────────────────────────────
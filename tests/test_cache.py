@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from src.core.cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl():
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+    with patch("src.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("src.core.cache.time.monotonic", return_value=109.9):
+        assert cache.get("a") == 1
+    with patch("src.core.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_zero_ttl_disables_caching():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_pop_removes_entry():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.main_app import MainAppError, call_main_app, get_circuit_breaker_stats
+from tests.conftest import TEST_SETTINGS
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    options = dict(
+        failure_rate_threshold=0.5,
+        window_size=10,
+        min_calls=4,
+        open_seconds=30.0,
+        half_open_max_calls=2,
+    )
+    options.update(overrides)
+    return CircuitBreaker(**options)
+
+
+def test_stays_closed_below_min_calls():
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_opens_when_failure_rate_reaches_threshold():
+    breaker = _breaker()
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.try_acquire() is False
+    assert breaker.rejected == 1
+
+
+def test_half_open_after_cooldown_then_closes_on_successful_trials():
+    breaker = _breaker()
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=100.0):
+        for _ in range(4):
+            breaker.record_failure()
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=130.0):
+        assert breaker.state == "half_open"
+        assert breaker.try_acquire() is True
+        assert breaker.try_acquire() is True
+        assert breaker.try_acquire() is False
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.failure_rate() == 0.0
+
+
+def test_half_open_failure_reopens():
+    breaker = _breaker()
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=100.0):
+        for _ in range(4):
+            breaker.record_failure()
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=130.0):
+        assert breaker.try_acquire() is True
+        breaker.record_failure()
+        assert breaker.state == "open"
+    assert breaker.times_opened == 2
+
+
+def test_released_trial_permit_can_be_reused():
+    breaker = _breaker(half_open_max_calls=1)
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=100.0):
+        for _ in range(4):
+            breaker.record_failure()
+    with patch("src.services.circuit_breaker.time.monotonic", return_value=130.0):
+        assert breaker.try_acquire() is True
+        breaker.release()
+        assert breaker.try_acquire() is True
+
+
+@respx.mock
+async def test_open_circuit_fast_fails_without_calling_upstream():
+    settings = TEST_SETTINGS.model_copy(update={"CIRCUIT_BREAKER_MIN_CALLS": 3})
+    route = respx.post("http://test-main-app/api/pets").mock(
+        return_value=httpx.Response(500, json={"message": "boom"})
+    )
+
+    for _ in range(3):
+        with pytest.raises(MainAppError):
+            await call_main_app(method="POST", path="/api/pets", settings=settings, json_data={})
+
+    with pytest.raises(MainAppError) as exc_info:
+        await call_main_app(method="POST", path="/api/pets", settings=settings, json_data={})
+
+    assert route.call_count == 3
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.payload["error"] == "UPSTREAM_UNAVAILABLE"
+    assert get_circuit_breaker_stats()["state"] == "open"
+
+
+@respx.mock
+async def test_client_errors_do_not_trip_the_breaker():
+    settings = TEST_SETTINGS.model_copy(update={"CIRCUIT_BREAKER_MIN_CALLS": 3})
+    respx.post("http://test-main-app/api/pets").mock(
+        return_value=httpx.Response(422, json={"message": "Invalid"})
+    )
+
+    for _ in range(5):
+        with pytest.raises(MainAppError):
+            await call_main_app(method="POST", path="/api/pets", settings=settings, json_data={})
+
+    assert get_circuit_breaker_stats()["state"] == "closed"
+
+
+@respx.mock
+def test_health_reports_circuit_state(client):
+    respx.get("http://test-main-app/api/version").mock(return_value=httpx.Response(200))
+
+    resp = client.get("/health")
+
+    assert resp.json()["main_app_circuit"] == "closed"
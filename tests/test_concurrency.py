@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from src.services.concurrency import AdaptiveLimiter, LimiterTimeout
+from src.services.main_app import MainAppError, call_main_app, get_concurrency_stats
+from tests.conftest import TEST_SETTINGS
+
+
+def _limiter(**overrides) -> AdaptiveLimiter:
+    options = dict(initial_limit=4, min_limit=1, max_limit=8, latency_target=1.0)
+    options.update(overrides)
+    return AdaptiveLimiter(**options)
+
+
+async def test_limit_grows_by_one_per_window_while_busy_and_healthy():
+    limiter = _limiter()
+    for _ in range(4):
+        await limiter.acquire(timeout=1)
+    for _ in range(3):
+        limiter.release(latency=0.1, ok=True)
+        await limiter.acquire(timeout=1)
+    assert limiter.limit == 4
+
+    limiter.release(latency=0.1, ok=True)
+    assert limiter.limit == 5
+
+
+async def test_failure_restarts_the_growth_window():
+    limiter = _limiter(backoff_ratio=1.0)
+    for _ in range(4):
+        await limiter.acquire(timeout=1)
+    for _ in range(3):
+        limiter.release(latency=0.1, ok=True)
+        await limiter.acquire(timeout=1)
+    limiter.release(latency=0.1, ok=False)
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=0.1, ok=True)
+    assert limiter.limit == 4
+
+
+async def test_limit_does_not_grow_when_mostly_idle():
+    limiter = _limiter()
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=0.1, ok=True)
+    assert limiter.limit == 4
+
+
+async def test_limit_shrinks_on_failure_and_slow_calls_but_not_below_min():
+    limiter = _limiter(initial_limit=2, backoff_ratio=0.5)
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=0.1, ok=False)
+    assert limiter.limit == 1
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=5.0, ok=True)
+    assert limiter.limit == 1
+
+
+async def test_callers_over_the_limit_queue_and_are_woken_in_order():
+    limiter = _limiter(initial_limit=1, max_limit=1)
+    await limiter.acquire(timeout=1)
+    order: list[int] = []
+
+    async def waiter(index: int) -> None:
+        await limiter.acquire(timeout=1)
+        order.append(index)
+        limiter.release(latency=0.0, ok=True)
+
+    tasks = [asyncio.create_task(waiter(index)) for index in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+
+    limiter.release(latency=0.0, ok=True)
+    await asyncio.gather(*tasks)
+
+    assert order == [0, 1, 2]
+    assert limiter.in_flight == 0
+
+
+async def test_waiter_times_out_after_deadline():
+    limiter = _limiter(initial_limit=1, max_limit=1)
+    await limiter.acquire(timeout=1)
+
+    with pytest.raises(LimiterTimeout):
+        await limiter.acquire(timeout=0.01)
+
+    assert limiter.rejected == 1
+    assert limiter.queue_depth == 0
+    limiter.release(latency=0.0, ok=True)
+    assert limiter.in_flight == 0
+
+
+@respx.mock
+async def test_queued_upstream_calls_fail_with_upstream_unavailable():
+    settings = TEST_SETTINGS.model_copy(
+        update={
+            "MAIN_APP_CONCURRENCY_INITIAL": 1,
+            "MAIN_APP_CONCURRENCY_MIN": 1,
+            "MAIN_APP_CONCURRENCY_MAX": 1,
+            "MAIN_APP_QUEUE_TIMEOUT_SECONDS": 0.01,
+        }
+    )
+
+    async def slow(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(201, json={})
+
+    respx.post("http://test-main-app/api/pets").mock(side_effect=slow)
+
+    results = await asyncio.gather(
+        call_main_app(method="POST", path="/api/pets", settings=settings, json_data={}),
+        call_main_app(method="POST", path="/api/pets", settings=settings, json_data={}),
+        return_exceptions=True,
+    )
+
+    assert results[0] == {}
+    assert isinstance(results[1], MainAppError)
+    assert results[1].status_code == 503
+    assert results[1].payload["error"] == "UPSTREAM_UNAVAILABLE"
+    assert get_concurrency_stats()["rejected"] == 1
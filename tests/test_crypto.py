@@ -52,3 +52,78 @@ def test_tampered_tag_raises():
 
     with pytest.raises(InvalidTag):
         decrypt(tampered)
+
+
+OLD_KEY = "1" * 64
+ROTATED_SETTINGS = TEST_SETTINGS.model_copy(
+    update={"ENCRYPTION_KEY": "2" * 64, "ENCRYPTION_KEY_ID": "k2", "ENCRYPTION_RETIRED_KEYS": f"k1:{OLD_KEY}"}
+)
+
+
+def test_values_from_a_retired_key_still_decrypt_after_rotation():
+    from src.core.crypto import decrypt, encrypt
+
+    old_settings = TEST_SETTINGS.model_copy(update={"ENCRYPTION_KEY": OLD_KEY, "ENCRYPTION_KEY_ID": "k1"})
+    with patch("src.core.crypto.get_settings", return_value=old_settings):
+        encrypted = encrypt("sanctum|old")
+
+    with patch("src.core.crypto.get_settings", return_value=ROTATED_SETTINGS):
+        assert decrypt(encrypted) == "sanctum|old"
+        # New values are written with the primary key id.
+        assert base64.urlsafe_b64decode(encrypt("x"))[3:5] == b"k2"
+
+
+def test_original_unversioned_format_still_decrypts():
+    import os
+
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    from src.core.crypto import decrypt
+
+    nonce = os.urandom(12)
+    legacy = base64.urlsafe_b64encode(
+        nonce + AESGCM(bytes.fromhex(TEST_SETTINGS.ENCRYPTION_KEY)).encrypt(nonce, b"sanctum|legacy", None)
+    ).decode()
+
+    assert decrypt(legacy) == "sanctum|legacy"
+
+
+def test_swapping_the_key_id_in_the_header_raises():
+    from src.core.crypto import decrypt, encrypt
+
+    with patch("src.core.crypto.get_settings", return_value=ROTATED_SETTINGS):
+        raw = bytearray(base64.urlsafe_b64decode(encrypt("sensitive")))
+        raw[4] = ord("1")  # k2 -> k1: the header is authenticated, so this must fail
+        with pytest.raises(InvalidTag):
+            decrypt(base64.urlsafe_b64encode(bytes(raw)).decode())
+
+
+def test_cipher_objects_are_reused():
+    from src.core.keyring import get_keyring
+
+    assert get_keyring(ROTATED_SETTINGS).primary is get_keyring(ROTATED_SETTINGS).primary
+
+
+def test_malformed_retired_keys_are_rejected():
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        TEST_SETTINGS.model_validate({**TEST_SETTINGS.model_dump(), "ENCRYPTION_RETIRED_KEYS": "k1:abcd"})
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"ENCRYPTION_RETIRED_KEYS": f"k1:{OLD_KEY},k1:{'3' * 64}"},
+        {"ENCRYPTION_KEY_ID": "k1", "ENCRYPTION_RETIRED_KEYS": f"k1:{OLD_KEY}"},
+    ],
+)
+def test_duplicate_key_ids_are_rejected(update):
+    from pydantic import ValidationError
+
+    from src.core.keyring import get_keyring
+
+    with pytest.raises(ValidationError):
+        TEST_SETTINGS.model_validate({**TEST_SETTINGS.model_dump(), **update})
+    with pytest.raises(ValueError):
+        get_keyring(TEST_SETTINGS.model_copy(update=update))
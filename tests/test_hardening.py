@@ -7,7 +7,7 @@ import pytest
 import respx
 
 from src.core.jwt import create_jwt
-from tests.conftest import TEST_SETTINGS
+from tests.conftest import ALLOWED, LIMITED, REVOKED, TEST_SETTINGS
 
 
 def _auth_headers(user_id: int = 7) -> dict[str, str]:
@@ -21,7 +21,7 @@ def _auth_headers(user_id: int = 7) -> dict[str, str]:
 
 def test_authorize_rate_limit_triggers_429(client):
     """The 61st request from the same IP within a minute returns 429."""
-    with patch("src.core.redis.incr_with_expiry", new=AsyncMock(return_value=61)):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=LIMITED)):
         resp = client.get(
             "/oauth/authorize",
             params={
@@ -38,7 +38,7 @@ def test_authorize_rate_limit_triggers_429(client):
 
 def test_authorize_below_rate_limit_succeeds(client):
     """Requests below the limit are not blocked (redirect to main app)."""
-    with patch("src.core.redis.incr_with_expiry", new=AsyncMock(return_value=1)):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=ALLOWED)):
         with patch("src.core.redis.set_with_ttl", new=AsyncMock()):
             resp = client.get(
                 "/oauth/authorize",
@@ -61,7 +61,7 @@ def test_authorize_below_rate_limit_succeeds(client):
 @respx.mock
 def test_pets_rate_limit_triggers_429(client):
     """The 61st call with the same user JWT returns 429."""
-    with patch("src.core.redis.incr_with_expiry", new=AsyncMock(return_value=61)):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=LIMITED)):
         resp = client.get("/pets", headers=_auth_headers())
     assert resp.status_code == 429
     assert resp.json()["detail"]["error"] == "RATE_LIMIT_EXCEEDED"
@@ -72,15 +72,15 @@ def test_pets_rate_limit_uses_user_id_key(client):
     """Rate limit key is per user_id, not per IP — two users have independent counters."""
     call_log: list[str] = []
 
-    async def capture_incr(key: str, ttl: int) -> int:
+    async def capture_hit(policy, key: str, *, jti: str | None = None):
         call_log.append(key)
-        return 1  # within limit for both users
+        return ALLOWED  # within limit for both users
 
     respx.get("http://test-main-app/api/my-pets").mock(
         return_value=httpx.Response(200, json=[])
     )
 
-    with patch("src.core.redis.incr_with_expiry", side_effect=capture_incr):
+    with patch("src.core.rate_limit.hit", side_effect=capture_hit):
         client.get("/pets", headers=_auth_headers(user_id=1))
         client.get("/pets", headers=_auth_headers(user_id=2))
 
@@ -119,7 +119,7 @@ def test_revoke_blacklists_jti(client):
 @respx.mock
 def test_blacklisted_token_is_rejected(client):
     """A JWT whose jti is in the blacklist returns 401."""
-    with patch("src.core.redis.is_jti_blacklisted", new=AsyncMock(return_value=True)):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=REVOKED)):
         resp = client.get("/pets", headers=_auth_headers())
     assert resp.status_code == 401
     assert "revoked" in resp.json()["detail"].lower()
@@ -132,12 +132,12 @@ def test_revoked_token_cannot_reach_pets(client):
 
     # First call succeeds (jti not blacklisted yet)
     with patch("src.core.redis.is_jti_blacklisted", new=AsyncMock(return_value=False)):
-        with patch("src.core.redis.incr_with_expiry", new=AsyncMock(return_value=1)):
+        with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=ALLOWED)):
             # health check doesn't require auth, use that
             pass
 
     # After revocation the same token is rejected
-    with patch("src.core.redis.is_jti_blacklisted", new=AsyncMock(return_value=True)):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=REVOKED)):
         resp = client.get("/pets", headers=headers)
     assert resp.status_code == 401
 
@@ -189,3 +189,38 @@ def test_create_pet_duplicate_override_proceeds(client):
         headers=_auth_headers(),
     )
     assert resp.status_code == 201
+
+
+@respx.mock
+def test_synced_revocation_mirror_skips_the_combined_redis_check(client):
+    """With the in-memory mirror in sync the rate-limit script gets no blacklist key."""
+    respx.get("http://test-main-app/api/my-pets").mock(return_value=httpx.Response(200, json=[]))
+    limiter = AsyncMock(return_value=ALLOWED)
+
+    with (
+        patch("src.core.revocation.is_synced", return_value=True),
+        patch("src.core.revocation.is_revoked", new=AsyncMock(return_value=False)),
+        patch("src.core.rate_limit.hit", new=limiter),
+    ):
+        resp = client.get("/pets", headers=_auth_headers(user_id=3))
+
+    assert resp.status_code == 200
+    _, key = limiter.await_args.args
+    assert key == "rl:fixed_window:user:3"
+    assert limiter.await_args.kwargs == {"jti": None}
+
+
+@respx.mock
+def test_unsynced_mirror_checks_revocation_inside_the_rate_limit_call(client):
+    respx.get("http://test-main-app/api/my-pets").mock(return_value=httpx.Response(200, json=[]))
+    limiter = AsyncMock(return_value=ALLOWED)
+    blacklist = AsyncMock(side_effect=AssertionError("separate EXISTS"))
+
+    with (
+        patch("src.core.rate_limit.hit", new=limiter),
+        patch("src.core.redis.is_jti_blacklisted", new=blacklist),
+    ):
+        resp = client.get("/pets", headers=_auth_headers(user_id=3))
+
+    assert resp.status_code == 200
+    assert len(limiter.await_args.kwargs["jti"]) == 32
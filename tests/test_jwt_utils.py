@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
 import pytest
@@ -30,7 +31,7 @@ def test_happy_path():
 def test_expired_token_raises():
     from src.core.jwt import validate_jwt
 
-    past = int((datetime.now(timezone.utc) - timedelta(seconds=10)).timestamp())
+    past = int((datetime.now(UTC) - timedelta(seconds=10)).timestamp())
     expired = jose_jwt.encode(
         {"sub": "1", "tok": "irrelevant", "exp": past},
         TEST_SETTINGS.JWT_SECRET,
@@ -82,3 +83,46 @@ def test_wrong_algorithm_rejected():
     )
     with pytest.raises(ValueError, match="Invalid token"):
         validate_jwt(forged)
+
+
+def test_verify_jwt_returns_all_claims_and_caches_the_result():
+    from src.core.jwt import create_jwt, verify_jwt
+
+    token = create_jwt(42, "sanctum|abc")
+    first = verify_jwt(token)
+
+    assert first.user_id == 42
+    assert first.sanctum_token == "sanctum|abc"
+    assert first.jti and first.exp > 0
+    with patch("src.core.jwt.decrypt", side_effect=AssertionError("decrypted again")):
+        assert verify_jwt(token) is first
+
+
+def test_verified_cache_entry_does_not_outlive_token_exp():
+    from src.core.crypto import encrypt
+    from src.core.jwt import verify_jwt
+
+    soon = int(datetime.now(UTC).timestamp()) + 1
+    token = jose_jwt.encode(
+        {"sub": "1", "tok": encrypt("sanctum|x"), "exp": soon, "jti": "j1"},
+        TEST_SETTINGS.JWT_SECRET,
+        algorithm="HS256",
+    )
+    verify_jwt(token)
+
+    with patch("src.core.cache.time.monotonic", return_value=time.monotonic() + 2):
+        with pytest.raises(ValueError, match="Invalid token"):
+            with patch("src.core.jwt.jwt.decode", side_effect=jose_jwt.ExpiredSignatureError("expired")):
+                verify_jwt(token)
+
+
+def test_failed_verification_is_not_cached():
+    from src.core.jwt import create_jwt, verify_jwt
+
+    token = create_jwt(1, "sanctum|x")
+    header, payload_b64, _ = token.split(".")
+    forged = f"{header}.{payload_b64}.AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid token"):
+            verify_jwt(forged)
@@ -2,11 +2,14 @@ from datetime import date
 
 import pytest
 
+import src.services.pets_normalization as pets_normalization
 from src.services.pets_normalization import (
     build_pet_time_context,
     normalize_birth_fields,
     normalize_sex,
     normalize_species_to_pet_type_id,
+    to_pet_summaries,
+    to_pet_summary,
 )
 
 
@@ -105,3 +108,42 @@ def test_build_pet_time_context_keeps_unknown_age_for_partial_birthdays():
     assert value["age"] is None
     assert value["next_birthday_at"] is None
     assert value["days_until_next_birthday"] is None
+
+
+RAW_PETS = [
+    {"id": 1, "name": "Mimi", "pet_type_id": 2, "birthday_precision": "day", "birthday_year": 2020, "birthday_month": 4, "birthday_day": 2},
+    {"id": 2, "name": "Bun", "pet_type_id": 1, "birthday_precision": "day", "birthday_year": 2024, "birthday_month": 2, "birthday_day": 29},
+    {"id": 3, "name": "Kiki", "age": "3 years", "birthday_precision": "month", "birthday_year": 2022, "birthday_month": 11},
+    {"id": 4, "name": "Noname"},
+]
+
+
+def test_to_pet_summaries_matches_single_summaries():
+    species = {1: "dog", 2: "cat"}
+    for today in (date(2026, 3, 26), date(2027, 2, 28), date(2028, 2, 29), date(2026, 12, 31)):
+        pets_normalization.clear_time_context_memo()
+        expected = [to_pet_summary(raw, species, today=today) for raw in RAW_PETS]
+        assert to_pet_summaries(RAW_PETS, species, today=today) == expected
+        # Second pass is served from the memo and must be identical.
+        assert to_pet_summaries(RAW_PETS, species, today=today) == expected
+
+
+def test_to_pet_summaries_memoises_per_day(monkeypatch):
+    pets_normalization.clear_time_context_memo()
+    calls = []
+    real_time_context = pets_normalization._time_context
+
+    def counting_time_context(raw, day):
+        calls.append(raw["id"])
+        return real_time_context(raw, day)
+
+    monkeypatch.setattr(pets_normalization, "_time_context", counting_time_context)
+
+    to_pet_summaries(RAW_PETS, {}, today=date(2026, 3, 26))
+    to_pet_summaries(RAW_PETS, {}, today=date(2026, 3, 26))
+    assert calls == [1, 2, 3, 4]
+
+    changed = [{**RAW_PETS[0], "birthday_day": 3}]
+    to_pet_summaries(changed, {}, today=date(2026, 3, 26))
+    to_pet_summaries(RAW_PETS[:1], {}, today=date(2026, 3, 27))
+    assert calls == [1, 2, 3, 4, 1, 1]
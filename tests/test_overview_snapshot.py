@@ -0,0 +1,217 @@
+import time
+
+import httpx
+import pytest
+import respx
+
+from src.core.jwt import create_jwt
+from src.services import overview_snapshot
+from tests.conftest import TEST_SETTINGS
+
+SNAPSHOT_SETTINGS = TEST_SETTINGS.model_copy(update={"OVERVIEW_SNAPSHOT_ENABLED": True})
+
+
+def _auth_headers() -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_jwt(user_id=9, sanctum_token='sanctum-token')}"}
+
+
+def _item(pet_id: int, name: str, due_at: str | None = None) -> dict:
+    return {
+        "id": pet_id,
+        "name": name,
+        "next_vaccination_due_at": due_at,
+        "vaccination_data_status": "available",
+        "weights_data_status": "available",
+    }
+
+
+@pytest.fixture
+def fake_redis(redis_client):
+    yield redis_client
+    overview_snapshot._active_users.clear()
+    overview_snapshot._pending.clear()
+    overview_snapshot._backoff.clear()
+
+
+@pytest.fixture
+def snapshot_client(client):
+    from src.core.config import get_settings
+    from src.main import app
+
+    app.dependency_overrides[get_settings] = lambda: SNAPSHOT_SETTINGS
+    yield client
+    app.dependency_overrides[get_settings] = lambda: TEST_SETTINGS
+
+
+async def test_snapshot_round_trips_encrypted(fake_redis):
+    await overview_snapshot.save_snapshot(9, [_item(1, "Mimi")], SNAPSHOT_SETTINGS)
+
+    assert "Mimi" not in await fake_redis.get("overview:snapshot:9")
+    snapshot = await overview_snapshot.load_snapshot(9)
+    assert snapshot is not None
+    assert snapshot.items[0]["name"] == "Mimi"
+    assert snapshot.age_seconds < 5
+
+
+async def test_tampered_snapshot_is_ignored(fake_redis):
+    await overview_snapshot.save_snapshot(9, [_item(1, "Mimi")], SNAPSHOT_SETTINGS)
+    body = await fake_redis.get("overview:snapshot:9")
+    await fake_redis.set("overview:snapshot:9", body[:-4] + "AAAA")
+
+    assert await overview_snapshot.load_snapshot(9) is None
+
+
+@respx.mock
+def test_pets_overview_is_served_from_snapshot(snapshot_client, fake_redis):
+    import asyncio
+
+    asyncio.run(
+        overview_snapshot.save_snapshot(
+            9,
+            [_item(1, "Mimi", "2099-03-01"), _item(2, "Bun"), _item(3, "Kiki", "2099-01-01")],
+            SNAPSHOT_SETTINGS,
+        )
+    )
+    upstream = respx.get(url__regex=r"http://test-main-app/api/.*").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = snapshot_client.post(
+        "/pets/overview",
+        json={"sort_by": "next_vaccination_due_at", "only_with_upcoming_vaccination": True},
+        headers=_auth_headers(),
+    )
+
+    assert resp.status_code == 200
+    assert [item["name"] for item in resp.json()] == ["Kiki", "Mimi"]
+    assert resp.headers["X-Overview-Snapshot-Age"] == "0"
+    assert upstream.call_count == 0
+
+    resp = snapshot_client.post("/pets/overview", json={"limit": 2}, headers=_auth_headers())
+    assert resp.json()["snapshot_age_seconds"] is not None
+    assert [item["name"] for item in resp.json()["items"]] == ["Bun", "Kiki"]
+
+
+@respx.mock
+def test_missing_snapshot_falls_back_and_schedules_refresh(snapshot_client, fake_redis):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    respx.get(url__regex=r"http://test-main-app/api/pets/1/(vaccinations|weights)").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = snapshot_client.post("/pets/overview", json={}, headers=_auth_headers())
+
+    assert resp.status_code == 200
+    assert resp.json()[0]["name"] == "Mimi"
+    assert "X-Overview-Snapshot-Age" not in resp.headers
+    assert 9 in overview_snapshot._active_users
+    assert 9 in overview_snapshot._pending
+
+
+@respx.mock
+async def test_refresh_builds_snapshot_and_writes_invalidate_it(fake_redis):
+    from src.routers.pets import build_overview_snapshot
+
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(200, json=[{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/weights").mock(return_value=httpx.Response(200, json=[]))
+    overview_snapshot.note_active(9, "sanctum-token", int(time.time()) + 3600)
+
+    await overview_snapshot._refresh_user(9, "sanctum-token", SNAPSHOT_SETTINGS, build_overview_snapshot)
+
+    snapshot = await overview_snapshot.load_snapshot(9)
+    assert snapshot is not None
+    assert snapshot.items[0]["next_vaccination_due_at"] == "2099-01-01"
+
+    await overview_snapshot.invalidate_snapshot(9, SNAPSHOT_SETTINGS)
+    assert await overview_snapshot.load_snapshot(9) is None
+    assert overview_snapshot._pending == {9}
+
+
+async def test_write_during_a_build_discards_the_build(fake_redis):
+    await overview_snapshot.save_snapshot(9, [_item(1, "Mimi")], SNAPSHOT_SETTINGS)
+    overview_snapshot.note_active(9, "sanctum-token", int(time.time()) + 3600)
+
+    async def build(user_id, sanctum_token, settings):
+        # A rename lands while the pre-write pets are being loaded.
+        await overview_snapshot.invalidate_snapshot(user_id, settings)
+        return [_item(1, "Mimi")]
+
+    await overview_snapshot._refresh_user(9, "sanctum-token", SNAPSHOT_SETTINGS, build)
+
+    assert await overview_snapshot.load_snapshot(9) is None
+    assert overview_snapshot._pending == {9}
+
+
+async def test_incomplete_build_is_not_stored_and_backs_off(fake_redis):
+    items = [_item(1, "Mimi"), {**_item(2, "Bun"), "weights_data_status": "timeout"}]
+
+    async def build(user_id, sanctum_token, settings):
+        return items
+
+    overview_snapshot.note_active(9, "sanctum-token", int(time.time()) + 3600)
+    await overview_snapshot._refresh_user(9, "sanctum-token", SNAPSHOT_SETTINGS, build)
+
+    assert await overview_snapshot.load_snapshot(9) is None
+    # Neither a miss nor the schedule rebuilds the user while backing off.
+    overview_snapshot.request_refresh(9)
+    assert overview_snapshot._due_users(SNAPSHOT_SETTINGS, scheduled=False) == []
+    assert overview_snapshot._due_users(SNAPSHOT_SETTINGS, scheduled=True) == []
+    assert overview_snapshot._pending == {9}
+
+    await overview_snapshot._refresh_user(9, "sanctum-token", SNAPSHOT_SETTINGS, build)
+    failures, retry_at = overview_snapshot._backoff[9]
+    assert failures == 2
+    assert retry_at - time.monotonic() > 55
+
+    overview_snapshot._backoff[9] = (failures, time.monotonic() - 1)
+    assert overview_snapshot._due_users(SNAPSHOT_SETTINGS, scheduled=False) == [(9, "sanctum-token")]
+    items[1] = _item(2, "Bun")
+    await overview_snapshot._refresh_user(9, "sanctum-token", SNAPSHOT_SETTINGS, build)
+    assert await overview_snapshot.load_snapshot(9) is not None
+    assert 9 not in overview_snapshot._backoff
+
+
+@respx.mock
+async def test_build_reads_past_the_health_cache_and_latency_budget(fake_redis):
+    import asyncio
+
+    from src.routers.pets import build_overview_snapshot
+    from src.services.pet_cache import store_pet_health
+
+    async def slow_vaccinations(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}])
+
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=slow_vaccinations)
+    respx.get("http://test-main-app/api/pets/1/weights").mock(return_value=httpx.Response(200, json=[]))
+    settings = SNAPSHOT_SETTINGS.model_copy(
+        update={"OVERVIEW_LATENCY_BUDGET_SECONDS": 0.01, "OVERVIEW_PET_TIMEOUT_SECONDS": 0.01}
+    )
+    store_pet_health(9, 1, "vaccinations", [], settings, fetched_at=time.monotonic())
+
+    items = await build_overview_snapshot(9, "sanctum-token", settings)
+
+    assert items[0]["vaccination_data_status"] == "available"
+    assert items[0]["next_vaccination_due_at"] == "2099-01-01"
+
+
+def test_expired_and_idle_users_are_not_refreshed():
+    overview_snapshot.note_active(1, "a", int(time.time()) - 1)
+    overview_snapshot.note_active(2, "b", int(time.time()) + 3600)
+    overview_snapshot.note_active(3, "c", int(time.time()) + 3600)
+    overview_snapshot._active_users[3].last_seen -= SNAPSHOT_SETTINGS.OVERVIEW_SNAPSHOT_IDLE_SECONDS + 1
+
+    try:
+        assert overview_snapshot._due_users(SNAPSHOT_SETTINGS, scheduled=True) == [(2, "b")]
+    finally:
+        overview_snapshot._active_users.clear()
@@ -0,0 +1,83 @@
+from src.services.pets_normalization import PetNameIndex, filter_pet_candidates, fold_name
+
+PETS = [
+    ("Mimi", "cat"),
+    ("Milo", "dog"),
+    ("Mi", "cat"),
+    ("Bông", "cat"),
+    ("Đậu Đỏ", "dog"),
+    ("Whiskers", "cat"),
+]
+
+
+def _names(index: PetNameIndex, matches) -> list[str]:
+    return [PETS[match.position][0] for match in matches]
+
+
+def test_fold_name_drops_case_spacing_and_vietnamese_diacritics():
+    assert fold_name("  Đậu   Đỏ ") == "dau do"
+    assert fold_name("BÔNG") == "bong"
+    assert fold_name(None) == ""
+
+
+def test_substring_search_ranks_exact_then_prefix_then_score():
+    index = PetNameIndex(PETS)
+
+    matches = index.search(name="mi")
+
+    assert _names(index, matches) == ["Mi", "Mimi", "Milo"]
+    assert matches[0].kind == "exact"
+    assert matches[0].score == 1.0
+    assert {match.kind for match in matches[1:]} == {"substring"}
+    assert matches[1].score > matches[2].score
+
+
+def test_word_prefix_matches_rank_before_infix_matches():
+    pets = [("Tomi", "cat"), ("Bé Mina", "cat"), ("Minh", "dog")]
+    index = PetNameIndex(pets)
+
+    matches = index.search(name="mi")
+
+    assert [pets[match.position][0] for match in matches] == ["Minh", "Bé Mina", "Tomi"]
+
+
+def test_search_is_accent_insensitive_and_filters_species():
+    index = PetNameIndex(PETS)
+
+    assert _names(index, index.search(name="bong")) == ["Bông"]
+    assert _names(index, index.search(name="dau do", species="dog")) == ["Đậu Đỏ"]
+    assert index.search(name="dau", species="cat") == []
+
+
+def test_fuzzy_search_finds_typos_only_when_no_substring_hit():
+    index = PetNameIndex(PETS)
+
+    assert index.search(name="wiskers") == []
+    matches = index.search(name="wiskers", fuzzy=True)
+    assert _names(index, matches) == ["Whiskers"]
+    assert matches[0].kind == "fuzzy"
+    assert 0.3 <= matches[0].score < 1.0
+
+    assert {match.kind for match in index.search(name="mimi", fuzzy=True)} == {"exact"}
+
+
+def test_search_without_name_keeps_list_order():
+    index = PetNameIndex(PETS)
+
+    assert _names(index, index.search(species="dog")) == ["Milo", "Đậu Đỏ"]
+
+
+def test_filter_pet_candidates_folds_accents():
+    pets = [{"id": 1, "name": "Bông", "species": "cat"}, {"id": 2, "name": "Bong Bong", "species": "cat"}]
+
+    assert [pet["id"] for pet in filter_pet_candidates(pets, name="bong")] == [1, 2]
+
+
+def test_fold_name_folds_each_name_once():
+    from src.services import pets_normalization
+
+    assert fold_name("Mèo  Mun") == "meo mun"
+    pets_normalization._folded_names["Mèo  Mun"] = "memoised"
+
+    assert fold_name("Mèo  Mun") == "memoised"
+    pets_normalization._folded_names.clear()
@@ -1,8 +1,13 @@
+import asyncio
+import time
+from unittest.mock import patch
+
 import httpx
 import respx
-from unittest.mock import patch
 
 from src.core.jwt import create_jwt
+from src.services.pets_normalization import PetNameIndex
+from tests.conftest import TEST_SETTINGS
 
 
 def _auth_headers() -> dict[str, str]:
@@ -280,7 +285,11 @@ def test_pets_overview_includes_birthday_context_and_computed_age(client):
 
         resp = client.post(
             "/pets/overview",
-            json={"sort_by": "next_birthday_at", "sort_order": "asc"},
+            json={
+                "sort_by": "next_birthday_at",
+                "sort_order": "asc",
+                "include": ["vaccinations", "weights"],
+            },
             headers=_auth_headers(),
         )
 
@@ -394,3 +403,561 @@ def test_upstream_429_preserves_quota_metadata(client):
     assert data["upstream_error_code"] == "API_DAILY_QUOTA_EXCEEDED"
     assert data["quota"]["remaining"] == 0
     assert data["quota"]["reset_at_utc"] == "2026-03-07T00:00:00Z"
+
+
+@respx.mock
+def test_repeated_pet_reads_are_served_from_cache(client):
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi", "pet_type_id": 2}])
+    )
+
+    client.get("/pets", headers=_auth_headers())
+    client.post("/pets/find", json={"name": "mi"}, headers=_auth_headers())
+    resp = client.get("/pets", params={"name": "mimi"}, headers=_auth_headers())
+
+    assert resp.status_code == 200
+    assert resp.json()[0]["name"] == "Mimi"
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_name_index_is_only_built_for_name_queries(client):
+    from src.services import pet_cache
+
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi", "pet_type_id": 2}])
+    )
+
+    with patch("src.routers.pets.PetNameIndex", wraps=PetNameIndex) as built:
+        assert client.get("/pets", headers=_auth_headers()).status_code == 200
+        assert built.call_count == 0
+
+        client.get("/pets", params={"name": "mi"}, headers=_auth_headers())
+        client.post("/pets/find", json={"name": "mimi"}, headers=_auth_headers())
+        assert built.call_count == 1
+    assert pet_cache._index_cache is not None and pet_cache._index_cache.get(9) is not None
+
+
+@respx.mock
+def test_pet_cache_is_per_user(client):
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    client.get("/pets", headers=_auth_headers())
+    client.get(
+        "/pets",
+        headers={"Authorization": f"Bearer {create_jwt(user_id=10, sanctum_token='other-token')}"},
+    )
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_create_pet_invalidates_pet_cache(client):
+    respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 2, "name": "cat"}])
+    )
+    list_route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    respx.post("http://test-main-app/api/pets").mock(
+        return_value=httpx.Response(201, json={"id": 5, "name": "Mimi"})
+    )
+
+    client.post("/pets", json={"name": "Mimi", "species": "cat"}, headers=_auth_headers())
+    client.get("/pets", headers=_auth_headers())
+
+    assert list_route.call_count == 2
+
+
+@respx.mock
+def test_update_pet_invalidates_pet_cache(client):
+    list_route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi", "pet_type_id": 2}])
+    )
+    respx.put("http://test-main-app/api/pets/1").mock(
+        return_value=httpx.Response(200, json={"id": 1, "name": "Momo"})
+    )
+
+    client.get("/pets", headers=_auth_headers())
+    client.patch("/pets/1", json={"name": "Momo"}, headers=_auth_headers())
+    client.get("/pets", headers=_auth_headers())
+
+    assert list_route.call_count == 2
+
+
+def _delayed(payload, delay: float, tracker: dict[str, int] | None = None):
+    async def responder(request):
+        if tracker is not None:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            if tracker is not None:
+                tracker["active"] -= 1
+        return httpx.Response(200, json=payload)
+
+    return responder
+
+
+@respx.mock
+async def test_overview_health_loads_run_in_one_phase():
+    from src.routers.pets import _load_overview_health
+
+    started = {"vaccinations": asyncio.Event(), "weights": asyncio.Event()}
+
+    def meets(resource: str, other: str):
+        # Each load only answers once a load of the other resource is in flight,
+        # which can only happen if both run in the same phase.
+        async def responder(request):
+            started[resource].set()
+            await asyncio.wait_for(started[other].wait(), timeout=2.0)
+            return httpx.Response(200, json=[])
+
+        return responder
+
+    respx.get(url__regex=r"http://test-main-app/api/pets/\d+/vaccinations").mock(
+        side_effect=meets("vaccinations", "weights")
+    )
+    respx.get(url__regex=r"http://test-main-app/api/pets/\d+/weights").mock(
+        side_effect=meets("weights", "vaccinations")
+    )
+
+    vaccinations, weights = await _load_overview_health([1, 2], sanctum_token="tok", settings=TEST_SETTINGS)
+
+    assert {pet_id: summary[2] for pet_id, summary in vaccinations.items()} == {1: "available", 2: "available"}
+    assert {pet_id: summary[1] for pet_id, summary in weights.items()} == {1: "available", 2: "available"}
+
+
+@respx.mock
+async def test_overview_health_fan_out_is_bounded_by_semaphore():
+    from src.routers.pets import _load_overview_health
+
+    tracker = {"active": 0, "peak": 0}
+    respx.get(url__regex=r"http://test-main-app/api/pets/\d+/(vaccinations|weights)").mock(
+        side_effect=_delayed([], 0.01, tracker)
+    )
+    settings = TEST_SETTINGS.model_copy(update={"OVERVIEW_MAX_CONCURRENCY": 3})
+
+    await _load_overview_health(list(range(1, 11)), sanctum_token="tok", settings=settings)
+
+    assert tracker["peak"] <= 3
+
+
+@respx.mock
+async def test_slow_pet_hits_its_deadline_without_blocking_others():
+    from src.routers.pets import _load_overview_health
+
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=_delayed([], 3.0))
+    respx.get("http://test-main-app/api/pets/1/weights").mock(side_effect=_delayed([], 0.0))
+    respx.get("http://test-main-app/api/pets/2/vaccinations").mock(side_effect=_delayed([], 0.0))
+    respx.get("http://test-main-app/api/pets/2/weights").mock(side_effect=_delayed([], 0.0))
+    settings = TEST_SETTINGS.model_copy(update={"OVERVIEW_PET_TIMEOUT_SECONDS": 0.5})
+
+    started = time.perf_counter()
+    vaccinations, weights = await _load_overview_health([1, 2], sanctum_token="tok", settings=settings)
+
+    assert time.perf_counter() - started < 2.0
+    assert vaccinations[1][2] == "timeout"
+    assert weights[1][1] == "available"
+    assert vaccinations[2][2] == "available"
+
+
+@respx.mock
+async def test_overview_returns_partial_results_within_latency_budget():
+    from src.routers.pets import _load_overview_health
+
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        side_effect=_delayed([{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}], 0.0)
+    )
+    respx.get("http://test-main-app/api/pets/1/weights").mock(side_effect=_delayed([], 0.0))
+    respx.get("http://test-main-app/api/pets/2/vaccinations").mock(side_effect=_delayed([], 3.0))
+    respx.get("http://test-main-app/api/pets/2/weights").mock(side_effect=_delayed([], 3.0))
+    settings = TEST_SETTINGS.model_copy(
+        update={"OVERVIEW_PET_TIMEOUT_SECONDS": 10.0, "OVERVIEW_LATENCY_BUDGET_SECONDS": 0.5}
+    )
+
+    started = time.perf_counter()
+    vaccinations, weights = await _load_overview_health([1, 2], sanctum_token="tok", settings=settings)
+
+    assert time.perf_counter() - started < 2.0
+    assert vaccinations[1][1] == "Rabies"
+    assert vaccinations[1][2] == "available"
+    assert weights[1][1] == "available"
+    assert vaccinations[2] == (None, None, "timeout", [])
+    assert weights[2] == ([], "timeout")
+
+
+@respx.mock
+def test_pets_overview_marks_slow_pets_as_timeout(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(return_value=httpx.Response(200, json=[]))
+    respx.get("http://test-main-app/api/pets/1/weights").mock(return_value=httpx.Response(200, json=[]))
+    respx.get("http://test-main-app/api/pets/2/vaccinations").mock(side_effect=_delayed([], 3.0))
+    respx.get("http://test-main-app/api/pets/2/weights").mock(return_value=httpx.Response(200, json=[]))
+
+    from src.core.config import get_settings
+    from src.main import app
+
+    app.dependency_overrides[get_settings] = lambda: TEST_SETTINGS.model_copy(
+        update={"OVERVIEW_LATENCY_BUDGET_SECONDS": 0.5}
+    )
+    resp = client.post("/pets/overview", json={}, headers=_auth_headers())
+
+    assert resp.status_code == 200
+    by_name = {item["name"]: item for item in resp.json()}
+    assert by_name["Mimi"]["vaccination_data_status"] == "available"
+    assert by_name["Bun"]["vaccination_data_status"] == "timeout"
+    assert by_name["Bun"]["weights_data_status"] == "available"
+
+
+@respx.mock
+async def test_overview_health_is_cached_per_pet():
+    from src.routers.pets import _load_overview_health
+
+    vaccinations_route = respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    weights_route = respx.get("http://test-main-app/api/pets/1/weights").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    for _ in range(3):
+        vaccinations, weights = await _load_overview_health(
+            [1], sanctum_token="tok", settings=TEST_SETTINGS, user_id=9
+        )
+
+    assert vaccinations[1][2] == "available"
+    assert weights[1][1] == "available"
+    assert vaccinations_route.call_count == 1
+    assert weights_route.call_count == 1
+
+
+@respx.mock
+async def test_stale_overview_health_is_served_then_refreshed():
+    from src.routers.pets import _health_refreshes, _load_overview_health
+
+    route = respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": 1, "vaccine_name": "Rabies", "due_at": "2099-01-01"}]),
+            httpx.Response(200, json=[{"id": 1, "vaccine_name": "FVRCP", "due_at": "2099-01-01"}]),
+            httpx.Response(200, json=[{"id": 1, "vaccine_name": "FVRCP", "due_at": "2099-01-01"}]),
+        ]
+    )
+    respx.get("http://test-main-app/api/pets/1/weights").mock(return_value=httpx.Response(200, json=[]))
+    settings = TEST_SETTINGS.model_copy(update={"PET_HEALTH_CACHE_FRESH_SECONDS": 0.0})
+
+    await _load_overview_health([1], sanctum_token="tok", settings=settings, user_id=9)
+    vaccinations, _ = await _load_overview_health([1], sanctum_token="tok", settings=settings, user_id=9)
+
+    # The stale copy is returned without waiting for the refresh.
+    assert vaccinations[1][1] == "Rabies"
+    await asyncio.gather(*_health_refreshes.values())
+    assert route.call_count == 2
+
+    vaccinations, _ = await _load_overview_health([1], sanctum_token="tok", settings=settings, user_id=9)
+    assert vaccinations[1][1] == "FVRCP"
+    await asyncio.gather(*_health_refreshes.values())
+
+
+@respx.mock
+def test_add_vaccination_invalidates_overview_health_cache(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    vaccinations_route = respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    weights_route = respx.get("http://test-main-app/api/pets/1/weights").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    respx.post("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(201, json={"id": 3, "vaccine_name": "Rabies"})
+    )
+
+    client.post("/pets/overview", json={}, headers=_auth_headers())
+    client.post(
+        "/pets/1/vaccinations",
+        json={"vaccine_name": "Rabies", "administered_at": "2026-01-01"},
+        headers=_auth_headers(),
+    )
+    client.post("/pets/overview", json={}, headers=_auth_headers())
+
+    assert vaccinations_route.call_count == 2
+    assert weights_route.call_count == 1
+
+
+@respx.mock
+def test_list_pets_paginates_with_cursor(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}, {"id": 3, "name": "Kiki"}],
+        )
+    )
+
+    first = client.get("/pets", params={"limit": 2}, headers=_auth_headers()).json()
+    second = client.get(
+        "/pets", params={"limit": 2, "cursor": first["next_cursor"]}, headers=_auth_headers()
+    ).json()
+
+    assert [pet["id"] for pet in first["items"]] == [1, 2]
+    assert [pet["id"] for pet in second["items"]] == [3]
+    assert second["next_cursor"] is None
+
+
+@respx.mock
+def test_pets_overview_page_only_fetches_health_for_page(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}, {"id": 3, "name": "Kiki"}],
+        )
+    )
+    vaccinations_route = respx.get(url__regex=r"http://test-main-app/api/pets/\d+/vaccinations").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    weights_route = respx.get(url__regex=r"http://test-main-app/api/pets/\d+/weights").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = client.post("/pets/overview", json={"limit": 1}, headers=_auth_headers())
+    data = resp.json()
+
+    assert resp.status_code == 200
+    assert [item["name"] for item in data["items"]] == ["Bun"]
+    assert data["items"][0]["vaccination_data_status"] == "available"
+    assert data["next_cursor"] is not None
+    assert [call.request.url.path for call in vaccinations_route.calls] == ["/api/pets/2/vaccinations"]
+    assert weights_route.call_count == 1
+
+    resp = client.post(
+        "/pets/overview", json={"limit": 5, "cursor": data["next_cursor"]}, headers=_auth_headers()
+    )
+    assert [item["name"] for item in resp.json()["items"]] == ["Kiki", "Mimi"]
+    assert resp.json()["next_cursor"] is None
+
+
+@respx.mock
+def test_pets_overview_page_sorted_by_vaccination_loads_weights_for_page_only(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(200, json=[{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}])
+    )
+    respx.get("http://test-main-app/api/pets/2/vaccinations").mock(return_value=httpx.Response(200, json=[]))
+    weights_route = respx.get(url__regex=r"http://test-main-app/api/pets/\d+/weights").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = client.post(
+        "/pets/overview",
+        json={"limit": 1, "sort_by": "next_vaccination_due_at"},
+        headers=_auth_headers(),
+    )
+
+    item = resp.json()["items"][0]
+    assert item["name"] == "Mimi"
+    assert item["next_vaccination_name"] == "Rabies"
+    assert item["weights_data_status"] == "available"
+    assert [call.request.url.path for call in weights_route.calls] == ["/api/pets/1/weights"]
+
+
+@respx.mock
+def test_paged_overview_spends_one_latency_budget(client):
+    from src.core.config import get_settings
+    from src.main import app
+
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=_delayed([], 0.3))
+    respx.get("http://test-main-app/api/pets/1/weights").mock(side_effect=_delayed([], 0.3))
+    app.dependency_overrides[get_settings] = lambda: TEST_SETTINGS.model_copy(
+        update={"OVERVIEW_LATENCY_BUDGET_SECONDS": 0.45}
+    )
+
+    resp = client.post(
+        "/pets/overview",
+        json={"limit": 1, "sort_by": "next_vaccination_due_at"},
+        headers=_auth_headers(),
+    )
+
+    # Each step fits the budget on its own; together they do not.
+    item = resp.json()["items"][0]
+    assert item["vaccination_data_status"] == "available"
+    assert item["weights_data_status"] == "timeout"
+
+
+@respx.mock
+def test_cursor_is_rejected_for_different_filters_or_sort(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(
+            200,
+            json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}, {"id": 3, "name": "Kiki"}],
+        )
+    )
+    first = client.get("/pets", params={"limit": 2}, headers=_auth_headers()).json()
+
+    resp = client.get(
+        "/pets", params={"limit": 2, "name": "i", "cursor": first["next_cursor"]}, headers=_auth_headers()
+    )
+    assert resp.status_code == 422
+    assert resp.json()["fields"] == [{"name": "cursor", "reason": "invalid_cursor"}]
+
+    resp = client.post(
+        "/pets/overview",
+        json={"limit": 2, "sort_order": "desc", "include": [], "cursor": first["next_cursor"]},
+        headers=_auth_headers(),
+    )
+    assert resp.status_code == 422
+
+
+def test_pets_overview_rejects_invalid_cursor(client):
+    resp = client.post("/pets/overview", json={"limit": 5, "cursor": "not-a-cursor"}, headers=_auth_headers())
+
+    assert resp.status_code == 422
+    assert resp.json()["fields"] == [{"name": "cursor", "reason": "invalid_cursor"}]
+
+
+@respx.mock
+def test_pets_overview_streams_ndjson_in_completion_order(client):
+    import json
+
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Bun"}, {"id": 2, "name": "Mimi"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=_delayed([], 1.0))
+    respx.get("http://test-main-app/api/pets/1/weights").mock(return_value=httpx.Response(200, json=[]))
+    respx.get("http://test-main-app/api/pets/2/vaccinations").mock(
+        return_value=httpx.Response(200, json=[{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}])
+    )
+    respx.get("http://test-main-app/api/pets/2/weights").mock(return_value=httpx.Response(200, json=[]))
+
+    resp = client.post(
+        "/pets/overview",
+        json={},
+        headers={**_auth_headers(), "Accept": "application/x-ndjson"},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["name"] for line in lines[:-1]] == ["Mimi", "Bun"]
+    assert lines[0]["next_vaccination_due_at"] == "2099-01-01"
+    assert lines[-1] == {"summary": {"pets": 2, "emitted": 2, "timeout": 0, "unavailable": 0}}
+
+
+@respx.mock
+async def test_stream_overview_health_reports_timeouts():
+    from src.routers.pets import _stream_overview_health
+
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=_delayed([], 3.0))
+    respx.get(url__regex=r"http://test-main-app/api/pets/\d+/(vaccinations|weights)").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    settings = TEST_SETTINGS.model_copy(update={"OVERVIEW_PET_TIMEOUT_SECONDS": 1.0})
+
+    results = {
+        pet_id: (vaccination, weights)
+        async for pet_id, vaccination, weights in _stream_overview_health(
+            [1, 2, 3], sanctum_token="tok", settings=settings
+        )
+    }
+
+    assert sorted(results) == [1, 2, 3]
+    assert results[1][0][2] == "timeout"
+    assert results[1][1][1] == "available"
+    assert results[2][0][2] == "available"
+
+
+def test_pets_overview_stream_rejects_pagination(client):
+    resp = client.post(
+        "/pets/overview",
+        json={"limit": 5},
+        headers={**_auth_headers(), "Accept": "application/x-ndjson"},
+    )
+
+    assert resp.status_code == 422
+
+
+@respx.mock
+def test_list_pets_follows_upstream_pagination(client):
+    respx.get("http://test-main-app/api/my-pets", params={"page": "2"}).mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": 2, "name": "Bun"}], "meta": {"current_page": 2, "last_page": 2}},
+        )
+    )
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": 1, "name": "Mimi"}], "meta": {"current_page": 1, "last_page": 2}},
+        )
+    )
+
+    resp = client.get("/pets", headers=_auth_headers())
+
+    assert sorted(pet["name"] for pet in resp.json()) == ["Bun", "Mimi"]
+
+
+@respx.mock
+def test_pets_overview_birthday_sort_skips_health_fan_out(client):
+    my_pets = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}, {"id": 2, "name": "Bun"}])
+    )
+    health_route = respx.get(url__regex=r"http://test-main-app/api/pets/\d+/(vaccinations|weights)").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = client.post("/pets/overview", json={"sort_by": "next_birthday_at"}, headers=_auth_headers())
+
+    assert resp.status_code == 200
+    assert {item["vaccination_data_status"] for item in resp.json()} == {"skipped"}
+    assert {item["weights_data_status"] for item in resp.json()} == {"skipped"}
+    assert my_pets.call_count == 1
+    assert health_route.call_count == 0
+
+
+@respx.mock
+def test_pets_overview_include_adds_vaccinations_needed_for_filter(client):
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Mimi"}])
+    )
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(
+        return_value=httpx.Response(200, json=[{"id": 5, "vaccine_name": "Rabies", "due_at": "2099-01-01"}])
+    )
+    weights_route = respx.get("http://test-main-app/api/pets/1/weights").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    resp = client.post(
+        "/pets/overview",
+        json={"include": [], "only_with_upcoming_vaccination": True},
+        headers=_auth_headers(),
+    )
+
+    item = resp.json()[0]
+    assert item["next_vaccination_name"] == "Rabies"
+    assert item["weights_data_status"] == "skipped"
+    assert weights_route.call_count == 0
+
+
+@respx.mock
+def test_find_pets_returns_scored_fuzzy_candidates(client):
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Whiskers"}, {"id": 2, "name": "Bông"}])
+    )
+
+    fuzzy = client.post("/pets/find", json={"name": "wiskers"}, headers=_auth_headers()).json()
+    accented = client.post("/pets/find", json={"name": "bong"}, headers=_auth_headers()).json()
+
+    assert [(c["id"], c["match_type"]) for c in fuzzy["candidates"]] == [(1, "fuzzy")]
+    assert 0 < fuzzy["candidates"][0]["match_score"] < 1
+    assert [(c["id"], c["match_type"], c["match_score"]) for c in accented["candidates"]] == [(2, "exact", 1.0)]
+    assert route.call_count == 1
@@ -0,0 +1,127 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import respx
+
+from src.core import rate_limit
+from src.core.config import RateLimitRule
+from src.core.jwt import create_jwt
+from src.core.rate_limit import rate_limit_headers
+from tests.conftest import LIMITED, TEST_SETTINGS
+
+
+def _auth_headers(user_id: int = 7) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_jwt(user_id=user_id, sanctum_token='tok')}"}
+
+
+def test_default_policy_uses_the_per_minute_limit():
+    policy, key = rate_limit.resolve_policy(TEST_SETTINGS, "user:1", "GET /pets")
+
+    assert policy == rate_limit.RateLimitPolicy("fixed_window", 60, 60.0, 60)
+    assert key == "rl:fixed_window:user:1"
+
+
+def test_most_specific_rule_wins():
+    settings = TEST_SETTINGS.model_copy(
+        update={
+            "RATE_LIMIT_ALGORITHM": "gcra",
+            "RATE_LIMIT_RULES": [
+                RateLimitRule(route="POST /pets", limit=10, burst=2),
+                RateLimitRule(identity="user:42", limit=600, algorithm="token_bucket"),
+                RateLimitRule(route="/pets/overview", identity="user:42", limit=5, period_seconds=10),
+            ],
+        }
+    )
+
+    policy, key = rate_limit.resolve_policy(settings, "user:1", "POST /pets")
+    assert (policy.algorithm, policy.limit, policy.burst) == ("gcra", 10, 2)
+    assert key == "rl:gcra:user:1:POST /pets"
+
+    policy, key = rate_limit.resolve_policy(settings, "user:42", "POST /pets")
+    assert (policy.algorithm, policy.limit) == ("token_bucket", 600)
+    assert key == "rl:token_bucket:user:42"
+
+    policy, key = rate_limit.resolve_policy(settings, "user:42", "POST /pets/overview")
+    assert (policy.limit, policy.period_seconds) == (5, 10)
+    assert key == "rl:gcra:user:42:POST /pets/overview"
+
+
+@pytest.fixture
+def clock():
+    """Freeze the clock the in-memory Redis reads for TIME and expiries."""
+    now = [1_700_000_000.0]
+    with patch("time.time", new=lambda: now[0]):
+        yield now
+
+
+async def test_fixed_window_allows_the_limit_per_window(redis_client, clock):
+    policy = rate_limit.RateLimitPolicy("fixed_window", 5, 60.0, 5)
+
+    results = [await rate_limit.hit(policy, "rl:fixed_window:user:1") for _ in range(6)]
+
+    assert [result.allowed for result in results] == [True] * 5 + [False]
+    assert [result.remaining for result in results] == [4, 3, 2, 1, 0, 0]
+    assert (results[-1].reset_after, results[-1].retry_after) == (60.0, 60.0)
+    assert await redis_client.pttl("rl:fixed_window:user:1") == 60000
+
+    clock[0] += 61
+    assert (await rate_limit.hit(policy, "rl:fixed_window:user:1")).remaining == 4
+
+
+@pytest.mark.parametrize("algorithm", ["token_bucket", "gcra"])
+async def test_smooth_algorithms_allow_the_burst_then_space_requests(redis_client, clock, algorithm):
+    # 5 per minute is one request every 12 s, with up to 3 back to back.
+    policy = rate_limit.RateLimitPolicy(algorithm, 5, 60.0, 3)
+    key = f"rl:{algorithm}:user:1"
+
+    results = [await rate_limit.hit(policy, key) for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results[:3]] == [2, 1, 0]
+    assert results[2].reset_after == 36.0
+    assert results[3].retry_after == 12.0
+    assert rate_limit_headers(results[3])["Retry-After"] == "12"
+
+    clock[0] += 11.9
+    assert not (await rate_limit.hit(policy, key)).allowed
+    clock[0] += 0.1
+    refilled = await rate_limit.hit(policy, key)
+    assert refilled.allowed and refilled.remaining == 0
+
+    clock[0] += 36
+    assert (await rate_limit.hit(policy, key)).remaining == 2
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "token_bucket", "gcra"])
+async def test_revoked_token_is_rejected_before_it_is_counted(redis_client, clock, algorithm):
+    policy = rate_limit.RateLimitPolicy(algorithm, 5, 60.0, 3)
+    await redis_client.set("jwt:bl:abc", "1")
+
+    result = await rate_limit.hit(policy, f"rl:{algorithm}:user:1", jti="abc")
+
+    assert result.revoked and not result.allowed
+    assert await redis_client.exists(f"rl:{algorithm}:user:1") == 0
+    assert (await rate_limit.hit(policy, f"rl:{algorithm}:user:1", jti="other")).allowed
+
+
+@respx.mock
+def test_responses_carry_rate_limit_headers(client):
+    respx.get("http://test-main-app/api/my-pets").mock(return_value=httpx.Response(200, json=[]))
+
+    resp = client.get("/pets", headers=_auth_headers())
+
+    assert resp.headers["RateLimit-Limit"] == "60"
+    assert resp.headers["RateLimit-Remaining"] == "59"
+    assert resp.headers["RateLimit-Reset"] == "60"
+    assert "Retry-After" not in resp.headers
+
+
+def test_limited_response_tells_the_client_when_to_retry(client):
+    with patch("src.core.rate_limit.hit", new=AsyncMock(return_value=LIMITED)):
+        resp = client.get("/pets", headers=_auth_headers())
+
+    assert resp.status_code == 429
+    assert resp.json()["detail"]["error"] == "RATE_LIMIT_EXCEEDED"
+    assert resp.headers["Retry-After"] == "30"
+    assert resp.headers["RateLimit-Remaining"] == "0"
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -67,3 +68,68 @@ async def test_get_redis_initialization():
     # Reset globally
     redis_module._client = None
 
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.channels: tuple[str, ...] = ()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def subscribe(self, *channels):
+        self.channels = channels
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+async def test_pubsub_listener_dispatches_to_channel_handlers(mock_redis):
+    import src.core.redis as redis_module
+
+    pubsub = _FakePubSub(
+        [
+            {"type": "subscribe", "channel": "pet_types:updated", "data": 1},
+            {"type": "message", "channel": "pet_types:updated", "data": "7"},
+        ]
+    )
+    mock_redis.pubsub = lambda: pubsub
+    received: list[str] = []
+
+    redis_module.subscribe("pet_types:updated", received.append)
+    redis_module.start_pubsub_listener()
+    try:
+        for _ in range(10):
+            await asyncio.sleep(0)
+    finally:
+        await redis_module.stop_pubsub_listener()
+
+    assert pubsub.channels == ("pet_types:updated",)
+    assert received == ["7"]
+    assert redis_module._subscribers == {}
+
+
+async def test_run_script_registers_once_and_reuses_the_script(mock_redis):
+    from src.core.redis import run_script
+
+    registered: list[str] = []
+    script = AsyncMock(return_value=[1, 59, 60000, 0])
+    script.registered_client = mock_redis
+
+    def register_script(source):
+        registered.append(source)
+        return script
+
+    mock_redis.register_script = register_script
+
+    for _ in range(2):
+        assert await run_script("return 1", ["k"], [60]) == [1, 59, 60000, 0]
+
+    assert registered == ["return 1"]
+    script.assert_awaited_with(keys=["k"], args=[60])
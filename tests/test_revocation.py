@@ -0,0 +1,89 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core import revocation
+from tests.conftest import TEST_SETTINGS
+
+FILTER_SETTINGS = TEST_SETTINGS.model_copy(update={"JWT_REVOCATION_LOCAL_FILTER": True})
+
+
+@pytest.fixture
+async def synced_mirror():
+    """A started mirror loaded for listener generation 1 from a blacklist holding 'old-jti'."""
+    revocation.start_revocation_sync(FILTER_SETTINGS)
+    with (
+        patch("src.core.redis.pubsub_generation", return_value=1),
+        patch("src.core.redis.scan_keys_with_ttl", new=AsyncMock(return_value={"jwt:bl:old-jti": 600})),
+    ):
+        await revocation._reload(1)
+        yield
+    await revocation.stop_revocation_sync()
+    from src.core import redis as redis_store
+
+    redis_store._subscribers.clear()
+    redis_store._connect_hooks.clear()
+
+
+async def test_synced_mirror_answers_without_redis(synced_mirror):
+    with patch("src.core.redis.is_jti_blacklisted", new=AsyncMock(side_effect=AssertionError("redis hit"))):
+        assert await revocation.is_revoked("old-jti") is True
+        assert await revocation.is_revoked("live-jti") is False
+
+
+async def test_revocations_from_other_workers_are_applied(synced_mirror):
+    revocation._on_revoked(f"new-jti {time.time() + 60}")
+    revocation._on_revoked(f"expired-jti {time.time() - 1}")
+
+    assert await revocation.is_revoked("new-jti") is True
+    assert await revocation.is_revoked("expired-jti") is False
+
+
+async def test_revoke_blacklists_in_redis_and_publishes(synced_mirror):
+    publish = AsyncMock()
+    with (
+        patch("src.core.redis.publish", new=publish),
+        patch("src.core.redis.blacklist_jti", new=AsyncMock()) as blacklist,
+    ):
+        await revocation.revoke("gone-jti", ttl=120)
+
+    blacklist.assert_awaited_once_with("gone-jti", ttl=120)
+    channel, message = publish.await_args.args
+    assert channel == "jwt:revoked"
+    assert message.startswith("gone-jti ")
+    assert await revocation.is_revoked("gone-jti") is True
+
+
+async def test_reconnected_listener_falls_back_to_redis_until_reloaded(synced_mirror):
+    blacklisted = AsyncMock(return_value=True)
+    with (
+        patch("src.core.redis.pubsub_generation", return_value=2),
+        patch("src.core.redis.is_jti_blacklisted", new=blacklisted),
+    ):
+        assert await revocation.is_revoked("live-jti") is True
+
+    blacklisted.assert_awaited_once_with("live-jti")
+
+
+async def test_due_resync_falls_back_to_redis(synced_mirror):
+    revocation._loaded_at -= FILTER_SETTINGS.JWT_REVOCATION_RESYNC_SECONDS + 1
+    blacklisted = AsyncMock(return_value=False)
+    with (
+        patch("src.core.redis.pubsub_generation", return_value=1),
+        patch("src.core.redis.is_jti_blacklisted", new=blacklisted),
+        patch("src.core.redis.scan_keys_with_ttl", new=AsyncMock(return_value={})),
+    ):
+        assert await revocation.is_revoked("old-jti") is False
+        await revocation._reload_task
+        assert revocation.is_synced()
+
+    blacklisted.assert_awaited_once()
+
+
+async def test_disabled_filter_always_asks_redis():
+    blacklisted = AsyncMock(return_value=False)
+    with patch("src.core.redis.is_jti_blacklisted", new=blacklisted):
+        assert await revocation.is_revoked("any") is False
+
+    blacklisted.assert_awaited_once_with("any")
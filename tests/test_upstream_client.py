@@ -0,0 +1,719 @@
+"""Tests for the shared upstream client and its resilience layers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+import src.services.main_app as main_app
+from src.core.jwt import create_jwt
+from src.services.main_app import (
+    call_main_app,
+    get_coalescing_stats,
+    get_pool_stats,
+    get_retry_stats,
+    get_revalidation_stats,
+)
+from src.services.retry import RetryBudget, backoff_delay
+from src.services.singleflight import SingleFlight
+from tests.conftest import TEST_SETTINGS
+
+
+# ---------------------------------------------------------------------------
+# Shared pooled client
+# ---------------------------------------------------------------------------
+
+
+def test_lifespan_opens_and_closes_shared_client(client):
+    shared = main_app._http_client
+    assert isinstance(shared, httpx.AsyncClient)
+    assert get_pool_stats()["shared_client"] is True
+    assert get_pool_stats()["max_connections"] == TEST_SETTINGS.MAIN_APP_MAX_CONNECTIONS
+
+
+def test_shared_client_is_closed_after_shutdown():
+    from src.main import app
+
+    with patch("src.main.get_settings", return_value=TEST_SETTINGS):
+        with TestClient(app):
+            shared = main_app._http_client
+    assert shared is not None and shared.is_closed
+    assert main_app._http_client is None
+
+
+@respx.mock
+def test_shared_client_is_reused_across_calls(client):
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    shared = main_app._http_client
+    headers = {"Authorization": f"Bearer {create_jwt(user_id=5, sanctum_token='tok')}"}
+    client.get("/pets", headers=headers)
+    client.get("/pets?name=x", headers=headers)
+
+    assert route.call_count >= 1
+    assert main_app._http_client is shared
+
+
+@respx.mock
+async def test_pool_stats_track_requests_and_timeouts():
+    respx.get("http://test-main-app/api/ok").mock(return_value=httpx.Response(200, json={}))
+    respx.post("http://test-main-app/api/pool").mock(side_effect=httpx.PoolTimeout("pool full"))
+    before = get_pool_stats()
+
+    await call_main_app(method="GET", path="/api/ok", settings=TEST_SETTINGS)
+    with pytest.raises(main_app.MainAppError) as exc_info:
+        await call_main_app(method="POST", path="/api/pool", settings=TEST_SETTINGS)
+    assert exc_info.value.status_code == 502
+
+    after = get_pool_stats()
+    assert after["requests"] >= before["requests"] + 2
+    assert after["pool_timeouts"] == before["pool_timeouts"] + 1
+    assert after["in_flight"] == 0
+
+
+# ---------------------------------------------------------------------------
+# GET coalescing
+# ---------------------------------------------------------------------------
+
+
+def _slow_response(payload):
+    async def responder(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=payload)
+
+    return responder
+
+
+@respx.mock
+async def test_concurrent_identical_gets_share_one_upstream_request():
+    route = respx.get("http://test-main-app/api/my-pets").mock(side_effect=_slow_response([{"id": 1}]))
+    before = get_coalescing_stats()
+
+    results = await asyncio.gather(
+        *[
+            call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="tok")
+            for _ in range(5)
+        ]
+    )
+
+    assert route.call_count == 1
+    assert all(result == [{"id": 1}] for result in results)
+    after = get_coalescing_stats()
+    assert after["coalesced"] - before["coalesced"] == 4
+    assert after["in_flight"] == 0
+
+
+@respx.mock
+async def test_gets_for_different_tokens_or_params_are_not_coalesced():
+    route = respx.get("http://test-main-app/api/my-pets").mock(side_effect=_slow_response([]))
+
+    await asyncio.gather(
+        call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="a"),
+        call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="b"),
+        call_main_app(
+            method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="a", params={"page": 2}
+        ),
+    )
+
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_writes_are_never_coalesced():
+    route = respx.post("http://test-main-app/api/pets").mock(side_effect=_slow_response({"id": 1}))
+
+    await asyncio.gather(
+        *[
+            call_main_app(
+                method="POST", path="/api/pets", settings=TEST_SETTINGS, sanctum_token="tok", json_data={}
+            )
+            for _ in range(3)
+        ]
+    )
+
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_coalesced_callers_all_receive_upstream_error():
+    async def failing(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(404, json={"message": "Pet not found"})
+
+    route = respx.get("http://test-main-app/api/pets/9").mock(side_effect=failing)
+
+    results = await asyncio.gather(
+        *[
+            call_main_app(method="GET", path="/api/pets/9", settings=TEST_SETTINGS, sanctum_token="tok")
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    assert route.call_count == 1
+    assert all(isinstance(result, main_app.MainAppError) for result in results)
+    assert all(result.status_code == 404 for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    assert flight.in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# Retries for idempotent reads
+# ---------------------------------------------------------------------------
+
+
+def test_backoff_delay_is_bounded_by_exponential_cap():
+    for attempt in range(6):
+        delay = backoff_delay(attempt, base=0.2, cap=1.0)
+        assert 0.0 <= delay <= min(1.0, 0.2 * 2**attempt)
+
+
+def test_retry_budget_limits_retries_to_deposits():
+    budget = RetryBudget(ratio=0.5, max_tokens=1.0)
+    assert budget.try_withdraw() is True
+    assert budget.try_withdraw() is False
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw() is True
+    assert budget.exhausted == 1
+
+
+@respx.mock
+async def test_get_is_retried_after_transient_503():
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        side_effect=[
+            httpx.Response(503, json={"message": "Maintenance"}),
+            httpx.ConnectError("reset"),
+            httpx.Response(200, json=[{"id": 1}]),
+        ]
+    )
+
+    result = await call_main_app(
+        method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="tok"
+    )
+
+    assert result == [{"id": 1}]
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_get_gives_up_after_max_attempts():
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(502, json={"message": "Bad gateway"})
+    )
+
+    with pytest.raises(main_app.MainAppError) as exc_info:
+        await call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="tok")
+
+    assert exc_info.value.payload["error"] == "UPSTREAM_ERROR"
+    assert route.call_count == TEST_SETTINGS.MAIN_APP_RETRY_ATTEMPTS + 1
+
+
+@respx.mock
+async def test_writes_are_not_retried():
+    route = respx.post("http://test-main-app/api/pets").mock(
+        return_value=httpx.Response(503, json={"message": "Maintenance"})
+    )
+
+    with pytest.raises(main_app.MainAppError):
+        await call_main_app(method="POST", path="/api/pets", settings=TEST_SETTINGS, json_data={})
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_non_transient_errors_are_not_retried():
+    route = respx.get("http://test-main-app/api/pets/1").mock(
+        return_value=httpx.Response(404, json={"message": "Not found"})
+    )
+
+    with pytest.raises(main_app.MainAppError):
+        await call_main_app(method="GET", path="/api/pets/1", settings=TEST_SETTINGS, sanctum_token="tok")
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_upstream_retry_after_is_honoured():
+    respx.get("http://test-main-app/api/my-pets").mock(
+        side_effect=[
+            httpx.Response(429, json={"message": "Slow down", "data": {"retry_after": 1}}),
+            httpx.Response(200, json=[]),
+        ]
+    )
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    with patch("src.services.main_app.asyncio.sleep", side_effect=fake_sleep):
+        await call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="tok")
+
+    assert sleeps == [1.0]
+
+
+@respx.mock
+async def test_long_retry_after_is_returned_instead_of_waiting():
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(429, json={"message": "Quota", "data": {"retry_after": 3600}})
+    )
+
+    with pytest.raises(main_app.MainAppError) as exc_info:
+        await call_main_app(method="GET", path="/api/my-pets", settings=TEST_SETTINGS, sanctum_token="tok")
+
+    assert exc_info.value.status_code == 429
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_exhausted_retry_budget_stops_retries():
+    settings = TEST_SETTINGS.model_copy(
+        update={"MAIN_APP_RETRY_BUDGET_MAX_TOKENS": 1.0, "MAIN_APP_RETRY_BUDGET_RATIO": 0.0}
+    )
+    route = respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(503, json={"message": "Maintenance"})
+    )
+
+    for _ in range(2):
+        with pytest.raises(main_app.MainAppError):
+            await call_main_app(method="GET", path="/api/my-pets", settings=settings, sanctum_token="tok")
+
+    # First call: 1 attempt + 1 budgeted retry. Second call: budget empty, no retry.
+    assert route.call_count == 3
+    assert get_retry_stats()["exhausted"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Conditional GETs
+# ---------------------------------------------------------------------------
+
+
+@respx.mock
+async def test_etag_is_sent_on_repeat_read_and_304_serves_cached_body():
+    seen_headers: list[httpx.Headers] = []
+
+    def responder(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": 7, "weight_kg": 4.2}], headers={"ETag": '"v1"'})
+
+    respx.get("http://test-main-app/api/pets/1/weights").mock(side_effect=responder)
+
+    first = await call_main_app(method="GET", path="/api/pets/1/weights", settings=TEST_SETTINGS, sanctum_token="tok")
+    status, second = await call_main_app(
+        method="GET", path="/api/pets/1/weights", settings=TEST_SETTINGS, sanctum_token="tok", return_status=True
+    )
+
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert first == second == [{"id": 7, "weight_kg": 4.2}]
+    assert status == 200
+    assert get_revalidation_stats()["not_modified"] >= 1
+
+
+@respx.mock
+async def test_last_modified_is_revalidated_and_replaced_when_changed():
+    seen_headers: list[httpx.Headers] = []
+    responses = [
+        httpx.Response(200, json=[{"id": 1}], headers={"Last-Modified": "Mon, 02 Mar 2026 10:00:00 GMT"}),
+        httpx.Response(200, json=[{"id": 1}, {"id": 2}], headers={"Last-Modified": "Tue, 03 Mar 2026 10:00:00 GMT"}),
+    ]
+
+    def responder(request):
+        seen_headers.append(request.headers)
+        return responses[len(seen_headers) - 1]
+
+    respx.get("http://test-main-app/api/pets/1/vaccinations").mock(side_effect=responder)
+
+    await call_main_app(method="GET", path="/api/pets/1/vaccinations", settings=TEST_SETTINGS, sanctum_token="tok")
+    second = await call_main_app(
+        method="GET", path="/api/pets/1/vaccinations", settings=TEST_SETTINGS, sanctum_token="tok"
+    )
+
+    assert seen_headers[1]["If-Modified-Since"] == "Mon, 02 Mar 2026 10:00:00 GMT"
+    assert second == [{"id": 1}, {"id": 2}]
+
+
+@respx.mock
+async def test_validators_are_not_shared_between_users():
+    seen_headers: list[httpx.Headers] = []
+
+    def responder(request):
+        seen_headers.append(request.headers)
+        return httpx.Response(200, json=[], headers={"ETag": '"v1"'})
+
+    respx.get("http://test-main-app/api/pets/1/weights").mock(side_effect=responder)
+
+    await call_main_app(method="GET", path="/api/pets/1/weights", settings=TEST_SETTINGS, sanctum_token="a")
+    await call_main_app(method="GET", path="/api/pets/1/weights", settings=TEST_SETTINGS, sanctum_token="b")
+
+    assert "If-None-Match" not in seen_headers[1]
+
+
+# ---------------------------------------------------------------------------
+# Laravel pagination
+# ---------------------------------------------------------------------------
+
+
+def _laravel_page(items: list[dict], page: int, last_page: int) -> dict:
+    return {
+        "data": items,
+        "links": {"next": f"http://test-main-app/api/my-pets?page={page + 1}" if page < last_page else None},
+        "meta": {"current_page": page, "last_page": last_page, "per_page": 2},
+    }
+
+
+async def _collect(**kwargs) -> list[dict]:
+    return [item async for item in main_app.iter_main_app_list(settings=TEST_SETTINGS, sanctum_token="tok", **kwargs)]
+
+
+@respx.mock
+async def test_list_iterator_fetches_remaining_pages_in_order():
+    route = respx.get("http://test-main-app/api/my-pets")
+    route.side_effect = lambda request: httpx.Response(
+        200,
+        json=_laravel_page(
+            [{"id": int(request.url.params.get("page", "1"))}],
+            int(request.url.params.get("page", "1")),
+            3,
+        ),
+    )
+
+    items = await _collect(path="/api/my-pets")
+
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert sorted(call.request.url.params.get("page") for call in route.calls[1:]) == ["2", "3"]
+
+
+@respx.mock
+async def test_list_iterator_follows_simple_pagination_links():
+    respx.get("http://test-main-app/api/my-pets", params={"page": "2"}).mock(
+        return_value=httpx.Response(
+            200, json={"data": [{"id": 2}], "current_page": 2, "next_page_url": None}
+        )
+    )
+    respx.get("http://test-main-app/api/my-pets").mock(
+        return_value=httpx.Response(
+            200,
+            json={"data": [{"id": 1}], "current_page": 1, "next_page_url": "http://test-main-app/api/my-pets?page=2"},
+        )
+    )
+
+    assert [item["id"] for item in await _collect(path="/api/my-pets")] == [1, 2]
+
+
+@respx.mock
+async def test_list_iterator_reads_unpaginated_lists_once():
+    route = respx.get("http://test-main-app/api/pets/1/weights").mock(
+        return_value=httpx.Response(200, json={"data": [{"id": 1}, "junk", {"id": 2}]})
+    )
+
+    assert [item["id"] for item in await _collect(path="/api/pets/1/weights")] == [1, 2]
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_list_iterator_stops_at_max_pages():
+    route = respx.get("http://test-main-app/api/my-pets")
+    route.side_effect = lambda request: httpx.Response(
+        200,
+        json=_laravel_page([{"id": 0}], int(request.url.params.get("page", "1")), 500),
+    )
+    settings = TEST_SETTINGS.model_copy(update={"MAIN_APP_MAX_PAGES": 3})
+
+    items = [
+        item async for item in main_app.iter_main_app_list(path="/api/my-pets", settings=settings)
+    ]
+
+    assert len(items) == 3
+    assert route.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Pet types snapshot
+# ---------------------------------------------------------------------------
+
+
+@respx.mock
+async def test_pet_types_refresh_swaps_in_new_immutable_snapshot():
+    respx.get("http://test-main-app/api/pet-types").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": 1, "name": "Cat"}]),
+            httpx.Response(200, json=[{"id": 1, "name": "Cat"}, {"id": 2, "name": "Dog"}]),
+        ]
+    )
+
+    await main_app.refresh_pet_types_cache(TEST_SETTINGS)
+    first = main_app.get_pet_types()
+    assert main_app.get_pet_types_by_name() is first.by_name
+    with pytest.raises(TypeError):
+        first.by_name["dog"] = 2  # type: ignore[index]
+
+    await main_app.refresh_pet_types_cache(TEST_SETTINGS)
+    second = main_app.get_pet_types()
+
+    assert second.version == first.version + 1
+    assert dict(first.by_id) == {1: "cat"}
+    assert dict(second.by_name) == {"cat": 1, "dog": 2}
+
+
+@respx.mock
+async def test_concurrent_pet_types_reloads_share_one_request():
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+
+    route = respx.get("http://test-main-app/api/pet-types").mock(side_effect=slow)
+
+    snapshots = await asyncio.gather(*(main_app.ensure_pet_types(TEST_SETTINGS) for _ in range(10)))
+
+    assert route.call_count == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+@respx.mock
+async def test_unknown_species_refreshes_once_per_interval():
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": 1, "name": "Cat"}]),
+            httpx.Response(200, json=[{"id": 1, "name": "Cat"}, {"id": 2, "name": "Ferret"}]),
+        ]
+    )
+
+    assert await main_app.resolve_pet_type_id("Ferret", TEST_SETTINGS) == 2
+    assert route.call_count == 2
+
+    with pytest.raises(ValueError):
+        await main_app.resolve_pet_type_id("Dragon", TEST_SETTINGS)
+    # The reload on a miss is rate limited, so no third request was attempted.
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_pet_types_refresher_reloads_in_background():
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+    settings = TEST_SETTINGS.model_copy(update={"PET_TYPES_REFRESH_SECONDS": 0.01})
+
+    main_app.start_pet_types_refresher(settings)
+    try:
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if route.call_count:
+                break
+    finally:
+        await main_app.stop_pet_types_refresher()
+
+    assert route.call_count >= 1
+    assert main_app.get_pet_types_by_name() == {"cat": 1}
+
+
+@respx.mock
+async def test_unchanged_pet_types_keep_their_snapshot():
+    respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+
+    first = await main_app.refresh_pet_types_cache(TEST_SETTINGS)
+    second = await main_app.refresh_pet_types_cache(TEST_SETTINGS)
+
+    assert second is first
+
+
+@respx.mock
+async def test_empty_or_malformed_pet_types_do_not_replace_the_table():
+    respx.get("http://test-main-app/api/pet-types").mock(
+        side_effect=[
+            httpx.Response(200, json=[{"id": 1, "name": "Cat"}]),
+            httpx.Response(200, json=[]),
+            httpx.Response(200, json="maintenance"),
+        ]
+    )
+
+    first = await main_app.refresh_pet_types_cache(TEST_SETTINGS)
+    assert await main_app.refresh_pet_types_cache(TEST_SETTINGS) is first
+    assert await main_app.refresh_pet_types_cache(TEST_SETTINGS) is first
+    assert dict(main_app.get_pet_types_by_name()) == {"cat": 1}
+
+
+@respx.mock
+async def test_pet_types_refresher_survives_unexpected_errors():
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+    settings = TEST_SETTINGS.model_copy(update={"PET_TYPES_REFRESH_SECONDS": 0.01})
+    calls = 0
+    real_refresh = main_app.refresh_pet_types_cache
+
+    async def flaky(settings, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise AttributeError("'str' object has no attribute 'get'")
+        return await real_refresh(settings, **kwargs)
+
+    with patch.object(main_app, "refresh_pet_types_cache", new=flaky):
+        main_app.start_pet_types_refresher(settings)
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if route.call_count:
+                    break
+        finally:
+            await main_app.stop_pet_types_refresher()
+
+    assert calls >= 2
+    assert main_app.get_pet_types_by_name() == {"cat": 1}
+
+
+SHARED_SETTINGS = TEST_SETTINGS.model_copy(update={"PET_TYPES_SHARED_CACHE": True})
+
+
+@pytest.fixture
+def shared_redis():
+    store: dict[str, str] = {}
+    published: list[tuple[str, str]] = []
+
+    async def set_with_ttl(key: str, value: str, ttl: int) -> None:
+        store[key] = value
+
+    async def get(key: str) -> str | None:
+        return store.get(key)
+
+    async def incr(key: str) -> int:
+        store[key] = str(int(store.get(key, "0")) + 1)
+        return int(store[key])
+
+    async def publish(channel: str, message: str) -> None:
+        published.append((channel, message))
+
+    with (
+        patch("src.core.redis.set_with_ttl", new=set_with_ttl),
+        patch("src.core.redis.get", new=get),
+        patch("src.core.redis.incr", new=incr),
+        patch("src.core.redis.publish", new=publish),
+    ):
+        yield store, published
+
+
+@respx.mock
+async def test_upstream_pet_types_are_shared_through_redis(shared_redis):
+    store, published = shared_redis
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+
+    await main_app.refresh_pet_types_cache(SHARED_SETTINGS)
+    assert published == [("pet_types:updated", "1")]
+
+    # A cold worker starts from Redis without asking the main app.
+    main_app.clear_pet_types_cache()
+    snapshot = await main_app.ensure_pet_types(SHARED_SETTINGS)
+
+    assert dict(snapshot.by_name) == {"cat": 1}
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_newer_published_version_reloads_from_redis(shared_redis):
+    store, _ = shared_redis
+    respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+    await main_app.refresh_pet_types_cache(SHARED_SETTINGS)
+
+    # Another worker stored version 2.
+    store["pet_types:table"] = '{"version": 2, "items": [{"id": 1, "name": "cat"}, {"id": 2, "name": "dog"}]}'
+    main_app._on_pet_types_published("1")  # own, already applied
+    main_app._on_pet_types_published("2")
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert dict(main_app.get_pet_types_by_name()) == {"cat": 1, "dog": 2}
+
+
+@respx.mock
+async def test_published_version_never_reloads_from_main_app(shared_redis):
+    store, published = shared_redis
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+    await main_app.refresh_pet_types_cache(SHARED_SETTINGS)
+
+    # Version 2 was announced but its table is gone (expired or evicted).
+    del store["pet_types:table"]
+    main_app._on_pet_types_published("2")
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert route.call_count == 1
+    assert published == [("pet_types:updated", "1")]
+    assert dict(main_app.get_pet_types_by_name()) == {"cat": 1}
+
+
+@respx.mock
+async def test_empty_pet_types_are_not_shared(shared_redis):
+    store, published = shared_redis
+    respx.get("http://test-main-app/api/pet-types").mock(return_value=httpx.Response(200, json=[]))
+
+    await main_app.refresh_pet_types_cache(SHARED_SETTINGS)
+
+    assert "pet_types:table" not in store
+    assert published == []
+
+
+@respx.mock
+async def test_slow_redis_does_not_hold_up_pet_types_reload():
+    respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(3600)
+
+    with (
+        patch.object(main_app, "_PET_TYPES_SHARED_TIMEOUT_SECONDS", 0.01),
+        patch("src.core.redis.incr", new=hang),
+    ):
+        snapshot = await asyncio.wait_for(main_app.refresh_pet_types_cache(SHARED_SETTINGS), 1.0)
+
+    assert dict(snapshot.by_name) == {"cat": 1}
+
+
+@respx.mock
+async def test_pet_types_fall_back_to_main_app_when_redis_is_down():
+    route = respx.get("http://test-main-app/api/pet-types").mock(
+        return_value=httpx.Response(200, json=[{"id": 1, "name": "Cat"}])
+    )
+    broken = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    with (
+        patch("src.core.redis.get", new=broken),
+        patch("src.core.redis.incr", new=broken),
+    ):
+        snapshot = await main_app.ensure_pet_types(SHARED_SETTINGS)
+
+    assert dict(snapshot.by_name) == {"cat": 1}
+    assert route.call_count == 1